@@ -9,6 +9,11 @@ class HTTPException(Exception):
     status_code: int
     detail: dict
 
+    def __reduce__(self) -> tuple:
+        # Exceptions pickle through ``args``, which the dataclass init leaves empty;
+        # rebuild from the fields so errors survive the trip back from pool workers.
+        return (type(self), (self.status_code, self.detail))
+
 
 def http_error(code: str, message: str, hint: str, *, status_code: int = 400) -> HTTPException:
     """Return a structured HTTP exception following the API contract."""
@@ -0,0 +1,34 @@
+"""HTTP caching helpers shared by the read-mostly endpoints."""
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+def content_etag(body: bytes) -> str:
+    """Return a strong ETag for ``body``."""
+
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Apply the If-None-Match comparison from RFC 9110 (weak, list or ``*``)."""
+
+    if not if_none_match:
+        return False
+    candidates = [item.strip() for item in if_none_match.split(",")]
+    return "*" in candidates or etag in (item.removeprefix("W/") for item in candidates)
+
+
+@dataclass
+class BytesResponse:
+    """Pre-rendered response body, mirroring FastAPI's ``Response`` arguments."""
+
+    content: bytes
+    media_type: str = "application/json"
+    headers: dict = field(default_factory=dict)
+    status_code: int = 200
+
+
+__all__ = ["BytesResponse", "content_etag", "etag_matches"]
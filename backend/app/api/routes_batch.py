@@ -0,0 +1,160 @@
+"""Batch planning endpoint for running many plan requests at once."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterable, Optional, Sequence
+
+from ..api.errors import HTTPException
+from ..domain.calendar_builder import CalendarConfig, get_day_grid
+from ..domain.candidates import CandidateConfig, CandidateConstraints, generate_candidates
+from ..domain.models import CompactWindow
+from ..domain.selection import SelectionConfig
+from .routes_plan import (
+    PlanRequest,
+    PlanResponse,
+    cached_plan,
+    plan_cache_key,
+    plan_executor,
+    plan_stages,
+    respond_with_plans,
+    store_plan,
+)
+
+router = object()
+
+BATCH_CHUNK_SIZE = 32
+
+
+@dataclass
+class BatchResult:
+    """Outcome for one request of a batch: a response or a structured error."""
+
+    index: int
+    response: Optional[PlanResponse] = None
+    error: Optional[dict] = None
+
+    def model_dump(self) -> dict:
+        return {
+            "index": self.index,
+            "response": self.response.model_dump() if self.response else None,
+            "error": self.error,
+        }
+
+
+def error_detail(exc: Exception) -> dict:
+    """Translate a planning failure into the API's error body."""
+
+    if isinstance(exc, HTTPException):
+        return exc.detail
+    if isinstance(exc, TimeoutError):
+        return {
+            "error": {
+                "code": "PLAN_TIMEOUT",
+                "message": "Plan computation took too long",
+                "hint": "Reduce blocks_max or use the beam strategy",
+            }
+        }
+    return {"error": {"code": "INVALID_INPUT", "message": str(exc), "hint": "Check the request fields"}}
+
+
+def plan_chunk(
+    candidates: Sequence[CompactWindow],
+    jobs: Sequence[tuple[PlanRequest, SelectionConfig]],
+) -> list[PlanResponse | dict]:
+    """Select plans for requests sharing one candidate set; failures become error bodies."""
+
+    outcomes: list[PlanResponse | dict] = []
+    for request, config in jobs:
+        try:
+            outcomes.append(respond_with_plans(request, candidates, config))
+        except Exception as exc:  # noqa: BLE001 - reported per request
+            outcomes.append(error_detail(exc))
+    return outcomes
+
+
+async def compute_plans_batch(
+    requests: Iterable[PlanRequest],
+    chunk_size: int | None = BATCH_CHUNK_SIZE,
+) -> AsyncIterator[BatchResult]:
+    """Plan every request, yielding one ``BatchResult`` per request in input order.
+
+    Requests are grouped by calendar and candidate constraints so each calendar and
+    candidate set is built once, on a worker thread; identical requests are computed
+    once. Selection runs in chunks on the plan executor's workers; ``chunk_size=None``
+    splits each group into one chunk per worker, so a group's candidates are sent to
+    each worker once while its requests still run concurrently. A failing request,
+    or a failing candidate group, only produces error results for its own requests.
+    """
+
+    requests = list(requests)
+    loop = asyncio.get_running_loop()
+    outcomes: list[asyncio.Future[BatchResult]] = [loop.create_future() for _ in requests]
+    # Candidate group -> (canonical key, time budget) -> (request, selection config, input indices)
+    groups: dict[tuple, dict[tuple, tuple[PlanRequest, SelectionConfig, list[int]]]] = {}
+
+    for index, request in enumerate(requests):
+        try:
+            key = plan_cache_key(request)
+            cached = cached_plan(key)
+            if cached is not None:
+                outcomes[index].set_result(BatchResult(index, cached.for_request(request.to_dict())))
+                continue
+            stages = plan_stages(request)
+        except Exception as exc:  # noqa: BLE001 - reported per request
+            outcomes[index].set_result(BatchResult(index, error=error_detail(exc)))
+            continue
+        group = groups.setdefault((stages.calendar, stages.constraints), {})
+        group.setdefault((key, request.time_budget_ms), (request, stages.selection, []))[2].append(index)
+
+    def fail(indices: Iterable[int], detail: dict) -> None:
+        for index in indices:
+            outcomes[index].set_result(BatchResult(index, error=detail))
+
+    async def run_chunk(candidates: list[CompactWindow], entries: list) -> None:
+        jobs = [(request, config) for _key, (request, config, _indices) in entries]
+        executor = plan_executor()
+        # The configured timeout is per request; a chunk gets that much time per job.
+        timeout = None if executor.timeout is None else executor.timeout * len(jobs)
+        try:
+            results: list[PlanResponse | dict] = await executor.run(plan_chunk, candidates, jobs, timeout=timeout)
+        except Exception as exc:  # noqa: BLE001 - the whole chunk failed
+            results = [error_detail(exc)] * len(jobs)
+        for ((key, _budget), (_request, _config, indices)), result in zip(entries, results):
+            if not isinstance(result, PlanResponse):
+                fail(indices, result)
+                continue
+            store_plan(key, result)
+            for index in indices:
+                outcomes[index].set_result(BatchResult(index, result.for_request(requests[index].to_dict())))
+
+    def build_candidates(calendar: CalendarConfig, constraints: CandidateConstraints) -> list[CompactWindow]:
+        return generate_candidates(get_day_grid(calendar), CandidateConfig(constraints=constraints))
+
+    async def run_group(calendar: CalendarConfig, constraints: CandidateConstraints, entries: list) -> None:
+        # Calendar and candidate building are CPU bound; keep them off the event loop.
+        try:
+            candidates = await asyncio.to_thread(build_candidates, calendar, constraints)
+        except Exception as exc:  # noqa: BLE001 - only this group's requests fail
+            detail = error_detail(exc)
+            fail((index for _key, (_request, _config, indices) in entries for index in indices), detail)
+            return
+        size = chunk_size or -(-len(entries) // max(1, plan_executor().max_workers))
+        await asyncio.gather(
+            *(run_chunk(candidates, entries[start : start + size]) for start in range(0, len(entries), size))
+        )
+
+    tasks = [
+        asyncio.ensure_future(run_group(calendar, constraints, list(group.items())))
+        for (calendar, constraints), group in groups.items()
+    ]
+
+    try:
+        for outcome in outcomes:
+            yield await outcome
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+__all__ = ["BatchResult", "compute_plans_batch", "error_detail", "plan_chunk"]
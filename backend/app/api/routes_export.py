@@ -2,25 +2,58 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List
+from datetime import datetime
+from typing import Iterator, List, Optional
 
 from ..domain.models import PlanBlock
-from ..services.ics_export import build_ics_document
+from ..services.ics_export import feed_etag, iter_ics_document
+from .http_cache import etag_matches
 
 router = object()
 
+ICS_MEDIA_TYPE = "text/calendar; charset=utf-8"
+
 
 @dataclass
 class ExportRequest:
     timezone: str
     title: str
     blocks: List[PlanBlock] = field(default_factory=list)
+    # Setting the plan version turns the export into a deterministic, cacheable feed.
+    version: Optional[datetime] = None
+    if_none_match: Optional[str] = None
+
+
+@dataclass
+class StreamingExport:
+    """Chunked response body, mirroring FastAPI's ``StreamingResponse`` arguments."""
+
+    content: Iterator[bytes]
+    media_type: str = ICS_MEDIA_TYPE
+    headers: dict = field(default_factory=dict)
+    status_code: int = 200
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self.content
+
 
+def export_ics(request: ExportRequest) -> StreamingExport:
+    """Stream an ICS document for the provided blocks.
 
-def export_ics(request: ExportRequest) -> bytes:
-    """Return an ICS document for the provided blocks."""
+    In feed mode the response carries a strong ETag, and a matching If-None-Match
+    yields an empty 304 without rendering anything.
+    """
 
-    return build_ics_document(request.title, request.timezone, request.blocks)
+    headers = {"Content-Disposition": 'attachment; filename="max-days-off.ics"'}
+    if request.version is not None:
+        etag = feed_etag(request.title, request.timezone, request.blocks, request.version)
+        headers = {**headers, "ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(request.if_none_match, etag):
+            return StreamingExport(content=iter(()), headers=headers, status_code=304)
+    return StreamingExport(
+        content=iter_ics_document(request.title, request.timezone, request.blocks, version=request.version),
+        headers=headers,
+    )
 
 
-__all__ = ["ExportRequest", "export_ics"]
+__all__ = ["ExportRequest", "StreamingExport", "export_ics"]
@@ -1,21 +1,32 @@
 """Holiday endpoint implementation."""
 from __future__ import annotations
 
+import json
+from dataclasses import dataclass
 from typing import Optional
 
+from ..core.cache import CacheStats, LRUCache
 from ..core.locale import LocaleRequest
-from ..domain.holiday_provider import get_holidays
+from ..domain.holiday_provider import get_holidays, holiday_data_version
 from ..domain.models import HolidayModel
+from .http_cache import BytesResponse, content_etag, etag_matches
 
 router = object()
 
+HOLIDAY_PAYLOAD_CACHE_SIZE = 512
+# Holiday lists only change with a data refresh, which changes the ETag too.
+HOLIDAY_CACHE_CONTROL = "public, max-age=86400, s-maxage=604800, stale-while-revalidate=86400"
 
-def list_holidays(
-    year: int,
-    country: str,
-    region: Optional[str] = None,
-    timezone: Optional[str] = None,
-) -> dict:
+
+@dataclass(frozen=True)
+class HolidayPayload:
+    """Serialized ``list_holidays`` body and its strong ETag."""
+
+    body: bytes
+    etag: str
+
+
+def build_holiday_payload(year: int, country: str, region: Optional[str], timezone: Optional[str]) -> dict:
     """Return the observed holidays for the requested locale."""
 
     locale = LocaleRequest(country=country, region=region).normalize()
@@ -33,4 +44,56 @@ def list_holidays(
     }
 
 
-__all__ = ["list_holidays"]
+def _serialize(year: int, country: str, region: Optional[str], timezone: Optional[str]) -> HolidayPayload:
+    body = json.dumps(build_holiday_payload(year, country, region, timezone)).encode("utf-8")
+    return HolidayPayload(body=body, etag=content_etag(body))
+
+
+_payload_store: LRUCache[tuple, HolidayPayload] = LRUCache(HOLIDAY_PAYLOAD_CACHE_SIZE)
+
+
+def holiday_payload(
+    year: int,
+    country: str,
+    region: Optional[str] = None,
+    timezone: Optional[str] = None,
+) -> HolidayPayload:
+    """Return the stored payload for a locale, serializing it on first use."""
+
+    locale = LocaleRequest(country=country, region=region).normalize()
+    key = (year, locale.country, locale.region, timezone, holiday_data_version())
+    return _payload_store.get_or_create(key, lambda: _serialize(year, locale.country, locale.region, timezone))
+
+
+def list_holidays(
+    year: int,
+    country: str,
+    region: Optional[str] = None,
+    timezone: Optional[str] = None,
+    if_none_match: Optional[str] = None,
+) -> BytesResponse:
+    """Return the observed holidays as pre-serialized JSON with cache validators."""
+
+    payload = holiday_payload(year, country, region, timezone)
+    headers = {"ETag": payload.etag, "Cache-Control": HOLIDAY_CACHE_CONTROL}
+    if etag_matches(if_none_match, payload.etag):
+        return BytesResponse(content=b"", headers=headers, status_code=304)
+    return BytesResponse(content=payload.body, headers=headers)
+
+
+def configure_holiday_payloads(maxsize: int) -> None:
+    _payload_store.resize(maxsize)
+
+
+def holiday_payload_stats() -> CacheStats:
+    return _payload_store.stats()
+
+
+__all__ = [
+    "HolidayPayload",
+    "build_holiday_payload",
+    "configure_holiday_payloads",
+    "holiday_payload",
+    "holiday_payload_stats",
+    "list_holidays",
+]
@@ -1,17 +1,44 @@
 """Plan computation endpoint."""
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import hashlib
+import json
+from dataclasses import dataclass, field, replace
 from datetime import date
-from typing import List, Optional, Sequence
+from typing import Awaitable, List, Optional, Sequence
 
 from ..api.errors import http_error
+from ..core.cache import CacheStats, LRUCache, SingleFlight
+from ..core.executor import ProcessExecutor
 from ..core.locale import LocaleRequest
-from ..domain.calendar_builder import CalendarConfig, build_calendar
-from ..domain.candidates import CandidateConfig, CandidateConstraints, generate_candidates
-from ..domain.models import Plan, PlanBlock
+from ..core.metrics import PlanTrace, metrics
+from ..domain.calendar_builder import (
+    CalendarConfig,
+    calendar_store_stats,
+    configure_calendar_store,
+    get_day_grid,
+    parse_prewarm_spec,
+    prewarm_calendars,
+)
+from ..domain.candidates import (
+    BlackoutIndex,
+    CandidateConfig,
+    CandidateConstraints,
+    candidate_cache_stats,
+    configure_candidate_cache,
+    generate_candidates,
+)
+from ..domain.holiday_provider import (
+    configure_holiday_cache,
+    get_holidays,
+    holiday_cache_stats,
+    holiday_data_version,
+    use_holiday_snapshot,
+)
+from ..domain.models import CompactWindow, FrontierStep, Plan, PlanBlock
 from ..domain.scoring import Goal, PlanPreference, PreferenceConfig
-from ..domain.selection import PlanCandidate, SelectionConfig, select_plans
+from ..domain.selection import PlanCandidate, SelectionConfig, SelectionStrategy, search_plans
+from ..services.plan_json import dump_plan_response
 
 router = object()  # placeholder for compatibility with FastAPI pattern
 
@@ -25,6 +52,9 @@ WEEKDAY_MAP = {
     "SUN": 6,
 }
 
+# Longest planning horizon accepted for an explicit start_date..end_date range.
+MAX_HORIZON_DAYS = 3 * 366
+
 
 @dataclass
 class PreferenceInput:
@@ -68,7 +98,8 @@ class ConstraintInput:
 
 @dataclass
 class PlanRequest:
-    year: int
+    # Required unless ``start_date``/``end_date`` give the horizon; ignored when they do.
+    year: Optional[int] = field(default=None, kw_only=True)
     country: str
     region: Optional[str]
     timezone: str
@@ -78,9 +109,20 @@ class PlanRequest:
     goal: str
     prefs: PreferenceInput = field(default_factory=PreferenceInput)
     constraints: ConstraintInput = field(default_factory=ConstraintInput)
+    strategy: str = SelectionStrategy.EXACT.value
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    # Milliseconds selection may search before returning its best plans so far.
+    time_budget_ms: Optional[int] = None
+    # Also return the best plan for every PTO budget up to the available PTO.
+    frontier: bool = False
+    # Adds stage timings and search counters to the response; not part of the plan.
+    debug: bool = False
 
     def __post_init__(self) -> None:
-        if self.year < 1900 or self.year > 2100:
+        if self.year is None and self.start_date is None:
+            raise ValueError("year is required unless start_date and end_date are given")
+        if self.year is not None and (self.year < 1900 or self.year > 2100):
             raise ValueError("year out of supported range")
         if self.blocks_max < 1 or self.blocks_max > 5:
             raise ValueError("blocks_max must be between 1 and 5")
@@ -95,6 +137,30 @@ class PlanRequest:
         self.weekend = sorted(set(normalized))
         if self.goal not in (Goal.MAX_TOTAL.value, Goal.MAX_LONGEST.value):
             raise ValueError("Unknown goal")
+        if self.strategy not in {strategy.value for strategy in SelectionStrategy}:
+            raise ValueError("Unknown selection strategy")
+        if (self.start_date is None) != (self.end_date is None):
+            raise ValueError("start_date and end_date must be given together")
+        horizon = self.horizon()
+        if horizon is not None:
+            start, end = horizon
+            if end < start:
+                raise ValueError("end_date must not precede start_date")
+            if (end - start).days >= MAX_HORIZON_DAYS:
+                raise ValueError("Planning horizon is too long")
+            if start.year < 1900 or end.year > 2100:
+                raise ValueError("horizon out of supported range")
+        if self.time_budget_ms is not None and self.time_budget_ms <= 0:
+            raise ValueError("time_budget_ms must be positive")
+        if self.frontier and (self.time_budget_ms is not None or self.strategy != SelectionStrategy.EXACT.value):
+            raise ValueError("frontier requires the exact strategy and no time_budget_ms")
+
+    def horizon(self) -> Optional[tuple[date, date]]:
+        """Return the explicit planning range, or None to plan the whole ``year``."""
+
+        if self.start_date is None or self.end_date is None:
+            return None
+        return date.fromisoformat(self.start_date), date.fromisoformat(self.end_date)
 
     def weekend_indices(self) -> List[int]:
         return [WEEKDAY_MAP[day] for day in self.weekend]
@@ -122,6 +188,11 @@ class PlanRequest:
             "goal": self.goal,
             "prefs": self.prefs.to_dict(),
             "constraints": self.constraints.to_dict(),
+            "strategy": self.strategy,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "time_budget_ms": self.time_budget_ms,
+            "frontier": self.frontier,
         }
 
 
@@ -130,13 +201,61 @@ class PlanResponse:
     params: dict
     plans: Sequence[Plan]
     alternates: Sequence[Plan]
+    optimal: bool = True
+    # The time budget ran out; the plans are the best found so far.
+    cut_short: bool = False
+    frontier: Optional[List[FrontierStep]] = None
+    debug: Optional[dict] = None
+    trace: Optional[PlanTrace] = field(default=None, repr=False, compare=False)
+    # ``render_json()`` of exactly these fields, kept so a body is encoded only once.
+    body: Optional[bytes] = field(default=None, repr=False, compare=False)
 
     def model_dump(self) -> dict:
-        return {
+        payload = {
             "params": self.params,
             "plans": [plan.to_dict() for plan in self.plans],
             "alternates": [plan.to_dict() for plan in self.alternates],
+            "optimal": self.optimal,
+            "cut_short": self.cut_short,
         }
+        if self.frontier is not None:
+            payload["frontier"] = [step.to_dict() for step in self.frontier]
+        if self.debug is not None:
+            payload["debug"] = self.debug
+        return payload
+
+    def headers(self) -> dict[str, str]:
+        """Return the ``Server-Timing`` header for the request that produced this response."""
+
+        if self.trace is None or not self.trace.stages:
+            return {}
+        return {"Server-Timing": self.trace.server_timing()}
+
+    def render_json(self) -> bytes:
+        """Return ``json.dumps(self.model_dump())`` as bytes, encoded directly."""
+
+        if self.body is not None:
+            return self.body
+        return dump_plan_response(self)
+
+    def for_request(self, params: dict, debug: Optional[dict] = None, trace: Optional[PlanTrace] = None) -> PlanResponse:
+        """Return this response as served to a request, keeping the body if it still matches.
+
+        Plans are copied, so a caller changing its response cannot alter the cached
+        entry or the response shared with coalesced requests.
+        """
+
+        same = params == self.params and debug is None and self.debug is None
+        return replace(
+            self,
+            params=params,
+            plans=[plan.copy() for plan in self.plans],
+            alternates=[plan.copy() for plan in self.alternates],
+            frontier=None if self.frontier is None else [step.copy() for step in self.frontier],
+            debug=debug,
+            trace=trace,
+            body=self.body if same else None,
+        )
 
 
 def build_plan_block(candidate: PlanCandidate, window_index: int) -> PlanBlock:
@@ -161,7 +280,18 @@ def candidate_to_plan(candidate: PlanCandidate) -> Plan:
     return Plan(score=candidate.score, pto_used=candidate.pto_used, blocks=blocks)
 
 
-async def compute_plan(request: PlanRequest) -> PlanResponse:
+@dataclass(frozen=True)
+class PlanStages:
+    """Stage inputs derived from a request: the calendar, candidate filter and search."""
+
+    calendar: CalendarConfig
+    constraints: CandidateConstraints
+    selection: SelectionConfig
+
+
+def plan_stages(request: PlanRequest) -> PlanStages:
+    """Validate ``request`` and translate it into the configuration of each stage."""
+
     locale = LocaleRequest(country=request.country, region=request.region).normalize()
     reserve = request.prefs.reserve_pto or 0
     if reserve > request.pto_total:
@@ -172,52 +302,318 @@ async def compute_plan(request: PlanRequest) -> PlanResponse:
         )
     available_pto = max(0, request.pto_total - reserve)
 
-    calendar = build_calendar(
-        CalendarConfig(
+    horizon = request.horizon()
+    if horizon is None:
+        calendar = CalendarConfig(
             year=request.year,
             weekend_days=request.weekend_indices(),
             country=locale.country,
             region=locale.region,
         )
-    )
-
+    else:
+        calendar = CalendarConfig.for_range(
+            *horizon,
+            weekend_days=request.weekend_indices(),
+            country=locale.country,
+            region=locale.region,
+        )
+    calendar = calendar.canonical()
     candidate_constraints = CandidateConstraints(
         blackout_ranges=request.blackout_ranges(),
         min_block_len=request.constraints.min_block_len,
         max_block_len=request.constraints.max_block_len,
     )
-    candidates = generate_candidates(
-        calendar,
-        CandidateConfig(constraints=candidate_constraints),
-    )
-
-    if not candidates:
-        return PlanResponse(params=request.to_dict(), plans=[], alternates=[])
-
     preference = PreferenceConfig(
         penalty_lambda=0.25,
         prefer_months=frozenset(request.prefs.prefer_months),
         avoid_months=frozenset(request.prefs.avoid_months),
     )
     plan_pref = PlanPreference(goal=Goal(request.goal), season_spread=request.prefs.season_spread)
-    selection = select_plans(
-        candidates,
-        SelectionConfig(
-            budget=available_pto,
-            blocks_max=request.blocks_max,
-            top_k=5,
-            prefs=preference,
-            plan_prefs=plan_pref,
-        ),
+    selection = SelectionConfig(
+        budget=available_pto,
+        blocks_max=request.blocks_max,
+        top_k=5,
+        prefs=preference,
+        plan_prefs=plan_pref,
+        strategy=SelectionStrategy(request.strategy),
+        time_budget=None if request.time_budget_ms is None else request.time_budget_ms / 1000,
+        frontier=request.frontier,
     )
+    return PlanStages(calendar=calendar, constraints=candidate_constraints, selection=selection)
+
 
-    plans = [candidate_to_plan(candidate) for candidate in selection[:3]]
-    alternates = [candidate_to_plan(candidate) for candidate in selection[3:]]
+def respond_with_plans(
+    request: PlanRequest,
+    candidates: Sequence[CompactWindow],
+    config: SelectionConfig,
+    trace: PlanTrace | None = None,
+) -> PlanResponse:
+    """Run selection over ``candidates`` and shape the top plans into a response.
+
+    With a ``trace``, selection time and search effort are recorded on it.
+    """
+
+    trace = trace if trace is not None else PlanTrace()
+    trace.count("candidates", len(candidates))
+    if not candidates:
+        return PlanResponse(
+            params=request.to_dict(),
+            plans=[],
+            alternates=[],
+            frontier=[] if config.frontier else None,
+            trace=trace,
+        )
+
+    with trace.stage("selection"):
+        selection = search_plans(candidates, config)
+    trace.count("states_created", selection.stats.states_created)
+    trace.count("states_pruned", selection.stats.states_pruned)
+    with trace.stage("shape"):
+        plans = [candidate_to_plan(candidate) for candidate in selection.plans[:3]]
+        alternates = [candidate_to_plan(candidate) for candidate in selection.plans[3:]]
+        frontier = (
+            [FrontierStep(budget=budget, plan=candidate_to_plan(candidate)) for budget, candidate in selection.frontier]
+            if config.frontier
+            else None
+        )
     return PlanResponse(
         params=request.to_dict(),
         plans=plans,
         alternates=alternates,
+        optimal=selection.optimal,
+        cut_short=selection.cut_short,
+        frontier=frontier,
+        trace=trace,
     )
 
 
-__all__ = ["PlanRequest", "PlanResponse", "PreferenceInput", "ConstraintInput", "compute_plan"]
+def _cache_hits() -> tuple[int, int, int]:
+    return holiday_cache_stats().hits, calendar_store_stats().hits, candidate_cache_stats().hits
+
+
+def build_plan_response(request: PlanRequest) -> PlanResponse:
+    """Run the full calendar, candidate and selection pipeline for ``request``.
+
+    The response's ``trace`` times each stage and counts cache hits in this process.
+    """
+
+    trace = PlanTrace()
+    hits_before = _cache_hits()
+    with trace.stage("validate"):
+        stages = plan_stages(request)
+    with trace.stage("holidays"):
+        # Loads what the calendar stage needs, so a cold lookup is timed on its own.
+        for year in stages.calendar.years():
+            get_holidays(stages.calendar.country, stages.calendar.region, year)
+    # Count holiday hits before the calendar stage re-reads what the lookup loaded.
+    holiday_hits = holiday_cache_stats().hits - hits_before[0]
+    with trace.stage("calendar"):
+        grid = get_day_grid(stages.calendar)
+    with trace.stage("candidates"):
+        candidates = generate_candidates(grid, CandidateConfig(constraints=stages.constraints))
+    hits_after = _cache_hits()
+    trace.count("holiday_cache_hits", holiday_hits)
+    trace.count("calendar_cache_hits", hits_after[1] - hits_before[1])
+    trace.count("candidate_cache_hits", hits_after[2] - hits_before[2])
+    return respond_with_plans(request, candidates, stages.selection, trace)
+
+
+def canonical_request(request: PlanRequest) -> dict:
+    """Return the fields that determine a plan, normalized so equivalent requests match.
+
+    The locale is normalized, months are de-duplicated and sorted, and blackouts are
+    merged into ordered ISO ranges. The timezone only labels exports, so it is left out,
+    and so is the time budget: only complete searches are cached, and those return the
+    same plans whatever the budget. An explicit horizon replaces ``year``, which is then
+    left out too.
+    """
+
+    locale = LocaleRequest(country=request.country, region=request.region).normalize()
+    blackouts = BlackoutIndex.build(request.blackout_ranges())
+    payload = request.to_dict()
+    del payload["timezone"]
+    del payload["time_budget_ms"]
+    if request.horizon() is not None:
+        del payload["year"]
+    payload["country"] = locale.country
+    payload["region"] = locale.region
+    payload["prefs"]["prefer_months"] = sorted(set(request.prefs.prefer_months))
+    payload["prefs"]["avoid_months"] = sorted(set(request.prefs.avoid_months))
+    payload["constraints"]["blackouts"] = [
+        f"{start.isoformat()}..{end.isoformat()}" for start, end in blackouts.ranges()
+    ]
+    return payload
+
+
+def plan_cache_key(request: PlanRequest) -> tuple[str, int]:
+    """Hash the canonical request and pair it with the holiday data version."""
+
+    encoded = json.dumps(canonical_request(request), sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest(), holiday_data_version()
+
+
+def _response_size(response: PlanResponse) -> int:
+    # The serialized length tracks the in-memory footprint closely enough for a budget.
+    return len(response.render_json())
+
+
+PLAN_CACHE_BYTES = 32 * 1024 * 1024
+
+_plan_cache: LRUCache[tuple[str, int], PlanResponse] = LRUCache(PLAN_CACHE_BYTES, weigher=_response_size)
+# Flights are keyed by the cache key and the time budget, so a request never waits on
+# a computation that may stop sooner than its own budget allows.
+_plan_flights: SingleFlight[tuple[tuple[str, int], int | None], PlanResponse] = SingleFlight()
+_plan_executor = ProcessExecutor()
+
+
+def init_plan_worker(
+    holiday_cache_size: int,
+    holiday_snapshot_path: str | None,
+    calendar_cache_size: int,
+    candidate_cache_size: int,
+    calendar_prewarm: str = "",
+) -> None:
+    """Size a process's caches, map the shared snapshot and prewarm its calendars.
+
+    Runs in the parent and in every pool worker, since each process has its own
+    calendar store.
+    """
+
+    configure_holiday_cache(holiday_cache_size)
+    if holiday_snapshot_path:
+        use_holiday_snapshot(holiday_snapshot_path)
+    configure_calendar_store(calendar_cache_size)
+    configure_candidate_cache(candidate_cache_size)
+    prewarm_calendars(parse_prewarm_spec(calendar_prewarm))
+
+
+def configure_plan_executor(workers: int, timeout: float | None, worker_args: tuple = ()) -> None:
+    """Run plan computations on ``workers`` processes (0 keeps them in-process).
+
+    ``worker_args`` are passed to ``init_plan_worker`` when each worker starts.
+    """
+
+    _plan_executor.configure(
+        workers,
+        timeout,
+        initializer=init_plan_worker if worker_args else None,
+        initargs=worker_args,
+    )
+
+
+def plan_executor() -> ProcessExecutor:
+    return _plan_executor
+
+
+def plan_executor_stats() -> dict:
+    return _plan_executor.stats()
+
+
+def cached_plan(key: tuple[str, int]) -> PlanResponse | None:
+    return _plan_cache.get(key)
+
+
+def store_plan(key: tuple[str, int], response: PlanResponse) -> None:
+    """Cache ``response`` unless its search was cut short by a time budget.
+
+    A rendered ``body`` is kept with the entry and its length is the entry's weight.
+    """
+
+    if response.cut_short:
+        return
+    entry = response.for_request(response.params)
+    _plan_cache.put(key, entry, None if entry.body is None else len(entry.body))
+
+
+async def _compute_and_store(key: tuple[str, int], request: PlanRequest) -> PlanResponse:
+    # A timed-out computation that already started keeps running; the executor then
+    # retires that pool so the 504 does not leave later requests queued behind it.
+    try:
+        response = await _plan_executor.run(build_plan_response, request)
+    except TimeoutError:
+        raise http_error(
+            "PLAN_TIMEOUT",
+            "Plan computation took too long",
+            "Reduce blocks_max or use the beam strategy",
+            status_code=504,
+        ) from None
+    if response.trace is None:
+        response = replace(response, trace=PlanTrace())
+    # This is the body the leader sends, unless it asked for ``debug``.
+    with response.trace.stage("serialize"):
+        response.body = response.render_json()
+    store_plan(key, response)
+    return response
+
+
+async def compute_plan(request: PlanRequest) -> PlanResponse:
+    """Serve ``request`` from the response cache, computing it at most once per key.
+
+    Concurrent identical requests share a single computation. Cached responses are
+    returned with this request's own ``params`` echoed back. The JSON body is encoded
+    once, in the ``serialize`` stage, and reused by the cache and by later requests
+    whose ``params`` match, unless ``debug`` makes it differ. Every response carries
+    this request's trace (merged with the worker's when this request ran the
+    computation) for its ``Server-Timing`` header, and in ``debug`` when the request
+    asks for it; the trace also feeds the ``plan.*`` histograms.
+    """
+
+    trace = PlanTrace()
+    with trace.stage("cache"):
+        key = plan_cache_key(request)
+        response = cached_plan(key)
+    trace.count("plan_cache_hits", int(response is not None))
+    if response is None:
+        leader = False
+
+        def compute() -> Awaitable[PlanResponse]:
+            nonlocal leader
+            leader = True
+            return _compute_and_store(key, request)
+
+        with trace.stage("compute"):
+            response = await _plan_flights.run((key, request.time_budget_ms), compute)
+        # Coalesced followers share the leader's response but not its work.
+        if leader and response.trace is not None:
+            trace.merge(response.trace)
+    response = response.for_request(request.to_dict(), trace.to_dict() if request.debug else None, trace)
+    if response.body is None:
+        with trace.stage("serialize"):
+            response.body = response.render_json()
+    metrics.observe_trace("plan", trace)
+    return response
+
+
+def configure_plan_cache(max_bytes: int) -> None:
+    _plan_cache.resize(max_bytes)
+
+
+def plan_cache_stats() -> CacheStats:
+    return _plan_cache.stats()
+
+
+def plan_requests_coalesced() -> int:
+    return _plan_flights.coalesced
+
+
+__all__ = [
+    "PlanRequest",
+    "PlanResponse",
+    "PlanStages",
+    "PreferenceInput",
+    "ConstraintInput",
+    "build_plan_response",
+    "cached_plan",
+    "canonical_request",
+    "compute_plan",
+    "configure_plan_cache",
+    "configure_plan_executor",
+    "init_plan_worker",
+    "plan_cache_key",
+    "plan_executor_stats",
+    "plan_cache_stats",
+    "plan_requests_coalesced",
+    "plan_stages",
+    "respond_with_plans",
+    "store_plan",
+]
@@ -0,0 +1,136 @@
+"""Scenario comparison endpoint: one base plan request evaluated under several variants."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+from typing import List, Optional
+
+from .routes_batch import compute_plans_batch, error_detail
+from .routes_plan import ConstraintInput, PlanRequest, PlanResponse, PreferenceInput
+
+router = object()
+
+MAX_SCENARIOS = 16
+BASE_SCENARIO = "base"
+
+
+@dataclass
+class ScenarioOverride:
+    """A named variant of the base request; unset fields keep the base's values."""
+
+    name: str
+    goal: Optional[str] = None
+    prefs: Optional[PreferenceInput] = None
+    constraints: Optional[ConstraintInput] = None
+
+    def apply(self, base: PlanRequest) -> PlanRequest:
+        return replace(
+            base,
+            goal=self.goal if self.goal is not None else base.goal,
+            prefs=self.prefs if self.prefs is not None else base.prefs,
+            constraints=self.constraints if self.constraints is not None else base.constraints,
+        )
+
+    def to_dict(self) -> dict:
+        overrides: dict = {}
+        if self.goal is not None:
+            overrides["goal"] = self.goal
+        if self.prefs is not None:
+            overrides["prefs"] = self.prefs.to_dict()
+        if self.constraints is not None:
+            overrides["constraints"] = self.constraints.to_dict()
+        return overrides
+
+
+@dataclass
+class ScenarioRequest:
+    base: PlanRequest
+    scenarios: List[ScenarioOverride] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if len(self.scenarios) > MAX_SCENARIOS:
+            raise ValueError(f"At most {MAX_SCENARIOS} scenarios can be compared")
+        names = [scenario.name for scenario in self.scenarios]
+        if BASE_SCENARIO in names or len(set(names)) != len(names):
+            raise ValueError(f"Scenario names must be unique and not '{BASE_SCENARIO}'")
+
+
+@dataclass
+class ScenarioResult:
+    """One column of the comparison: the variant's response or its error."""
+
+    name: str
+    overrides: dict
+    response: Optional[PlanResponse] = None
+    error: Optional[dict] = None
+
+    def summary(self) -> Optional[dict]:
+        """Headline figures of the variant's best plan, for side-by-side display."""
+
+        if self.response is None:
+            return None
+        if not self.response.plans:
+            return {"score": None, "pto_used": 0, "days_off": 0, "longest_block": 0, "blocks": 0}
+        best = self.response.plans[0]
+        return {
+            "score": best.score,
+            "pto_used": best.pto_used,
+            "days_off": sum(block.days_off for block in best.blocks),
+            "longest_block": max((block.days_off for block in best.blocks), default=0),
+            "blocks": len(best.blocks),
+        }
+
+    def model_dump(self) -> dict:
+        return {
+            "name": self.name,
+            "overrides": self.overrides,
+            "summary": self.summary(),
+            "response": self.response.model_dump() if self.response else None,
+            "error": self.error,
+        }
+
+
+@dataclass
+class ScenarioComparison:
+    base: dict
+    scenarios: List[ScenarioResult]
+
+    def model_dump(self) -> dict:
+        return {"base": self.base, "scenarios": [scenario.model_dump() for scenario in self.scenarios]}
+
+
+async def compare_scenarios(request: ScenarioRequest) -> ScenarioComparison:
+    """Plan the base request and every override, returning them side by side.
+
+    The variants run through the batch pipeline: variants that keep the base's
+    calendar and constraints share one calendar and candidate set, identical variants
+    are computed once, and each shared set is split into one chunk per plan executor
+    worker, so the variants are evaluated concurrently without sending the candidates
+    once per variant. An invalid override only fails its own column.
+    """
+
+    columns = [ScenarioResult(BASE_SCENARIO, {})]
+    variants: list[PlanRequest | None] = [request.base]
+    for scenario in request.scenarios:
+        column = ScenarioResult(scenario.name, scenario.to_dict())
+        columns.append(column)
+        try:
+            variants.append(scenario.apply(request.base))
+        except Exception as exc:  # noqa: BLE001 - reported per scenario
+            column.error = error_detail(exc)
+            variants.append(None)
+
+    runnable = [index for index, variant in enumerate(variants) if variant is not None]
+    async for result in compute_plans_batch([variants[index] for index in runnable], chunk_size=None):
+        column = columns[runnable[result.index]]
+        column.response = result.response
+        column.error = result.error
+    return ScenarioComparison(base=request.base.to_dict(), scenarios=columns)
+
+
+__all__ = [
+    "ScenarioComparison",
+    "ScenarioOverride",
+    "ScenarioRequest",
+    "ScenarioResult",
+    "compare_scenarios",
+]
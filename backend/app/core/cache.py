@@ -0,0 +1,189 @@
+"""Small in-process caching primitives shared by the planner stages."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(slots=True, frozen=True)
+class CacheStats:
+    """Point-in-time counters for a cache, suitable for dashboards."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+    weight: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": self.size,
+            "maxsize": self.maxsize,
+            "weight": self.weight,
+        }
+
+
+def _unit_weight(_value: object) -> int:
+    return 1
+
+
+class LRUCache(Generic[K, V]):
+    """Thread-safe, size-bounded cache evicting the least recently used entry.
+
+    By default every entry weighs one, so ``maxsize`` caps the entry count. Passing a
+    ``weigher`` (for example an approximate byte size) makes ``maxsize`` a budget on
+    the summed weights instead; an entry heavier than the whole budget is
+    not stored and displaces nothing.
+    """
+
+    def __init__(self, maxsize: int, weigher: Callable[[V], int] | None = None) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._weigher = weigher or _unit_weight
+        self._entries: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self._weight = 0
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value and mark it recently used, or None on a miss."""
+
+        with self._lock:
+            try:
+                value, _weight = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: K, value: V, weight: int | None = None) -> None:
+        """Store ``value``; a known ``weight`` is used instead of calling the weigher."""
+
+        if weight is None:
+            weight = self._weigher(value)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._weight -= previous[1]
+            if weight > self.maxsize:
+                return
+            self._entries[key] = (value, weight)
+            self._weight += weight
+            self._evict()
+
+    def _evict(self) -> None:
+        while self._entries and self._weight > self.maxsize:
+            _key, (_value, weight) = self._entries.popitem(last=False)
+            self._weight -= weight
+            self._evictions += 1
+
+    def get_or_create(self, key: K, factory: Callable[[], V]) -> V:
+        """Return the cached value, building and storing it with ``factory`` on a miss."""
+
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.put(key, value)
+        return value
+
+    def invalidate(self, predicate: Callable[[K], bool] | None = None) -> int:
+        """Drop every entry, or only those whose key matches ``predicate``; return the count."""
+
+        with self._lock:
+            if predicate is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                self._weight = 0
+                return dropped
+            stale = [key for key in self._entries if predicate(key)]
+            for key in stale:
+                self._weight -= self._entries.pop(key)[1]
+            return len(stale)
+
+    def resize(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+                weight=self._weight,
+            )
+
+
+class SingleFlight(Generic[K, V]):
+    """Coalesce concurrent async computations that share a key.
+
+    The first caller for a key starts the computation as a task; callers arriving
+    while it runs await the same task instead of starting their own. Each waiter is
+    shielded, so one caller cancelling does not cancel the shared work while others
+    still wait; once the last waiter is cancelled the task is cancelled too.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[K, asyncio.Future[V]] = {}
+        self._waiters: dict[asyncio.Future[V], int] = {}
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def run(self, key: K, factory: Callable[[], Awaitable[V]]) -> V:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.coalesced += 1
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            remaining = self._waiters.pop(task) - 1
+            if remaining:
+                self._waiters[task] = remaining
+            elif not task.done():
+                # Nobody is left to use the result; new callers start a fresh task.
+                if self._inflight.get(key) is task:
+                    del self._inflight[key]
+                task.cancel()
+
+    def _finish(self, key: K, task: asyncio.Future[V]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even when every waiter has gone away.
+            task.exception()
+
+
+__all__ = ["CacheStats", "LRUCache", "SingleFlight"]
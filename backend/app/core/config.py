@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic import BaseSettings, Field
 
@@ -15,6 +15,16 @@ class Settings(BaseSettings):
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
         default="INFO", alias="LOG_LEVEL"
     )
+    holiday_cache_size: int = Field(default=512, alias="HOLIDAY_CACHE_SIZE", ge=1)
+    holiday_snapshot_path: Optional[str] = Field(default=None, alias="HOLIDAY_SNAPSHOT_PATH")
+    calendar_cache_size: int = Field(default=128, alias="CALENDAR_CACHE_SIZE", ge=1)
+    # Comma separated "LOCALE:YEAR[-YEAR]" items, e.g. "CA-ON:2025,US-CA:2025-2026".
+    calendar_prewarm: str = Field(default="", alias="CALENDAR_PREWARM")
+    candidate_cache_size: int = Field(default=128, alias="CANDIDATE_CACHE_SIZE", ge=1)
+    plan_cache_bytes: int = Field(default=32 * 1024 * 1024, alias="PLAN_CACHE_BYTES", ge=1)
+    # Worker processes for plan computation; 0 computes plans on the event loop.
+    plan_workers: int = Field(default=2, alias="PLAN_WORKERS", ge=0)
+    plan_timeout_seconds: float = Field(default=30.0, alias="PLAN_TIMEOUT_SECONDS", gt=0)
 
     class Config:
         env_file = ".env"
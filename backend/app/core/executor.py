@@ -0,0 +1,131 @@
+"""Process pool wrapper that lets async handlers offload CPU-bound work."""
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from threading import Lock
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+_UNSET: Any = object()
+
+
+class ProcessExecutor:
+    """Run picklable callables in a lazily started process pool from async code.
+
+    ``max_workers=0`` runs callables inline on the calling thread, which keeps tests and
+    single-process deployments free of worker start-up costs. Workers are spawned rather
+    than forked so they never inherit locks held by the parent's caches.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 0,
+        timeout: float | None = None,
+        initializer: Callable[..., None] | None = None,
+        initargs: tuple = (),
+    ) -> None:
+        self._lock = Lock()
+        self._pool: ProcessPoolExecutor | None = None
+        self.configure(max_workers, timeout, initializer, initargs)
+        self.submitted = 0
+        self.timeouts = 0
+        self.cancelled = 0
+        self.recycled = 0
+
+    def configure(
+        self,
+        max_workers: int,
+        timeout: float | None = None,
+        initializer: Callable[..., None] | None = None,
+        initargs: tuple = (),
+    ) -> None:
+        """Apply new pool settings; a running pool is shut down and restarted lazily."""
+
+        if max_workers < 0:
+            raise ValueError("max_workers must be non-negative")
+        self.shutdown(wait=False)
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._initializer = initializer
+        self._initargs = initargs
+
+    def _executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=self._initializer,
+                    initargs=self._initargs,
+                )
+            return self._pool
+
+    async def run(self, fn: Callable[..., T], *args: Any, timeout: float | None = _UNSET) -> T:
+        """Run ``fn(*args)`` in the pool and await its result.
+
+        Raises ``TimeoutError`` once ``timeout`` seconds (default: the configured one)
+        pass. Timing out or cancelling the awaiting task drops the job if it has not
+        started yet. A job that is already running cannot be interrupted, so on a
+        timeout its pool is retired: later jobs go to a fresh pool while the old one
+        finishes the work it has started and then exits.
+        """
+
+        if timeout is _UNSET:
+            timeout = self.timeout
+        if self.max_workers == 0:
+            return fn(*args)
+
+        pool = self._executor()
+        future: Future[T] = pool.submit(fn, *args)
+        self.submitted += 1
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except TimeoutError:
+            self.timeouts += 1
+            if not future.cancel():
+                self._retire(pool)
+            raise
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        except BrokenProcessPool:
+            # A worker died; start a fresh pool for the next job.
+            with self._lock:
+                if self._pool is pool:
+                    self._pool = None
+            raise
+        finally:
+            future.cancel()
+
+    def _retire(self, pool: ProcessPoolExecutor) -> None:
+        """Stop routing jobs to ``pool`` without waiting for its running jobs."""
+
+        with self._lock:
+            if self._pool is not pool:
+                return
+            self._pool = None
+            self.recycled += 1
+        pool.shutdown(wait=False)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.max_workers,
+            "running": self._pool is not None,
+            "submitted": self.submitted,
+            "timeouts": self.timeouts,
+            "cancelled": self.cancelled,
+            "recycled": self.recycled,
+        }
+
+
+__all__ = ["ProcessExecutor"]
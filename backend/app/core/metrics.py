@@ -0,0 +1,115 @@
+"""Request tracing and in-process histograms for the planning pipeline."""
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Iterator, Mapping, Sequence
+
+# Upper bounds in seconds; the last bucket is open ended.
+DURATION_BUCKETS: tuple[float, ...] = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+# Upper bounds for effort counters such as candidates or search states.
+COUNT_BUCKETS: tuple[float, ...] = (0, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+
+@dataclass
+class PlanTrace:
+    """Stage durations and effort counters gathered while serving one request.
+
+    Traces are plain data so a worker process can return one with its result and the
+    parent can merge it into its own.
+    """
+
+    stages: dict[str, float] = field(default_factory=dict)
+    counters: dict[str, int] = field(default_factory=dict)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the block, adding to any time already recorded under ``name``."""
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - started
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def merge(self, other: PlanTrace) -> None:
+        for name, seconds in other.stages.items():
+            self.stages[name] = self.stages.get(name, 0.0) + seconds
+        for name, amount in other.counters.items():
+            self.count(name, amount)
+
+    def server_timing(self) -> str:
+        """Render the stages as a ``Server-Timing`` header value in milliseconds."""
+
+        return ", ".join(f"{name};dur={seconds * 1e3:.3f}" for name, seconds in self.stages.items())
+
+    def to_dict(self) -> dict:
+        return {
+            "stages_ms": {name: round(seconds * 1e3, 3) for name, seconds in self.stages.items()},
+            "counters": dict(self.counters),
+        }
+
+
+class Histogram:
+    """Thread-safe fixed-bucket histogram with a running count and sum."""
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = tuple(bounds)
+        self._counts = [0] * (len(self.bounds) + 1)
+        self._total = 0.0
+        self._lock = Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._total += value
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._total
+        buckets = [[bound, count] for bound, count in zip([*self.bounds, "+Inf"], counts)]
+        return {"count": sum(counts), "sum": total, "buckets": buckets}
+
+
+class MetricsRegistry:
+    """Named histograms, created on first observation."""
+
+    def __init__(self) -> None:
+        self._histograms: dict[str, Histogram] = {}
+        self._lock = Lock()
+
+    def histogram(self, name: str, bounds: Sequence[float]) -> Histogram:
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram(bounds)
+            return histogram
+
+    def observe_trace(self, prefix: str, trace: PlanTrace) -> None:
+        for name, seconds in trace.stages.items():
+            self.histogram(f"{prefix}.stage.{name}_seconds", DURATION_BUCKETS).observe(seconds)
+        for name, amount in trace.counters.items():
+            self.histogram(f"{prefix}.{name}", COUNT_BUCKETS).observe(amount)
+
+    def snapshot(self) -> Mapping[str, dict]:
+        with self._lock:
+            histograms = dict(self._histograms)
+        return {name: histograms[name].to_dict() for name in sorted(histograms)}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+
+metrics = MetricsRegistry()
+
+
+__all__ = ["COUNT_BUCKETS", "DURATION_BUCKETS", "Histogram", "MetricsRegistry", "PlanTrace", "metrics"]
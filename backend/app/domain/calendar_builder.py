@@ -5,18 +5,172 @@ from dataclasses import dataclass
 from datetime import date, timedelta
 from typing import Iterable, Iterator, Mapping, Sequence
 
-from .holiday_provider import get_holidays
+from ..core.cache import CacheStats, LRUCache
+from .holiday_provider import get_holidays, holiday_data_version
 from .models import DayInfo, DayType
 
+# Byte codes used by ``DayGrid.kinds``; ``UNLABELED`` marks gaps in a partial day list.
+WORKDAY, HOLIDAY, WEEKEND, UNLABELED = 0, 1, 2, 3
+DAY_TYPE_CODES: Mapping[DayType, int] = {
+    DayType.WORKDAY: WORKDAY,
+    DayType.HOLIDAY: HOLIDAY,
+    DayType.WEEKEND: WEEKEND,
+}
+CODE_DAY_TYPES: tuple[DayType, ...] = (DayType.WORKDAY, DayType.HOLIDAY, DayType.WEEKEND)
+
 
 @dataclass(frozen=True)
 class CalendarConfig:
-    """Configuration input for building the day grid."""
+    """Configuration input for building the day grid.
+
+    The grid covers ``year`` unless ``start`` and ``end`` give an explicit inclusive
+    horizon, which may cross year boundaries (for example a rolling 18 months).
+    """
 
     year: int
     weekend_days: Sequence[int]
     country: str
     region: str | None
+    start: date | None = None
+    end: date | None = None
+
+    def __post_init__(self) -> None:
+        if (self.start is None) != (self.end is None):
+            raise ValueError("start and end must be given together")
+        if self.start is not None and self.end is not None and self.end < self.start:
+            raise ValueError("Calendar end must not precede its start")
+
+    @classmethod
+    def for_range(
+        cls,
+        start: date,
+        end: date,
+        weekend_days: Sequence[int],
+        country: str,
+        region: str | None,
+    ) -> CalendarConfig:
+        return cls(year=start.year, weekend_days=weekend_days, country=country, region=region, start=start, end=end)
+
+    def span(self) -> tuple[date, date]:
+        """Return the first and last day the grid covers."""
+
+        if self.start is not None and self.end is not None:
+            return self.start, self.end
+        return date(self.year, 1, 1), date(self.year, 12, 31)
+
+    def years(self) -> range:
+        first, last = self.span()
+        return range(first.year, last.year + 1)
+
+    def year_config(self, year: int) -> CalendarConfig:
+        """Return the whole-year config sharing this locale and weekend."""
+
+        return CalendarConfig(year=year, weekend_days=self.weekend_days, country=self.country, region=self.region)
+
+    def canonical(self) -> CalendarConfig:
+        """Return an equivalent, hashable config with sorted, de-duplicated weekend days.
+
+        A horizon covering exactly one calendar year collapses to the plain year form
+        so both spellings share a cached grid.
+        """
+
+        weekend = tuple(sorted(set(self.weekend_days)))
+        first, last = self.span()
+        if first == date(first.year, 1, 1) and last == date(first.year, 12, 31):
+            if weekend == self.weekend_days and self.start is None:
+                return self
+            return CalendarConfig(year=first.year, weekend_days=weekend, country=self.country, region=self.region)
+        if weekend == self.weekend_days:
+            return self
+        return CalendarConfig.for_range(first, last, weekend, self.country, self.region)
+
+
+def _prefix_counts(kinds: bytes, code: int) -> tuple[int, ...]:
+    counts = [0]
+    running = 0
+    for kind in kinds:
+        if kind == code:
+            running += 1
+        counts.append(running)
+    return tuple(counts)
+
+
+@dataclass(slots=True, frozen=True)
+class DayGrid:
+    """Compact day grid: one ``DayType`` code per day plus running counts.
+
+    ``kinds[i]`` labels the day ``start + i``. Each prefix array holds one more entry
+    than there are days, so the number of workdays, holidays or weekend days in any
+    inclusive offset range is a difference of two lookups. Every field is immutable,
+    so one grid can be shared by all requests for the same calendar.
+    """
+
+    start: date
+    kinds: bytes
+    names: tuple[tuple[int, str], ...]
+    workday_prefix: tuple[int, ...]
+    holiday_prefix: tuple[int, ...]
+    weekend_prefix: tuple[int, ...]
+
+    @classmethod
+    def from_kinds(cls, start: date, kinds: bytes, names: Mapping[int, str]) -> DayGrid:
+        return cls(
+            start=start,
+            kinds=kinds,
+            names=tuple(sorted(names.items())),
+            workday_prefix=_prefix_counts(kinds, WORKDAY),
+            holiday_prefix=_prefix_counts(kinds, HOLIDAY),
+            weekend_prefix=_prefix_counts(kinds, WEEKEND),
+        )
+
+    @classmethod
+    def from_days(cls, days: Sequence[DayInfo]) -> DayGrid:
+        """Pack a list of ``DayInfo`` into a grid, leaving missing days unlabeled."""
+
+        if not days:
+            return cls.from_kinds(date(date.today().year, 1, 1), b"", {})
+        start = min(info.day for info in days)
+        end = max(info.day for info in days)
+        kinds = bytearray([UNLABELED]) * ((end - start).days + 1)
+        names: dict[int, str] = {}
+        for info in days:
+            offset = (info.day - start).days
+            kinds[offset] = DAY_TYPE_CODES[info.kind]
+            if info.name:
+                names[offset] = info.name
+        return cls.from_kinds(start, bytes(kinds), names)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    @property
+    def end(self) -> date:
+        return self.start + timedelta(days=len(self.kinds) - 1)
+
+    def day(self, offset: int) -> date:
+        return self.start + timedelta(days=offset)
+
+    def offset(self, day: date) -> int:
+        return (day - self.start).days
+
+    def workdays_between(self, first: int, last: int) -> int:
+        """Return the number of workdays in the inclusive offset range."""
+
+        return self.workday_prefix[last + 1] - self.workday_prefix[first]
+
+    def holidays_between(self, first: int, last: int) -> int:
+        return self.holiday_prefix[last + 1] - self.holiday_prefix[first]
+
+    def weekends_between(self, first: int, last: int) -> int:
+        return self.weekend_prefix[last + 1] - self.weekend_prefix[first]
+
+    def to_days(self) -> list[DayInfo]:
+        names = dict(self.names)
+        return [
+            DayInfo(day=self.day(offset), kind=CODE_DAY_TYPES[kind], name=names.get(offset))
+            for offset, kind in enumerate(self.kinds)
+            if kind != UNLABELED
+        ]
 
 
 def iter_year_days(year: int) -> Iterator[date]:
@@ -29,23 +183,107 @@ def iter_year_days(year: int) -> Iterator[date]:
         current += timedelta(days=1)
 
 
-def build_calendar(config: CalendarConfig) -> list[DayInfo]:
-    """Label every day of the requested year with weekend and holiday metadata."""
+def build_day_grid(config: CalendarConfig) -> DayGrid:
+    """Label every day of the requested year or horizon as a compact ``DayGrid``.
+
+    Horizons are stitched together from the shared whole-year grids, so moving a
+    rolling horizon forward only labels the year it newly reaches.
+    """
+
+    if config.start is not None:
+        return _build_horizon_grid(config)
 
     country_holidays = get_holidays(config.country, config.region, config.year)
     weekend_set = frozenset(config.weekend_days)
 
-    result: list[DayInfo] = []
-    for current in iter_year_days(config.year):
+    kinds = bytearray()
+    names: dict[int, str] = {}
+    for offset, current in enumerate(iter_year_days(config.year)):
         if current.weekday() in weekend_set:
-            result.append(DayInfo(day=current, kind=DayType.WEEKEND, name=None))
+            kinds.append(WEEKEND)
             continue
         holiday_name = country_holidays.get(current)
         if holiday_name:
-            result.append(DayInfo(day=current, kind=DayType.HOLIDAY, name=holiday_name))
+            kinds.append(HOLIDAY)
+            names[offset] = holiday_name
         else:
-            result.append(DayInfo(day=current, kind=DayType.WORKDAY, name=None))
-    return result
+            kinds.append(WORKDAY)
+    return DayGrid.from_kinds(date(config.year, 1, 1), bytes(kinds), names)
+
+
+def _build_horizon_grid(config: CalendarConfig) -> DayGrid:
+    first, last = config.span()
+    kinds = bytearray()
+    names: dict[int, str] = {}
+    for year in config.years():
+        grid = get_day_grid(config.year_config(year))
+        lo = max(0, grid.offset(first))
+        hi = min(len(grid) - 1, grid.offset(last))
+        shift = (grid.day(lo) - first).days - lo
+        for offset, name in grid.names:
+            if lo <= offset <= hi:
+                names[offset + shift] = name
+        kinds += grid.kinds[lo : hi + 1]
+    return DayGrid.from_kinds(first, bytes(kinds), names)
+
+
+def build_calendar(config: CalendarConfig) -> list[DayInfo]:
+    """Label every day of the requested year or horizon with weekend and holiday metadata."""
+
+    return build_day_grid(config).to_days()
+
+
+CALENDAR_CACHE_SIZE = 128
+
+# Keyed by the canonical config plus the holiday data version, so invalidating
+# holidays also retires the grids built from them.
+_calendar_store: LRUCache[tuple[CalendarConfig, int], DayGrid] = LRUCache(CALENDAR_CACHE_SIZE)
+
+
+def get_day_grid(config: CalendarConfig) -> DayGrid:
+    """Return the shared, memoized ``DayGrid`` for ``config``."""
+
+    canonical = config.canonical()
+    return _calendar_store.get_or_create(
+        (canonical, holiday_data_version()),
+        lambda: build_day_grid(canonical),
+    )
+
+
+def prewarm_calendars(configs: Iterable[CalendarConfig]) -> int:
+    """Build and store the grids for ``configs`` ahead of traffic; return how many."""
+
+    count = 0
+    for config in configs:
+        get_day_grid(config)
+        count += 1
+    return count
+
+
+def parse_prewarm_spec(spec: str, weekend_days: Sequence[int] = (5, 6)) -> list[CalendarConfig]:
+    """Parse ``"CA-ON:2025,US:2025-2026"`` into calendar configs.
+
+    Each item is a country or ISO region code, a colon and a year or year range.
+    """
+
+    configs: list[CalendarConfig] = []
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        locale, _sep, years = item.partition(":")
+        locale = locale.upper()
+        country = locale.split("-", 1)[0]
+        region = locale if "-" in locale else None
+        first, _sep, last = years.partition("-")
+        for year in range(int(first), int(last or first) + 1):
+            configs.append(CalendarConfig(year=year, weekend_days=tuple(weekend_days), country=country, region=region))
+    return configs
+
+
+def configure_calendar_store(maxsize: int) -> None:
+    _calendar_store.resize(maxsize)
+
+
+def calendar_store_stats() -> CacheStats:
+    return _calendar_store.stats()
 
 
 def index_by_date(days: Iterable[DayInfo]) -> Mapping[date, DayInfo]:
@@ -54,4 +292,15 @@ def index_by_date(days: Iterable[DayInfo]) -> Mapping[date, DayInfo]:
     return {item.day: item for item in days}
 
 
-__all__ = ["CalendarConfig", "build_calendar", "index_by_date"]
+__all__ = [
+    "CalendarConfig",
+    "DayGrid",
+    "build_calendar",
+    "build_day_grid",
+    "calendar_store_stats",
+    "configure_calendar_store",
+    "get_day_grid",
+    "index_by_date",
+    "parse_prewarm_spec",
+    "prewarm_calendars",
+]
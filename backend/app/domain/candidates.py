@@ -1,15 +1,63 @@
 """Generate candidate PTO windows given a labeled calendar."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from datetime import date, timedelta
 from typing import Iterable, Iterator, Sequence
 
-from .models import CandidateWindow, DayInfo, DayType
+from ..core.cache import CacheStats, LRUCache
+from .calendar_builder import HOLIDAY, WEEKEND, WORKDAY, DayGrid
+from .models import CompactWindow, DayInfo, quarter_bit_for
 
 WINDOW_RADIUS = 7
 DOUBLE_HOLIDAY_MAX_GAP = 14
 MIN_PAYOFF_DAYS = 4
+ONE_DAY = timedelta(days=1)
+
+
+@dataclass(slots=True, frozen=True)
+class BlackoutIndex:
+    """Blackout ranges merged into sorted, disjoint intervals for bisect lookups."""
+
+    starts: tuple[date, ...]
+    ends: tuple[date, ...]
+    first_ordinals: tuple[int, ...] = field(init=False, repr=False, compare=False)
+    last_ordinals: tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "first_ordinals", tuple(day.toordinal() for day in self.starts))
+        object.__setattr__(self, "last_ordinals", tuple(day.toordinal() for day in self.ends))
+
+    @classmethod
+    def build(cls, ranges: Iterable[tuple[date, date]]) -> BlackoutIndex:
+        starts: list[date] = []
+        ends: list[date] = []
+        for start, end in sorted(ranges):
+            if ends and start <= ends[-1] + ONE_DAY:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        return cls(starts=tuple(starts), ends=tuple(ends))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def overlaps(self, start: date, end: date) -> bool:
+        """Return True if the inclusive range touches any blackout, in O(log n)."""
+
+        idx = bisect_right(self.starts, end) - 1
+        return idx >= 0 and self.ends[idx] >= start
+
+    def overlaps_ordinals(self, first: int, last: int) -> bool:
+        """``overlaps`` for a range given as ``date.toordinal()`` values."""
+
+        idx = bisect_right(self.first_ordinals, last) - 1
+        return idx >= 0 and self.last_ordinals[idx] >= first
+
+    def ranges(self) -> tuple[tuple[date, date], ...]:
+        return tuple(zip(self.starts, self.ends))
 
 
 @dataclass(slots=True, frozen=True)
@@ -19,13 +67,39 @@ class CandidateConstraints:
     blackout_ranges: tuple[tuple[date, date], ...]
     min_block_len: int | None
     max_block_len: int | None
+    blackout_index: BlackoutIndex = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "blackout_index", BlackoutIndex.build(self.blackout_ranges))
 
     def allows_range(self, start: date, end: date) -> bool:
         if self.min_block_len and (end - start).days + 1 < self.min_block_len:
             return False
         if self.max_block_len and (end - start).days + 1 > self.max_block_len:
             return False
-        return not any(overlaps_range(start, end, rng_start, rng_end) for rng_start, rng_end in self.blackout_ranges)
+        return not self.blackout_index.overlaps(start, end)
+
+    def allows_window(self, window: CompactWindow) -> bool:
+        """``allows_range`` for a compact window, without building dates."""
+
+        if self.min_block_len and window.off_streak < self.min_block_len:
+            return False
+        if self.max_block_len and window.off_streak > self.max_block_len:
+            return False
+        return not self.blackout_index.overlaps_ordinals(window.first, window.last)
+
+    def within(self, first: date, last: date) -> CandidateConstraints:
+        """Return constraints keeping only the blackouts that touch ``first..last``."""
+
+        index = self.blackout_index
+        kept = tuple(rng for rng in index.ranges() if overlaps_range(rng[0], rng[1], first, last))
+        if len(kept) == len(index) and kept == self.blackout_ranges:
+            return self
+        return CandidateConstraints(
+            blackout_ranges=kept,
+            min_block_len=self.min_block_len,
+            max_block_len=self.max_block_len,
+        )
 
 
 @dataclass(slots=True, frozen=True)
@@ -54,77 +128,191 @@ def iter_dates(start: date, end: date) -> Iterator[date]:
         current += timedelta(days=1)
 
 
-def generate_candidates(
-    days: Sequence[DayInfo],
-    config: CandidateConfig,
-) -> list[CandidateWindow]:
-    """Return PTO candidate windows seeded around holidays and weekends."""
+def expand_offsets(center: int, radius: int, length: int) -> tuple[int, int]:
+    """Offset-based ``expand_range`` clamped to a grid of ``length`` days."""
+
+    return max(0, center - radius), min(length - 1, center + radius)
 
-    by_date = {info.day: info for info in days}
-    year = days[0].day.year if days else date.today().year
-    holidays = sorted(d.day for d in days if d.kind == DayType.HOLIDAY)
-    weekends = sorted(d.day for d in days if d.kind == DayType.WEEKEND)
 
-    windows: set[tuple[date, date]] = set()
+def _seed_spans(grid: DayGrid, lo: int, hi: int, seed_first: int, seed_last: int) -> set[tuple[int, int]]:
+    """Offset spans seeded by days in ``seed_first..seed_last``, clamped to ``lo..hi``."""
+
+    kinds = grid.kinds
+    holidays = [offset for offset in range(lo, hi + 1) if kinds[offset] == HOLIDAY]
+    spans: set[tuple[int, int]] = set()
 
     for holiday in holidays:
-        windows.add(expand_range(holiday, WINDOW_RADIUS, year))
+        if seed_first <= holiday <= seed_last:
+            spans.add((max(lo, holiday - WINDOW_RADIUS), min(hi, holiday + WINDOW_RADIUS)))
 
-    for weekend_day in weekends:
-        # Focus around Saturdays to avoid duplicates
-        if weekend_day.weekday() == 5:  # Saturday
-            windows.add(expand_range(weekend_day, 4, year))
+    # Focus around Saturdays to avoid duplicates
+    first_saturday = seed_first + (5 - grid.day(seed_first).weekday()) % 7
+    for weekend_day in range(first_saturday, seed_last + 1, 7):
+        if kinds[weekend_day] == WEEKEND:
+            spans.add((max(lo, weekend_day - 4), min(hi, weekend_day + 4)))
 
     for idx, first in enumerate(holidays):
+        if not seed_first <= first <= seed_last:
+            continue
         for second in holidays[idx + 1 :]:
-            if (second - first).days <= DOUBLE_HOLIDAY_MAX_GAP:
-                windows.add((first, second))
+            if second - first <= DOUBLE_HOLIDAY_MAX_GAP:
+                spans.add((first, second))
             else:
                 break
+    return spans
 
-    candidates: list[CandidateWindow] = []
-    for start, end in sorted(windows):
-        if not config.constraints.allows_range(start, end):
-            continue
-        window_days = list(iter_dates(start, end))
-        if len(window_days) < MIN_PAYOFF_DAYS:
+
+def _annotate(grid: DayGrid, spans: Iterable[tuple[int, int]]) -> list[CompactWindow]:
+    kinds = grid.kinds
+    candidates: list[CompactWindow] = []
+    for first, last in spans:
+        off_streak = last - first + 1
+        if off_streak < MIN_PAYOFF_DAYS:
             continue
-        holidays_in_window: list[date] = []
-        weekends_in_window: list[date] = []
-        workdays_in_window: list[date] = []
-        for day in window_days:
-            info = by_date.get(day)
-            if not info:
-                continue
-            if info.kind == DayType.WEEKEND:
-                weekends_in_window.append(day)
-            elif info.kind == DayType.HOLIDAY:
-                holidays_in_window.append(day)
-            else:
-                workdays_in_window.append(day)
-        pto_needed = len(workdays_in_window)
-        if pto_needed == len(window_days):
+        pto_needed = grid.workdays_between(first, last)
+        if pto_needed == off_streak:
             # No existing weekends/holidays; skip low value windows
             continue
+        start = grid.day(first)
+        # Indexed by day code; the last mask collects unlabeled days.
+        masks = [0, 0, 0, 0]
+        pto_by_month: dict[int, int] = {}
+        current = start
+        bit = 1
+        for kind in kinds[first : last + 1]:
+            masks[kind] |= bit
+            if kind == WORKDAY:
+                pto_by_month[current.month] = pto_by_month.get(current.month, 0) + 1
+            bit <<= 1
+            current += ONE_DAY
         candidates.append(
-            CandidateWindow(
-                start=start,
-                end=end,
+            CompactWindow(
+                first=start.toordinal(),
+                last=start.toordinal() + off_streak - 1,
                 pto_needed=pto_needed,
-                off_streak=len(window_days),
-                holidays=tuple(sorted(holidays_in_window)),
-                weekends=tuple(sorted(weekends_in_window)),
-                workdays=tuple(sorted(workdays_in_window)),
+                off_streak=off_streak,
+                workday_mask=masks[WORKDAY],
+                holiday_mask=masks[HOLIDAY],
+                weekend_mask=masks[WEEKEND],
+                quarter=quarter_bit_for(start),
+                pto_by_month=tuple(pto_by_month.items()),
             )
         )
-    return sorted(
-        candidates,
-        key=lambda c: (c.end, c.start, c.pto_needed, c.off_streak),
-    )
+    return candidates
+
+
+def _month_segments(grid: DayGrid) -> Iterator[tuple[int, int]]:
+    first = 0
+    while first < len(grid):
+        day = grid.day(first)
+        next_month = date(day.year + day.month // 12, day.month % 12 + 1, 1)
+        last = min(len(grid) - 1, first + (next_month - day).days - 1)
+        yield first, last
+        first = last + 1
+
+
+CANDIDATE_CACHE_SIZE = 128
+# Windows reach at most this many days past the day that seeds them.
+SEGMENT_MARGIN = max(WINDOW_RADIUS, DOUBLE_HOLIDAY_MAX_GAP)
+SEGMENTS_PER_GRID = 16
+
+# A month's windows depend only on the labels within SEGMENT_MARGIN of it, so
+# overlapping horizons share the segments they have in common.
+_segment_cache: LRUCache[tuple[date, bytes, int, int], tuple[CompactWindow, ...]] = LRUCache(
+    CANDIDATE_CACHE_SIZE * SEGMENTS_PER_GRID
+)
+# Enumeration depends only on where the grid starts and how its days are labeled.
+_window_cache: LRUCache[tuple[date, bytes], tuple[CompactWindow, ...]] = LRUCache(CANDIDATE_CACHE_SIZE)
+
+
+def enumerate_windows(grid: DayGrid) -> tuple[CompactWindow, ...]:
+    """Return every annotated window the calendar alone allows, before constraints.
+
+    Windows are enumerated as day offsets into the grid so the PTO and streak counts
+    come from its prefix sums, one calendar month of seed days at a time. Each month
+    is cached by the labels it can see, so sliding a horizon only enumerates the
+    months whose neighbourhood changed. The result is sorted the way
+    ``select_plans`` expects.
+    """
+
+    found: dict[tuple[int, int], CompactWindow] = {}
+    for seed_first, seed_last in _month_segments(grid):
+        lo = max(0, seed_first - SEGMENT_MARGIN)
+        hi = min(len(grid) - 1, seed_last + SEGMENT_MARGIN)
+        key = (grid.day(lo), grid.kinds[lo : hi + 1], seed_first - lo, seed_last - lo)
+        segment = _segment_cache.get_or_create(
+            key,
+            lambda: tuple(_annotate(grid, _seed_spans(grid, lo, hi, seed_first, seed_last))),
+        )
+        for window in segment:
+            found.setdefault((window.first, window.last), window)
+    return tuple(sorted(found.values(), key=lambda c: (c.last, c.first, c.pto_needed, c.off_streak)))
+
+
+def cached_windows(grid: DayGrid) -> tuple[CompactWindow, ...]:
+    """Return the memoized ``enumerate_windows`` result for ``grid``."""
+
+    return _window_cache.get_or_create((grid.start, grid.kinds), lambda: enumerate_windows(grid))
+
+
+def filter_candidates(
+    windows: Sequence[CompactWindow],
+    constraints: CandidateConstraints,
+) -> list[CompactWindow]:
+    """Apply per-request constraints to pre-sorted windows, keeping their order."""
+
+    if not windows:
+        return []
+    # Sorted by end date, so the last window closes the span.
+    first = date.fromordinal(min(window.first for window in windows))
+    constraints = constraints.within(first, windows[-1].end)
+    if not constraints.min_block_len and not constraints.max_block_len and not len(constraints.blackout_index):
+        return list(windows)
+    return [window for window in windows if constraints.allows_window(window)]
+
+
+def generate_candidates(
+    days: Sequence[DayInfo] | DayGrid,
+    config: CandidateConfig,
+) -> list[CompactWindow]:
+    """Return PTO candidate windows seeded around holidays and weekends.
+
+    Grids share a cached enumeration, so requests that differ only in constraints
+    skip straight to the filter pass.
+    """
+
+    if isinstance(days, DayGrid):
+        windows = cached_windows(days)
+    else:
+        windows = enumerate_windows(DayGrid.from_days(days))
+    return filter_candidates(windows, config.constraints)
+
+
+def configure_candidate_cache(maxsize: int) -> None:
+    _window_cache.resize(maxsize)
+    _segment_cache.resize(maxsize * SEGMENTS_PER_GRID)
+
+
+def candidate_cache_stats() -> CacheStats:
+    return _window_cache.stats()
+
+
+def clear_candidate_cache() -> None:
+    """Drop every cached enumeration and month segment."""
+
+    _window_cache.invalidate()
+    _segment_cache.invalidate()
 
 
 __all__ = [
+    "BlackoutIndex",
     "CandidateConfig",
     "CandidateConstraints",
+    "cached_windows",
+    "candidate_cache_stats",
+    "clear_candidate_cache",
+    "configure_candidate_cache",
+    "enumerate_windows",
+    "filter_candidates",
     "generate_candidates",
 ]
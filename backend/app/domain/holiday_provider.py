@@ -2,7 +2,13 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Dict, Iterable, Mapping, Tuple
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, Mapping, Sequence, Tuple
+
+from ..core.cache import CacheStats, LRUCache
+from .holiday_rules import compute_holidays, supported_locales
+from .holiday_snapshot import HolidaySnapshot, HolidaySource
 
 FallbackCalendar = Mapping[Tuple[str, str | None, int], Dict[date, str]]
 
@@ -43,9 +49,58 @@ FALLBACK_HOLIDAYS: FallbackCalendar = {
 }
 
 
-def get_holidays(country: str, region: str | None, year: int) -> Dict[date, str]:
-    """Return a holiday mapping, preferring python-holidays when available."""
+HolidayKey = Tuple[str, str | None, int]
+
+HOLIDAY_CACHE_SIZE = 512
+
+# Holiday data never changes for a (country, region, year), so lookups are shared
+# process-wide. Values are read-only views so callers cannot corrupt the cache.
+_holiday_cache: LRUCache[HolidayKey, Mapping[date, str]] = LRUCache(HOLIDAY_CACHE_SIZE)
+_snapshot: HolidaySnapshot | None = None
+# Bumped whenever cached holiday data may have changed; derived caches key on it.
+_data_version = 0
+
+
+def holiday_data_version() -> int:
+    """Return a counter that changes whenever holiday data is invalidated or replaced."""
+
+    return _data_version
+
+
+def _bump_version() -> None:
+    global _data_version
+    _data_version += 1
+
+
+def use_holiday_snapshot(path: str | Path | None) -> HolidaySnapshot | None:
+    """Serve lookups from a compiled snapshot file, or stop using one when ``path`` is None.
+
+    A replaced snapshot is left to the garbage collector because callers may still
+    hold views into it.
+    """
 
+    global _snapshot
+    _snapshot = HolidaySnapshot(path) if path else None
+    _holiday_cache.invalidate()
+    _bump_version()
+    return _snapshot
+
+
+def load_holidays(country: str, region: str | None, year: int) -> Mapping[date, str]:
+    """Build a holiday mapping from the first source that knows the locale.
+
+    Sources are tried in order: the compiled snapshot (zero-copy views), the built-in
+    rule engine, python-holidays and finally the fallback table. The first two never
+    import python-holidays.
+    """
+
+    if _snapshot is not None:
+        found = _snapshot.lookup(country, region, year)
+        if found is not None:
+            return found
+    computed = compute_holidays(country, region, year)
+    if computed is not None:
+        return computed
     try:
         import holidays  # type: ignore
 
@@ -55,4 +110,94 @@ def get_holidays(country: str, region: str | None, year: int) -> Dict[date, str]
         return dict(FALLBACK_HOLIDAYS.get((country, region, year), {}))
 
 
-__all__ = ["get_holidays"]
+def get_holidays(country: str, region: str | None, year: int) -> Mapping[date, str]:
+    """Return a cached, read-only holiday mapping for the locale and year."""
+
+    return _holiday_cache.get_or_create(
+        (country, region, year),
+        lambda: _read_only(load_holidays(country, region, year)),
+    )
+
+
+def _read_only(holidays: Mapping[date, str]) -> Mapping[date, str]:
+    return MappingProxyType(holidays) if isinstance(holidays, dict) else holidays
+
+
+def invalidate_holidays(
+    country: str | None = None,
+    region: str | None = None,
+    year: int | None = None,
+) -> int:
+    """Evict cached holidays matching every given filter; return the number dropped."""
+
+    _bump_version()
+    if country is None and region is None and year is None:
+        return _holiday_cache.invalidate()
+    return _holiday_cache.invalidate(
+        lambda key: (country is None or key[0] == country)
+        and (region is None or key[1] == region)
+        and (year is None or key[2] == year)
+    )
+
+
+def configure_holiday_cache(maxsize: int) -> None:
+    """Change the number of (country, region, year) entries kept in memory."""
+
+    _holiday_cache.resize(maxsize)
+
+
+def holiday_cache_stats() -> CacheStats:
+    return _holiday_cache.stats()
+
+
+def fallback_source(years: range) -> Iterator[tuple[str, str | None, int, Mapping[date, str]]]:
+    """Snapshot source yielding the built-in ``FALLBACK_HOLIDAYS`` table."""
+
+    for (country, region, year), holidays in FALLBACK_HOLIDAYS.items():
+        if year in years:
+            yield country, region, year, holidays
+
+
+def rules_source(years: range) -> Iterator[tuple[str, str | None, int, Mapping[date, str]]]:
+    """Snapshot source computing every locale known to the rule engine."""
+
+    for country, region in supported_locales():
+        for year in years:
+            holidays = compute_holidays(country, region, year)
+            if holidays is not None:
+                yield country, region, year, holidays
+
+
+def python_holidays_source(years: range) -> Iterator[tuple[str, str | None, int, Mapping[date, str]]]:
+    """Snapshot source compiling every python-holidays country and subdivision."""
+
+    try:
+        import holidays  # type: ignore
+    except ModuleNotFoundError:
+        return
+    for country, subdivisions in holidays.list_supported_countries().items():
+        for subdivision in [None, *subdivisions]:
+            region = None
+            if subdivision:
+                region = subdivision if "-" in subdivision else f"{country}-{subdivision}"
+            for year in years:
+                calendar = holidays.country_holidays(country=country, subdiv=subdivision, years=year, observed=True)
+                yield country, region, year, dict(calendar.items())
+
+
+def snapshot_sources() -> Sequence[HolidaySource]:
+    """Sources compiled into a snapshot, highest priority first."""
+
+    return (rules_source, python_holidays_source, fallback_source)
+
+
+__all__ = [
+    "configure_holiday_cache",
+    "get_holidays",
+    "holiday_cache_stats",
+    "holiday_data_version",
+    "invalidate_holidays",
+    "load_holidays",
+    "snapshot_sources",
+    "use_holiday_snapshot",
+]
@@ -0,0 +1,515 @@
+"""Rule-based public holiday engine for the locales the planner supports natively.
+
+Holidays are described as small rules (fixed dates, nth weekdays, Easter offsets)
+plus an observance policy for those falling on a weekend, so any year can be
+computed without python-holidays. Regions use the same ``CC-SUB`` codes as
+``LocaleRequest.normalize``.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from enum import Enum
+from typing import Dict, Iterator, Mapping
+
+MON, TUE, WED, THU, FRI, SAT, SUN = range(7)
+
+
+class Observance(str, Enum):
+    """How a holiday falling on a weekend is moved to a workday."""
+
+    NONE = "none"
+    # Saturday to Friday, Sunday to Monday (US federal practice).
+    NEAREST_WEEKDAY = "nearest_weekday"
+    # Next weekday not already a holiday, so Christmas and Boxing Day stack.
+    NEXT_FREE_WEEKDAY = "next_free_weekday"
+    # Sunday to Monday only.
+    SUNDAY_TO_MONDAY = "sunday_to_monday"
+
+
+def easter_sunday(year: int) -> date:
+    """Gregorian Easter Sunday (anonymous Gregorian algorithm)."""
+
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7  # noqa: E741
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+@dataclass(slots=True, frozen=True)
+class Fixed:
+    month: int
+    day: int
+
+    def resolve(self, year: int) -> date:
+        return date(year, self.month, self.day)
+
+
+@dataclass(slots=True, frozen=True)
+class NthWeekday:
+    """The ``n``-th ``weekday`` of a month (``n=-1`` is the last), plus ``offset`` days."""
+
+    month: int
+    weekday: int
+    n: int
+    offset: int = 0
+
+    def resolve(self, year: int) -> date:
+        if self.n > 0:
+            first = date(year, self.month, 1)
+            day = first + timedelta(days=(self.weekday - first.weekday()) % 7 + 7 * (self.n - 1))
+        else:
+            following = date(year + self.month // 12, self.month % 12 + 1, 1)
+            last = following - timedelta(days=1)
+            day = last - timedelta(days=(last.weekday() - self.weekday) % 7 + 7 * (-self.n - 1))
+        return day + timedelta(days=self.offset)
+
+
+@dataclass(slots=True, frozen=True)
+class WeekdayBefore:
+    """The last ``weekday`` strictly before ``month``/``day`` (e.g. Victoria Day)."""
+
+    month: int
+    day: int
+    weekday: int
+
+    def resolve(self, year: int) -> date:
+        anchor = date(year, self.month, self.day) - timedelta(days=1)
+        return anchor - timedelta(days=(anchor.weekday() - self.weekday) % 7)
+
+
+@dataclass(slots=True, frozen=True)
+class WeekdayOnOrAfter:
+    month: int
+    day: int
+    weekday: int
+
+    def resolve(self, year: int) -> date:
+        anchor = date(year, self.month, self.day)
+        return anchor + timedelta(days=(self.weekday - anchor.weekday()) % 7)
+
+
+@dataclass(slots=True, frozen=True)
+class EasterOffset:
+    days: int
+
+    def resolve(self, year: int) -> date:
+        return easter_sunday(year) + timedelta(days=self.days)
+
+
+Anchor = Fixed | NthWeekday | WeekdayBefore | WeekdayOnOrAfter | EasterOffset
+NEW_YEARS_DAY = Fixed(1, 1)
+
+
+@dataclass(slots=True, frozen=True)
+class HolidayRule:
+    name: str
+    anchor: Anchor
+    observance: Observance = Observance.NONE
+    since: int | None = None
+    until: int | None = None
+    renamed: tuple[tuple[int, str], ...] = ()
+
+    def applies(self, year: int) -> bool:
+        return (self.since is None or year >= self.since) and (self.until is None or year <= self.until)
+
+    def label(self, year: int) -> str:
+        name = self.name
+        for first_year, new_name in self.renamed:
+            if year >= first_year:
+                name = new_name
+        return name
+
+
+@dataclass(slots=True, frozen=True)
+class HolidaySet:
+    """Rules for a country plus per-subdivision additions."""
+
+    national: tuple[HolidayRule, ...]
+    subdivisions: Mapping[str, tuple[HolidayRule, ...]]
+    # One-off dates such as jubilees, keyed by region (None for nationwide).
+    specials: Mapping[str | None, Mapping[date, str]]
+    # Rules from ``national`` whose dates move for a specific year.
+    moved: Mapping[tuple[str, int], date]
+
+
+_SUB = Observance.NEXT_FREE_WEEKDAY
+_NEAREST = Observance.NEAREST_WEEKDAY
+_SUNDAY = Observance.SUNDAY_TO_MONDAY
+
+_CA_VICTORIA = HolidayRule("Victoria Day", WeekdayBefore(5, 25, MON))
+_CA_THANKSGIVING = HolidayRule("Thanksgiving", NthWeekday(10, MON, 2))
+_CA_BOXING = HolidayRule("Boxing Day", Fixed(12, 26), _SUB)
+_CA_REMEMBRANCE = HolidayRule("Remembrance Day", Fixed(11, 11), _SUNDAY)
+_CA_CIVIC = HolidayRule("Civic Holiday", NthWeekday(8, MON, 1))
+_CA_TRUTH = HolidayRule("National Day for Truth and Reconciliation", Fixed(9, 30), _SUB, since=2021)
+_CA_INDIGENOUS = HolidayRule("National Indigenous Peoples Day", Fixed(6, 21), _SUB, since=2017)
+
+CANADA = HolidaySet(
+    national=(
+        HolidayRule("New Year's Day", NEW_YEARS_DAY, _SUB),
+        HolidayRule("Good Friday", EasterOffset(-2)),
+        HolidayRule("Canada Day", Fixed(7, 1), _SUB),
+        HolidayRule("Labour Day", NthWeekday(9, MON, 1)),
+        HolidayRule("Christmas Day", Fixed(12, 25), _SUB),
+    ),
+    subdivisions={
+        "CA-AB": (
+            HolidayRule("Family Day", NthWeekday(2, MON, 3), since=1990),
+            _CA_VICTORIA,
+            HolidayRule("Heritage Day", NthWeekday(8, MON, 1)),
+            _CA_THANKSGIVING,
+            _CA_REMEMBRANCE,
+            _CA_BOXING,
+        ),
+        "CA-BC": (
+            HolidayRule("Family Day", NthWeekday(2, MON, 3), since=2013),
+            _CA_VICTORIA,
+            HolidayRule("British Columbia Day", NthWeekday(8, MON, 1)),
+            _CA_TRUTH,
+            _CA_THANKSGIVING,
+            _CA_REMEMBRANCE,
+        ),
+        "CA-MB": (
+            HolidayRule("Louis Riel Day", NthWeekday(2, MON, 3), since=2008),
+            _CA_VICTORIA,
+            HolidayRule("Terry Fox Day", NthWeekday(8, MON, 1)),
+            _CA_TRUTH,
+            _CA_THANKSGIVING,
+            _CA_REMEMBRANCE,
+        ),
+        "CA-NB": (
+            HolidayRule("Family Day", NthWeekday(2, MON, 3), since=2018),
+            _CA_VICTORIA,
+            HolidayRule("New Brunswick Day", NthWeekday(8, MON, 1)),
+            _CA_REMEMBRANCE,
+            _CA_BOXING,
+        ),
+        "CA-NL": (
+            HolidayRule("St. Patrick's Day", WeekdayBefore(3, 21, MON)),
+            HolidayRule("Orangemen's Day", WeekdayBefore(7, 16, MON)),
+            _CA_REMEMBRANCE,
+            _CA_BOXING,
+        ),
+        "CA-NS": (
+            HolidayRule("Heritage Day", NthWeekday(2, MON, 3), since=2015),
+            _CA_REMEMBRANCE,
+            _CA_BOXING,
+        ),
+        "CA-NT": (_CA_VICTORIA, _CA_INDIGENOUS, _CA_CIVIC, _CA_TRUTH, _CA_THANKSGIVING, _CA_REMEMBRANCE),
+        "CA-NU": (
+            _CA_VICTORIA,
+            HolidayRule("Nunavut Day", Fixed(7, 9), _SUB),
+            _CA_CIVIC,
+            _CA_THANKSGIVING,
+            _CA_REMEMBRANCE,
+        ),
+        "CA-ON": (
+            HolidayRule("Family Day", NthWeekday(2, MON, 3), since=2008),
+            _CA_VICTORIA,
+            _CA_THANKSGIVING,
+            _CA_BOXING,
+        ),
+        "CA-PE": (
+            HolidayRule("Islander Day", NthWeekday(2, MON, 3), since=2009),
+            _CA_TRUTH,
+            _CA_REMEMBRANCE,
+            _CA_BOXING,
+        ),
+        "CA-QC": (
+            HolidayRule("National Patriots' Day", WeekdayBefore(5, 25, MON)),
+            HolidayRule("Saint-Jean-Baptiste Day", Fixed(6, 24), _SUNDAY),
+            _CA_THANKSGIVING,
+        ),
+        "CA-SK": (
+            HolidayRule("Family Day", NthWeekday(2, MON, 3), since=2007),
+            _CA_VICTORIA,
+            HolidayRule("Saskatchewan Day", NthWeekday(8, MON, 1)),
+            _CA_THANKSGIVING,
+            _CA_REMEMBRANCE,
+        ),
+        "CA-YT": (
+            _CA_VICTORIA,
+            _CA_INDIGENOUS,
+            HolidayRule("Discovery Day", NthWeekday(8, MON, 3)),
+            _CA_TRUTH,
+            _CA_THANKSGIVING,
+            _CA_REMEMBRANCE,
+        ),
+    },
+    specials={},
+    moved={},
+)
+
+_US_DAY_AFTER_THANKSGIVING = HolidayRule("Day After Thanksgiving", NthWeekday(11, THU, 4, offset=1))
+_US_GOOD_FRIDAY = HolidayRule("Good Friday", EasterOffset(-2))
+_US_LINCOLN = HolidayRule("Lincoln's Birthday", Fixed(2, 12), _NEAREST)
+_US_PATRIOTS = HolidayRule("Patriots' Day", NthWeekday(4, MON, 3))
+_US_STATES = (
+    "AK", "AL", "AR", "AZ", "CA", "CO", "CT", "DC", "DE", "FL", "GA", "HI", "IA", "ID", "IL", "IN", "KS",
+    "KY", "LA", "MA", "MD", "ME", "MI", "MN", "MO", "MS", "MT", "NC", "ND", "NE", "NH", "NJ", "NM", "NV",
+    "NY", "OH", "OK", "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VA", "VT", "WA", "WI", "WV", "WY",
+)
+_US_STATE_RULES: Mapping[str, tuple[HolidayRule, ...]] = {
+    "AK": (
+        HolidayRule("Seward's Day", NthWeekday(3, MON, -1)),
+        HolidayRule("Alaska Day", Fixed(10, 18), _NEAREST),
+    ),
+    "CA": (HolidayRule("Cesar Chavez Day", Fixed(3, 31), _NEAREST), _US_DAY_AFTER_THANKSGIVING),
+    "CT": (_US_LINCOLN, _US_GOOD_FRIDAY),
+    "DC": (HolidayRule("Emancipation Day", Fixed(4, 16), _NEAREST),),
+    "HI": (
+        HolidayRule("Prince Jonah Kuhio Kalanianaole Day", Fixed(3, 26), _NEAREST),
+        _US_GOOD_FRIDAY,
+        HolidayRule("Kamehameha Day", Fixed(6, 11), _NEAREST),
+        HolidayRule("Statehood Day", NthWeekday(8, FRI, 3)),
+    ),
+    "IL": (_US_LINCOLN, _US_DAY_AFTER_THANKSGIVING),
+    "LA": (HolidayRule("Mardi Gras", EasterOffset(-47)), _US_GOOD_FRIDAY),
+    "MA": (_US_PATRIOTS,),
+    "ME": (_US_PATRIOTS,),
+    "NV": (
+        HolidayRule("Nevada Day", NthWeekday(10, FRI, -1)),
+        HolidayRule("Family Day", NthWeekday(11, THU, 4, offset=1)),
+    ),
+    "NY": (_US_LINCOLN,),
+    "TX": (
+        HolidayRule("Texas Independence Day", Fixed(3, 2)),
+        HolidayRule("San Jacinto Day", Fixed(4, 21)),
+        _US_DAY_AFTER_THANKSGIVING,
+    ),
+    "UT": (HolidayRule("Pioneer Day", Fixed(7, 24), _NEAREST),),
+    "VT": (
+        HolidayRule("Town Meeting Day", NthWeekday(3, TUE, 1)),
+        HolidayRule("Bennington Battle Day", Fixed(8, 16), _NEAREST),
+    ),
+    "WA": (_US_DAY_AFTER_THANKSGIVING,),
+}
+
+UNITED_STATES = HolidaySet(
+    national=(
+        HolidayRule("New Year's Day", NEW_YEARS_DAY, _NEAREST),
+        HolidayRule("Martin Luther King Jr. Day", NthWeekday(1, MON, 3), since=1986),
+        HolidayRule("Washington's Birthday", NthWeekday(2, MON, 3)),
+        HolidayRule("Memorial Day", NthWeekday(5, MON, -1)),
+        HolidayRule("Juneteenth National Independence Day", Fixed(6, 19), _NEAREST, since=2021),
+        HolidayRule("Independence Day", Fixed(7, 4), _NEAREST),
+        HolidayRule("Labor Day", NthWeekday(9, MON, 1)),
+        HolidayRule("Columbus Day", NthWeekday(10, MON, 2)),
+        HolidayRule("Veterans Day", Fixed(11, 11), _NEAREST),
+        HolidayRule("Thanksgiving Day", NthWeekday(11, THU, 4)),
+        HolidayRule("Christmas Day", Fixed(12, 25), _NEAREST),
+    ),
+    subdivisions={f"US-{state}": _US_STATE_RULES.get(state, ()) for state in _US_STATES},
+    specials={},
+    moved={},
+)
+
+_GB_EASTER_MONDAY = HolidayRule("Easter Monday", EasterOffset(1))
+_GB_SUMMER = HolidayRule("Summer Bank Holiday", NthWeekday(8, MON, -1))
+
+UNITED_KINGDOM = HolidaySet(
+    national=(
+        HolidayRule("New Year's Day", NEW_YEARS_DAY, _SUB),
+        HolidayRule("Good Friday", EasterOffset(-2)),
+        HolidayRule("Early May Bank Holiday", NthWeekday(5, MON, 1)),
+        HolidayRule("Spring Bank Holiday", NthWeekday(5, MON, -1)),
+        HolidayRule("Christmas Day", Fixed(12, 25), _SUB),
+        HolidayRule("Boxing Day", Fixed(12, 26), _SUB),
+    ),
+    subdivisions={
+        "GB-ENG": (_GB_EASTER_MONDAY, _GB_SUMMER),
+        "GB-WLS": (_GB_EASTER_MONDAY, _GB_SUMMER),
+        "GB-NIR": (
+            HolidayRule("Saint Patrick's Day", Fixed(3, 17), _SUB),
+            _GB_EASTER_MONDAY,
+            HolidayRule("Battle of the Boyne", Fixed(7, 12), _SUB),
+            _GB_SUMMER,
+        ),
+        "GB-SCT": (
+            HolidayRule("New Year Holiday", Fixed(1, 2), _SUB),
+            HolidayRule("Summer Bank Holiday", NthWeekday(8, MON, 1)),
+            HolidayRule("Saint Andrew's Day", Fixed(11, 30), _SUB, since=2007),
+        ),
+    },
+    specials={
+        None: {
+            date(2011, 4, 29): "Wedding of Prince William and Catherine Middleton",
+            date(2012, 6, 5): "Diamond Jubilee of Elizabeth II",
+            date(2022, 6, 3): "Platinum Jubilee of Elizabeth II",
+            date(2022, 9, 19): "State Funeral of Queen Elizabeth II",
+            date(2023, 5, 8): "Coronation of Charles III",
+        },
+    },
+    moved={
+        ("Early May Bank Holiday", 1995): date(1995, 5, 8),
+        ("Early May Bank Holiday", 2020): date(2020, 5, 8),
+        ("Spring Bank Holiday", 2002): date(2002, 6, 4),
+        ("Spring Bank Holiday", 2012): date(2012, 6, 4),
+        ("Spring Bank Holiday", 2022): date(2022, 6, 2),
+    },
+)
+
+_AU_EASTER_SATURDAY = HolidayRule("Easter Saturday", EasterOffset(-1))
+_AU_EASTER_SUNDAY = HolidayRule("Easter Sunday", EasterOffset(0))
+
+
+def _sovereign_birthday(anchor: Anchor) -> HolidayRule:
+    return HolidayRule("Queen's Birthday", anchor, renamed=((2023, "King's Birthday"),))
+
+
+AUSTRALIA = HolidaySet(
+    national=(
+        HolidayRule("New Year's Day", NEW_YEARS_DAY, _SUB),
+        HolidayRule("Australia Day", Fixed(1, 26), _SUB),
+        HolidayRule("Good Friday", EasterOffset(-2)),
+        HolidayRule("Easter Monday", EasterOffset(1)),
+        HolidayRule("ANZAC Day", Fixed(4, 25)),
+        HolidayRule("Christmas Day", Fixed(12, 25), _SUB),
+        HolidayRule("Boxing Day", Fixed(12, 26), _SUB),
+    ),
+    subdivisions={
+        "AU-ACT": (
+            HolidayRule("Canberra Day", NthWeekday(3, MON, 2)),
+            _AU_EASTER_SATURDAY,
+            _AU_EASTER_SUNDAY,
+            HolidayRule("Reconciliation Day", WeekdayOnOrAfter(5, 27, MON), since=2018),
+            _sovereign_birthday(NthWeekday(6, MON, 2)),
+            HolidayRule("Labour Day", NthWeekday(10, MON, 1)),
+        ),
+        "AU-NSW": (
+            _AU_EASTER_SATURDAY,
+            _AU_EASTER_SUNDAY,
+            _sovereign_birthday(NthWeekday(6, MON, 2)),
+            HolidayRule("Labour Day", NthWeekday(10, MON, 1)),
+        ),
+        "AU-NT": (
+            _AU_EASTER_SATURDAY,
+            HolidayRule("May Day", NthWeekday(5, MON, 1)),
+            _sovereign_birthday(NthWeekday(6, MON, 2)),
+            HolidayRule("Picnic Day", NthWeekday(8, MON, 1)),
+        ),
+        "AU-QLD": (
+            _AU_EASTER_SATURDAY,
+            _AU_EASTER_SUNDAY,
+            HolidayRule("Labour Day", NthWeekday(5, MON, 1)),
+            _sovereign_birthday(NthWeekday(10, MON, 1)),
+        ),
+        "AU-SA": (
+            HolidayRule("Adelaide Cup Day", NthWeekday(3, MON, 2)),
+            _AU_EASTER_SATURDAY,
+            _sovereign_birthday(NthWeekday(6, MON, 2)),
+            HolidayRule("Labour Day", NthWeekday(10, MON, 1)),
+        ),
+        "AU-TAS": (
+            HolidayRule("Eight Hours Day", NthWeekday(3, MON, 2)),
+            _sovereign_birthday(NthWeekday(6, MON, 2)),
+        ),
+        "AU-VIC": (
+            HolidayRule("Labour Day", NthWeekday(3, MON, 2)),
+            _AU_EASTER_SATURDAY,
+            _AU_EASTER_SUNDAY,
+            _sovereign_birthday(NthWeekday(6, MON, 2)),
+            HolidayRule("Melbourne Cup Day", NthWeekday(11, TUE, 1)),
+        ),
+        "AU-WA": (
+            HolidayRule("Labour Day", NthWeekday(3, MON, 1)),
+            HolidayRule("Western Australia Day", NthWeekday(6, MON, 1)),
+            _sovereign_birthday(NthWeekday(9, MON, -1)),
+        ),
+    },
+    specials={None: {date(2022, 9, 22): "National Day of Mourning for Queen Elizabeth II"}},
+    moved={},
+)
+
+HOLIDAY_SETS: Mapping[str, HolidaySet] = {
+    "AU": AUSTRALIA,
+    "CA": CANADA,
+    "GB": UNITED_KINGDOM,
+    "US": UNITED_STATES,
+}
+
+
+def supported_locales() -> Iterator[tuple[str, str | None]]:
+    """Yield every (country, region) the rule engine can compute."""
+
+    for country, holiday_set in HOLIDAY_SETS.items():
+        yield country, None
+        for region in holiday_set.subdivisions:
+            yield country, region
+
+
+def _observed(day: date, observance: Observance, taken: set[date]) -> date | None:
+    weekday = day.weekday()
+    if weekday < SAT or observance == Observance.NONE:
+        return None
+    if observance == Observance.NEAREST_WEEKDAY:
+        return day - timedelta(days=1) if weekday == SAT else day + timedelta(days=1)
+    if observance == Observance.SUNDAY_TO_MONDAY:
+        return day + timedelta(days=1) if weekday == SUN else None
+    shifted = day + timedelta(days=7 - weekday)
+    while shifted in taken or shifted.weekday() >= SAT:
+        shifted += timedelta(days=1)
+    return shifted
+
+
+def _rules_for(holiday_set: HolidaySet, region: str | None) -> tuple[HolidayRule, ...] | None:
+    if region is None:
+        return holiday_set.national
+    extra = holiday_set.subdivisions.get(region)
+    if extra is None:
+        return None
+    return holiday_set.national + extra
+
+
+def _resolve(holiday_set: HolidaySet, rules: tuple[HolidayRule, ...], year: int) -> list[tuple[date, HolidayRule]]:
+    resolved: list[tuple[date, HolidayRule]] = []
+    for rule in rules:
+        if rule.applies(year):
+            resolved.append((holiday_set.moved.get((rule.name, year)) or rule.anchor.resolve(year), rule))
+    resolved.sort(key=lambda item: item[0])
+    return resolved
+
+
+def compute_holidays(country: str, region: str | None, year: int) -> Dict[date, str] | None:
+    """Return the observed holidays for a locale, or None if it has no rules."""
+
+    holiday_set = HOLIDAY_SETS.get(country)
+    if holiday_set is None:
+        return None
+    rules = _rules_for(holiday_set, region)
+    if rules is None:
+        return None
+
+    resolved = _resolve(holiday_set, rules, year)
+    result: Dict[date, str] = {}
+    for day, rule in resolved:
+        result.setdefault(day, rule.label(year))
+    for special_region in (None, region):
+        for day, name in holiday_set.specials.get(special_region, {}).items():
+            if day.year == year:
+                result.setdefault(day, name)
+
+    taken = set(result)
+    for day, rule in resolved:
+        observed = _observed(day, rule.observance, taken)
+        if observed is not None and observed.year == year and observed not in result:
+            result[observed] = f"{rule.label(year)} (observed)"
+            taken.add(observed)
+    # A Saturday New Year's Day is observed on the last Friday of the previous year.
+    for rule in rules:
+        if rule.observance == Observance.NEAREST_WEEKDAY and rule.anchor == NEW_YEARS_DAY and rule.applies(year + 1):
+            observed = _observed(NEW_YEARS_DAY.resolve(year + 1), rule.observance, taken)
+            if observed is not None and observed.year == year:
+                result.setdefault(observed, f"{rule.label(year + 1)} (observed)")
+    return dict(sorted(result.items()))
+
+
+__all__ = ["HOLIDAY_SETS", "Observance", "compute_holidays", "easter_sunday", "supported_locales"]
@@ -0,0 +1,236 @@
+"""Compact, memory-mapped holiday snapshots compiled ahead of time.
+
+A snapshot stores every (country, region, year) holiday list in one binary file so
+that worker processes can share its pages through ``mmap`` and answer lookups
+without importing python-holidays. Layout (little-endian)::
+
+    header   magic, string count, entry count, strings/entries/records offsets
+    strings  (count + 1) u32 offsets followed by the UTF-8 string blob
+    entries  locale string id, year, first record, record count (sorted)
+    records  date ordinal, holiday name string id (sorted by ordinal per entry)
+
+Build one with ``python -m backend.app.domain.holiday_snapshot OUT --years 2020:2035``.
+"""
+from __future__ import annotations
+
+import argparse
+import mmap
+import struct
+from datetime import date
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Mapping, Sequence, Tuple
+
+MAGIC = b"MDOHOL01"
+_HEADER = struct.Struct("<8sIIIII")
+_OFFSET = struct.Struct("<I")
+_ENTRY = struct.Struct("<IHHII")
+_RECORD = struct.Struct("<II")
+
+SnapshotKey = Tuple[str, str | None, int]
+HolidaySource = Callable[[range], Iterable[Tuple[str, str | None, int, Mapping[date, str]]]]
+
+
+def _locale_label(country: str, region: str | None) -> str:
+    return f"{country}|{region or ''}"
+
+
+class SnapshotHolidays(Mapping[date, str]):
+    """Read-only view of one locale/year inside a snapshot buffer.
+
+    Records are decoded straight from the shared buffer on access; nothing is
+    copied when the view is created.
+    """
+
+    __slots__ = ("_buffer", "_names", "_offset", "_count")
+
+    def __init__(self, buffer: memoryview, names: Sequence[str], offset: int, count: int) -> None:
+        self._buffer = buffer
+        self._names = names
+        self._offset = offset
+        self._count = count
+
+    def _ordinal(self, index: int) -> int:
+        return _RECORD.unpack_from(self._buffer, self._offset + index * _RECORD.size)[0]
+
+    def _find(self, key: object) -> int:
+        if not isinstance(key, date):
+            return -1
+        target = key.toordinal()
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._ordinal(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self._ordinal(lo) == target:
+            return lo
+        return -1
+
+    def __getitem__(self, key: date) -> str:
+        index = self._find(key)
+        if index < 0:
+            raise KeyError(key)
+        _ordinal, name_id = _RECORD.unpack_from(self._buffer, self._offset + index * _RECORD.size)
+        return self._names[name_id]
+
+    def __contains__(self, key: object) -> bool:
+        return self._find(key) >= 0
+
+    def __iter__(self) -> Iterator[date]:
+        for ordinal, _name_id in _RECORD.iter_unpack(
+            self._buffer[self._offset : self._offset + self._count * _RECORD.size]
+        ):
+            yield date.fromordinal(ordinal)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def items(self) -> Iterator[tuple[date, str]]:  # type: ignore[override]
+        names = self._names
+        for ordinal, name_id in _RECORD.iter_unpack(
+            self._buffer[self._offset : self._offset + self._count * _RECORD.size]
+        ):
+            yield date.fromordinal(ordinal), names[name_id]
+
+
+class HolidaySnapshot:
+    """Memory-mapped snapshot file answering holiday lookups without copying."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+        magic, string_count, entry_count, strings_at, entries_at, records_at = _HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a holiday snapshot")
+
+        blob_at = strings_at + (string_count + 1) * _OFFSET.size
+        bounds = [
+            _OFFSET.unpack_from(self._buffer, strings_at + idx * _OFFSET.size)[0] for idx in range(string_count + 1)
+        ]
+        self._strings = [
+            str(self._buffer[blob_at + start : blob_at + end], "utf-8") for start, end in zip(bounds, bounds[1:])
+        ]
+
+        self._entries: dict[SnapshotKey, tuple[int, int]] = {}
+        years: list[int] = []
+        for idx in range(entry_count):
+            label_id, year, _reserved, first, count = _ENTRY.unpack_from(self._buffer, entries_at + idx * _ENTRY.size)
+            country, _sep, region = self._strings[label_id].partition("|")
+            self._entries[(country, region or None, year)] = (records_at + first * _RECORD.size, count)
+            years.append(year)
+        self.years = range(min(years), max(years) + 1) if years else range(0)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def keys(self) -> Iterable[SnapshotKey]:
+        return self._entries.keys()
+
+    def lookup(self, country: str, region: str | None, year: int) -> Mapping[date, str] | None:
+        """Return the holidays for a locale, or None when the snapshot lacks it."""
+
+        found = self._entries.get((country, region, year))
+        if found is None:
+            return None
+        offset, count = found
+        return SnapshotHolidays(self._buffer, self._strings, offset, count)
+
+    def close(self) -> None:
+        """Unmap the file; views handed out by ``lookup`` must no longer be used."""
+
+        self._buffer.release()
+        self._mmap.close()
+
+
+def write_snapshot(path: str | Path, calendars: Mapping[SnapshotKey, Mapping[date, str]]) -> int:
+    """Serialize ``calendars`` into a snapshot file; return the number of entries."""
+
+    strings: list[str] = []
+    string_ids: dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        if value not in string_ids:
+            string_ids[value] = len(strings)
+            strings.append(value)
+        return string_ids[value]
+
+    entries = bytearray()
+    records = bytearray()
+    record_count = 0
+    ordered_keys = sorted(calendars, key=lambda key: (key[0], key[1] or "", key[2]))
+    for key in ordered_keys:
+        country, region, year = key
+        holidays = calendars[key]
+        label_id = intern(_locale_label(country, region))
+        ordered = sorted(holidays.items())
+        entries += _ENTRY.pack(label_id, year, 0, record_count, len(ordered))
+        for holiday_date, name in ordered:
+            records += _RECORD.pack(holiday_date.toordinal(), intern(name))
+        record_count += len(ordered)
+
+    encoded = [value.encode("utf-8") for value in strings]
+    offsets = bytearray()
+    position = 0
+    for chunk in [b"", *encoded]:
+        position += len(chunk)
+        offsets += _OFFSET.pack(position)
+    blob = b"".join(encoded)
+
+    strings_at = _HEADER.size
+    entries_at = strings_at + len(offsets) + len(blob)
+    entries_at += -entries_at % 4
+    records_at = entries_at + len(entries)
+    header = _HEADER.pack(MAGIC, len(strings), len(calendars), strings_at, entries_at, records_at)
+    padding = b"\0" * (entries_at - strings_at - len(offsets) - len(blob))
+
+    target = Path(path)
+    staging = target.with_suffix(target.suffix + ".tmp")
+    staging.write_bytes(header + offsets + blob + padding + entries + records)
+    staging.replace(target)
+    return len(calendars)
+
+
+def compile_snapshot(path: str | Path, years: range, sources: Sequence[HolidaySource]) -> int:
+    """Collect holidays from ``sources`` (highest priority first) and write a snapshot."""
+
+    calendars: dict[SnapshotKey, Mapping[date, str]] = {}
+    for source in sources:
+        for country, region, year, holidays in source(years):
+            calendars.setdefault((country, region, year), holidays)
+    return write_snapshot(path, calendars)
+
+
+def _parse_years(value: str) -> range:
+    first, _sep, last = value.partition(":")
+    return range(int(first), int(last or first) + 1)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    from .holiday_provider import snapshot_sources
+
+    parser = argparse.ArgumentParser(description="Compile a holiday snapshot for get_holidays.")
+    parser.add_argument("output", help="Path of the snapshot file to write")
+    this_year = date.today().year
+    parser.add_argument(
+        "--years",
+        type=_parse_years,
+        default=range(this_year - 1, this_year + 6),
+        help="Inclusive year span such as 2020:2035",
+    )
+    args = parser.parse_args(argv)
+    count = compile_snapshot(args.output, args.years, snapshot_sources())
+    print(f"Wrote {count} locale-years to {args.output}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
+
+
+__all__ = ["HolidaySnapshot", "SnapshotHolidays", "compile_snapshot", "write_snapshot"]
@@ -13,6 +13,16 @@ class DayType(str, Enum):
     WEEKEND = "weekend"
 
 
+def quarter_bit_for(day: date) -> int:
+    """Return the bit of the calendar quarter containing ``day``.
+
+    Bits are keyed by year and quarter, so Q1 of consecutive years are different
+    quarters; years wrap every eight, which no planning horizon comes close to.
+    """
+
+    return 1 << ((day.year % 8) * 4 + (day.month - 1) // 3)
+
+
 @dataclass(slots=True, frozen=True)
 class DayInfo:
     day: date
@@ -33,6 +43,112 @@ class CandidateWindow:
     def overlaps(self, other: "CandidateWindow") -> bool:
         return not (self.end < other.start or self.start > other.end)
 
+    @property
+    def first(self) -> int:
+        return self.start.toordinal()
+
+    @property
+    def last(self) -> int:
+        return self.end.toordinal()
+
+    @property
+    def quarter(self) -> int:
+        """Bit of the quarter the window starts in; see ``quarter_bit_for``."""
+
+        return quarter_bit_for(self.start)
+
+    @property
+    def pto_by_month(self) -> tuple[tuple[int, int], ...]:
+        counts: dict[int, int] = {}
+        for day in self.workdays:
+            counts[day.month] = counts.get(day.month, 0) + 1
+        return tuple(counts.items())
+
+
+def _mask_days(first: int, mask: int) -> tuple[date, ...]:
+    days: list[date] = []
+    while mask:
+        low = mask & -mask
+        days.append(date.fromordinal(first + low.bit_length() - 1))
+        mask ^= low
+    return tuple(days)
+
+
+@dataclass(slots=True, frozen=True)
+class CompactWindow:
+    """Planning-core form of a ``CandidateWindow``: ordinals and day bitmasks.
+
+    ``first`` and ``last`` are ``date.toordinal()`` values; bit ``i`` of a mask marks
+    the day ``first + i``. Dates are only rebuilt, through the properties, when a plan
+    is rendered.
+    """
+
+    first: int
+    last: int
+    pto_needed: int
+    off_streak: int
+    workday_mask: int
+    holiday_mask: int
+    weekend_mask: int
+    quarter: int
+    pto_by_month: tuple[tuple[int, int], ...]
+
+    @classmethod
+    def from_window(cls, window: CandidateWindow) -> CompactWindow:
+        first = window.start.toordinal()
+
+        def mask(days: Sequence[date]) -> int:
+            bits = 0
+            for day in days:
+                bits |= 1 << (day.toordinal() - first)
+            return bits
+
+        return cls(
+            first=first,
+            last=window.end.toordinal(),
+            pto_needed=window.pto_needed,
+            off_streak=window.off_streak,
+            workday_mask=mask(window.workdays),
+            holiday_mask=mask(window.holidays),
+            weekend_mask=mask(window.weekends),
+            quarter=window.quarter,
+            pto_by_month=window.pto_by_month,
+        )
+
+    @property
+    def start(self) -> date:
+        return date.fromordinal(self.first)
+
+    @property
+    def end(self) -> date:
+        return date.fromordinal(self.last)
+
+    @property
+    def workdays(self) -> tuple[date, ...]:
+        return _mask_days(self.first, self.workday_mask)
+
+    @property
+    def holidays(self) -> tuple[date, ...]:
+        return _mask_days(self.first, self.holiday_mask)
+
+    @property
+    def weekends(self) -> tuple[date, ...]:
+        return _mask_days(self.first, self.weekend_mask)
+
+    def overlaps(self, other: CompactWindow) -> bool:
+        return not (self.last < other.first or self.first > other.last)
+
+    def to_window(self) -> CandidateWindow:
+        return CandidateWindow(
+            start=self.start,
+            end=self.end,
+            pto_needed=self.pto_needed,
+            off_streak=self.off_streak,
+            holidays=self.holidays,
+            weekends=self.weekends,
+            workdays=self.workdays,
+        )
+
 
 @dataclass(slots=True)
 class HolidayModel:
@@ -70,6 +186,11 @@ class PlanBlock:
             "explain": self.explain,
         }
 
+    def copy(self) -> PlanBlock:
+        return PlanBlock(
+            self.start, self.end, self.days_off, list(self.pto), list(self.holidays), list(self.weekends), self.explain
+        )
+
 
 @dataclass(slots=True)
 class Plan:
@@ -84,12 +205,34 @@ class Plan:
             "blocks": [block.to_dict() for block in self.blocks],
         }
 
+    def copy(self) -> Plan:
+        """Return a copy whose block lists can be changed without affecting this plan."""
+
+        return Plan(self.score, self.pto_used, [block.copy() for block in self.blocks])
+
+
+@dataclass(slots=True)
+class FrontierStep:
+    """``plan`` is the best plan for budgets from ``budget`` up to the next step's."""
+
+    budget: int
+    plan: Plan
+
+    def to_dict(self) -> dict:
+        return {"budget": self.budget, "plan": self.plan.to_dict()}
+
+    def copy(self) -> FrontierStep:
+        return FrontierStep(self.budget, self.plan.copy())
+
 
 __all__ = [
     "DayInfo",
     "DayType",
     "CandidateWindow",
+    "CompactWindow",
+    "FrontierStep",
     "HolidayModel",
     "PlanBlock",
     "Plan",
+    "quarter_bit_for",
 ]
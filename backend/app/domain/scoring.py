@@ -6,7 +6,9 @@ from datetime import date
 from enum import Enum
 from typing import Iterable, Sequence
 
-from .models import CandidateWindow
+from .models import CandidateWindow, CompactWindow
+
+Window = CandidateWindow | CompactWindow
 
 
 class Goal(str, Enum):
@@ -40,26 +42,55 @@ class PlanPreference:
     season_spread: bool
 
 
-def score_candidate(window: CandidateWindow, prefs: PreferenceConfig) -> float:
+def score_candidate(window: Window, prefs: PreferenceConfig) -> float:
     """Return the base score for a single candidate window."""
 
     base = float(window.off_streak)
     penalty = prefs.penalty_lambda * float(window.pto_needed)
-    month_values = sum(prefs.month_weight(day.month) for day in window.workdays)
+    month_values = sum(prefs.month_weight(month) * count for month, count in window.pto_by_month)
     density_bonus = float(window.off_streak) / float(max(1, window.pto_needed))
     return base - penalty + 0.1 * month_values + 0.05 * density_bonus
 
 
-def seasonal_bonus(windows: Sequence[CandidateWindow]) -> float:
+def quarter_bit(window: Window) -> int:
+    """Return the bit for the quarter (of its year) a window starts in."""
+
+    return window.quarter
+
+
+def seasonal_bonus(windows: Sequence[Window]) -> float:
     """Reward windows that span multiple quarters."""
 
     if not windows:
         return 0.0
-    quarters = {((window.start.month - 1) // 3) + 1 for window in windows}
-    return 1.5 * (len(quarters) - 1)
+    quarters = 0
+    for window in windows:
+        quarters |= quarter_bit(window)
+    return quarter_mask_bonus(quarters)
+
+
+def quarter_mask_bonus(quarters: int) -> float:
+    """Seasonal bonus for a non-empty plan covering the quarters in ``quarters``."""
+
+    return 1.5 * (quarters.bit_count() - 1)
+
+
+def aggregate_plan_score(score_sum: float, longest: int, quarters: int, prefs: PlanPreference) -> float:
+    """Compute a non-empty plan's score from its running aggregates.
+
+    ``score_sum`` is the sum of base scores, ``longest`` the longest ``off_streak`` and
+    ``quarters`` the mask of ``quarter_bit`` values of the plan's windows.
+    """
+
+    total = score_sum
+    if prefs.goal == Goal.MAX_LONGEST:
+        total += longest * 0.1
+    if prefs.season_spread:
+        total += quarter_mask_bonus(quarters)
+    return total
 
 
-def plan_score(windows: Sequence[CandidateWindow], prefs: PlanPreference, base_scores: Iterable[float]) -> float:
+def plan_score(windows: Sequence[Window], prefs: PlanPreference, base_scores: Iterable[float]) -> float:
     """Compute the aggregate plan score."""
 
     total = sum(base_scores)
@@ -71,4 +102,12 @@ def plan_score(windows: Sequence[CandidateWindow], prefs: PlanPreference, base_s
     return total
 
 
-__all__ = ["Goal", "PreferenceConfig", "PlanPreference", "score_candidate", "plan_score"]
+__all__ = [
+    "Goal",
+    "PreferenceConfig",
+    "PlanPreference",
+    "aggregate_plan_score",
+    "quarter_bit",
+    "score_candidate",
+    "plan_score",
+]
@@ -1,16 +1,20 @@
 """Selection logic for assembling non-overlapping PTO plans."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+from enum import Enum
+from operator import itemgetter
 from typing import Sequence
 
-from .models import CandidateWindow
-from .scoring import PlanPreference, PreferenceConfig, plan_score, score_candidate
+from .models import CandidateWindow, CompactWindow
+from .scoring import Goal, PlanPreference, PreferenceConfig, aggregate_plan_score, quarter_bit, score_candidate
 
 
 @dataclass(slots=True, frozen=True)
 class PlanCandidate:
-    windows: tuple[CandidateWindow, ...]
+    windows: tuple[CompactWindow, ...]
     base_scores: tuple[float, ...]
     pto_used: int
     score: float
@@ -19,6 +23,16 @@ class PlanCandidate:
         return tuple((window.start, window.end) for window in self.windows)
 
 
+class SelectionStrategy(str, Enum):
+    """Search strategies available to ``select_plans``."""
+
+    EXACT = "exact"
+    BEAM = "beam"
+
+
+DEFAULT_BEAM_WIDTH = 64
+
+
 @dataclass(slots=True, frozen=True)
 class SelectionConfig:
     budget: int
@@ -26,53 +40,482 @@ class SelectionConfig:
     top_k: int
     prefs: PreferenceConfig
     plan_prefs: PlanPreference
+    strategy: SelectionStrategy = SelectionStrategy.EXACT
+    beam_width: int = DEFAULT_BEAM_WIDTH
+    # Seconds the search may run; None searches to completion.
+    time_budget: float | None = None
+    # Also return the best plan for every budget from 0 to ``budget`` (exact strategy only).
+    frontier: bool = False
 
 
-def select_plans(candidates: Sequence[CandidateWindow], config: SelectionConfig) -> list[PlanCandidate]:
-    """Return the top plans abiding by PTO budget and block limits."""
+@dataclass(slots=True)
+class SearchStats:
+    """Search effort: partial plans built, and those discarded by cell limits or bounds."""
 
-    if not candidates:
-        return []
+    states_created: int = 0
+    states_pruned: int = 0
 
-    scored = [score_candidate(candidate, config.prefs) for candidate in candidates]
 
-    states: dict[tuple[tuple[CandidateWindow, ...], int], PlanCandidate] = {}
-    base_state = PlanCandidate(windows=tuple(), base_scores=tuple(), pto_used=0, score=0.0)
-    states[(base_state.windows, base_state.pto_used)] = base_state
+@dataclass(slots=True, frozen=True)
+class SelectionResult:
+    """Plans returned by a search together with its optimality guarantee.
 
-    for candidate, base_score in zip(candidates, scored):
-        snapshot = list(states.values())
-        for state in snapshot:
-            if state.windows and state.windows[-1].end >= candidate.start:
-                if candidate.start <= state.windows[-1].end:
-                    continue
-            total_pto = state.pto_used + candidate.pto_needed
-            if total_pto > config.budget:
-                continue
-            if len(state.windows) + 1 > config.blocks_max:
-                continue
-            new_windows = state.windows + (candidate,)
-            new_base_scores = state.base_scores + (base_score,)
-            new_score = plan_score(new_windows, config.plan_prefs, new_base_scores)
-            key = (new_windows, total_pto)
-            existing = states.get(key)
-            if existing is None or new_score > existing.score:
-                states[key] = PlanCandidate(
-                    windows=new_windows,
-                    base_scores=new_base_scores,
-                    pto_used=total_pto,
-                    score=new_score,
-                )
+    ``cut_short`` means the time budget ran out and ``plans`` are the best found so far.
+    ``frontier`` lists ``(budget, plan)`` steps: ``plan`` is the best plan for every
+    budget from ``budget`` up to the next step's, so the score rises at each step.
+    """
+
+    plans: tuple[PlanCandidate, ...]
+    optimal: bool
+    stats: SearchStats = field(default_factory=SearchStats)
+    cut_short: bool = False
+    frontier: tuple[tuple[int, PlanCandidate], ...] = ()
 
-    plans = [state for state in states.values() if state.windows]
-    plans.sort(
-        key=lambda plan: (
-            -plan.score,
-            -sum(window.off_streak for window in plan.windows),
-            plan.to_summary(),
+
+@dataclass(slots=True, eq=False)
+class PlanState:
+    """Partial plan stored as a parent-pointer chain with running aggregates.
+
+    Extending a plan allocates a single node and updates the aggregates in O(1);
+    windows are only materialized when a state is turned into a ``PlanCandidate``.
+    States order best first: higher score, then more days off, then earlier windows.
+    """
+
+    parent: PlanState | None
+    window: CompactWindow
+    base_score: float
+    pto_used: int
+    blocks: int
+    score_sum: float
+    longest: int
+    quarters: int
+    total_off: int
+    score: float
+    _summary: tuple | None = field(default=None, repr=False)
+
+    @classmethod
+    def start(cls, window: CompactWindow, base_score: float, prefs: PlanPreference) -> PlanState:
+        quarters = quarter_bit(window)
+        return cls(
+            parent=None,
+            window=window,
+            base_score=base_score,
+            pto_used=window.pto_needed,
+            blocks=1,
+            score_sum=base_score,
+            longest=window.off_streak,
+            quarters=quarters,
+            total_off=window.off_streak,
+            score=aggregate_plan_score(base_score, window.off_streak, quarters, prefs),
         )
+
+    def extend(self, window: CompactWindow, base_score: float, prefs: PlanPreference) -> PlanState:
+        """Append ``window``, which must start after every window already in the plan."""
+
+        score_sum = self.score_sum + base_score
+        longest = max(self.longest, window.off_streak)
+        quarters = self.quarters | quarter_bit(window)
+        return PlanState(
+            parent=self,
+            window=window,
+            base_score=base_score,
+            pto_used=self.pto_used + window.pto_needed,
+            blocks=self.blocks + 1,
+            score_sum=score_sum,
+            longest=longest,
+            quarters=quarters,
+            total_off=self.total_off + window.off_streak,
+            score=aggregate_plan_score(score_sum, longest, quarters, prefs),
+        )
+
+    def chain(self) -> list[PlanState]:
+        """Return the states from the first window to this one."""
+
+        nodes: list[PlanState] = []
+        node: PlanState | None = self
+        while node is not None:
+            nodes.append(node)
+            node = node.parent
+        nodes.reverse()
+        return nodes
+
+    def summary(self) -> tuple:
+        """Return the (first, last) ordinal pairs of the plan, cached along the chain for tie-breaks."""
+
+        if self._summary is None:
+            prefix = self.parent.summary() if self.parent is not None else ()
+            self._summary = prefix + ((self.window.first, self.window.last),)
+        return self._summary
+
+    def to_candidate(self) -> PlanCandidate:
+        nodes = self.chain()
+        return PlanCandidate(
+            windows=tuple(node.window for node in nodes),
+            base_scores=tuple(node.base_score for node in nodes),
+            pto_used=self.pto_used,
+            score=self.score,
+        )
+
+    def __lt__(self, other: PlanState) -> bool:
+        if self.score != other.score:
+            return self.score > other.score
+        if self.total_off != other.total_off:
+            return self.total_off > other.total_off
+        return self.summary() < other.summary()
+
+
+# (pto_used, block count, quarter mask, longest streak) -> states ranked best first
+CellTable = dict[tuple[int, int, int, int], list[PlanState]]
+
+
+def _cell_key(state: PlanState, prefs: PlanPreference) -> tuple[int, int, int, int]:
+    """Group states whose future extensions change their score identically.
+
+    Base scores are additive, but the seasonal bonus depends on the quarters already
+    covered and the longest-streak bonus on the current longest window. Those parts
+    of the key are only tracked when the active preferences make them matter.
+    """
+
+    return (
+        state.pto_used,
+        state.blocks,
+        state.quarters if prefs.season_spread else 0,
+        state.longest if prefs.goal == Goal.MAX_LONGEST else 0,
     )
-    return plans[: config.top_k]
 
 
-__all__ = ["PlanCandidate", "SelectionConfig", "select_plans"]
+def _offer(cells: CellTable, state: PlanState, config: SelectionConfig) -> int:
+    """Insert ``state`` into its cell, keeping only the ``top_k`` best entries.
+
+    Returns how many states were discarded (0 or 1).
+    """
+
+    key = _cell_key(state, config.plan_prefs)
+    bucket = cells.get(key)
+    if bucket is None:
+        cells[key] = [state]
+        return 0
+    if len(bucket) >= config.top_k and not state < bucket[-1]:
+        return 1
+    insort(bucket, state)
+    if len(bucket) > config.top_k:
+        bucket.pop()
+        return 1
+    return 0
+
+
+def _extend_cells(
+    table: CellTable,
+    candidate: CompactWindow,
+    base_score: float,
+    config: SelectionConfig,
+    stats: SearchStats,
+) -> CellTable:
+    """Return the cells of plans that end with ``candidate``.
+
+    ``table`` must only contain plans whose last window ends before ``candidate``
+    starts, so every entry can be extended without further overlap checks.
+    """
+
+    cells: CellTable = {}
+    if candidate.pto_needed > config.budget:
+        return cells
+    _offer(cells, PlanState.start(candidate, base_score, config.plan_prefs), config)
+    created = 1
+    pruned = 0
+    if config.blocks_max >= 2:
+        pto_room = config.budget - candidate.pto_needed
+        for (pto_used, blocks, _quarters, _longest), bucket in table.items():
+            if pto_used > pto_room or blocks >= config.blocks_max:
+                continue
+            created += len(bucket)
+            for state in bucket:
+                pruned += _offer(cells, state.extend(candidate, base_score, config.plan_prefs), config)
+    stats.states_created += created
+    stats.states_pruned += pruned
+    return cells
+
+
+def _merge_cells(merged: CellTable, cells: CellTable, config: SelectionConfig, stats: SearchStats) -> None:
+    """Fold ``cells`` into ``merged``, keeping the ``top_k`` best plans per cell."""
+
+    for key, bucket in cells.items():
+        existing = merged.get(key)
+        if existing is None:
+            merged[key] = bucket
+            continue
+        held = len(existing) + len(bucket)
+        for state in bucket:
+            if len(existing) >= config.top_k and not state < existing[-1]:
+                break
+            insort(existing, state)
+        del existing[config.top_k :]
+        stats.states_pruned += held - len(existing)
+
+
+def _exact_table(
+    ordered: Sequence[CompactWindow],
+    scored: Sequence[float],
+    config: SelectionConfig,
+    stats: SearchStats,
+    deadline: float | None = None,
+) -> tuple[CellTable, bool]:
+    """Return the best plans of every cell over candidates sorted by end date.
+
+    Each candidate's compatible predecessors form a prefix of the end-date order,
+    located with a binary search over the end dates. The search keeps at most
+    ``top_k`` partial plans per (PTO used, block count) cell, which bounds memory and
+    makes the run time polynomial while still returning the exact top-k: a plan whose
+    prefix is not among the best of its cell is beaten by ``top_k`` plans sharing the
+    same final window.
+
+    Reaching ``deadline`` (a ``time.perf_counter`` value) stops the sweep between
+    positions once some plan exists. The table then holds the best plans among the
+    candidates swept so far plus those already built for later ones, and the second
+    return value is True.
+    """
+
+    ends = [candidate.last for candidate in ordered]
+
+    # Candidate ``j`` may follow any plan ending with one of ``ordered[:pred]``.
+    waiting: dict[int, list[int]] = {}
+    for idx, candidate in enumerate(ordered):
+        waiting.setdefault(bisect_left(ends, candidate.first), []).append(idx)
+
+    # ``merged`` holds the best plans ending with any of ``ordered[:position]``.
+    merged: CellTable = {}
+    pending: dict[int, CellTable] = {}
+    for position in range(len(ordered)):
+        if deadline is not None and merged and time.perf_counter() >= deadline:
+            for cells in pending.values():
+                _merge_cells(merged, cells, config, stats)
+            return merged, True
+        for idx in waiting.get(position, ()):
+            pending[idx] = _extend_cells(merged, ordered[idx], scored[idx], config, stats)
+        _merge_cells(merged, pending.pop(position), config, stats)
+    return merged, False
+
+
+def _exact_search(
+    ordered: Sequence[CompactWindow],
+    scored: Sequence[float],
+    config: SelectionConfig,
+    stats: SearchStats,
+    deadline: float | None = None,
+) -> tuple[list[PlanCandidate], bool]:
+    """Return the exact top-k plans, or the best found by ``deadline``; see ``_exact_table``."""
+
+    merged, cut_short = _exact_table(ordered, scored, config, stats, deadline)
+    ranked = sorted(state for bucket in merged.values() for state in bucket)
+    return [state.to_candidate() for state in ranked[: config.top_k]], cut_short
+
+
+def _frontier(table: CellTable, config: SelectionConfig) -> tuple[list[PlanCandidate], list[tuple[int, PlanCandidate]]]:
+    """Return the top-k plans and the best-plan steps for every budget up to ``config.budget``.
+
+    Cells are keyed by the PTO they use and never compare plans of different PTO, so
+    the top-k for a smaller budget is the top-k of the cells within it. Sweeping the
+    budgets upwards merges one PTO level at a time into a running top-k.
+    """
+
+    by_pto: dict[int, list[PlanState]] = {}
+    for (pto_used, _blocks, _quarters, _longest), bucket in table.items():
+        by_pto.setdefault(pto_used, []).extend(bucket)
+    running: list[PlanState] = []
+    steps: list[tuple[int, PlanCandidate]] = []
+    for budget in range(config.budget + 1):
+        level = by_pto.get(budget)
+        if not level:
+            continue
+        running = sorted([*running, *level])[: config.top_k]
+        if not steps or running[0] is not best:
+            best = running[0]
+            steps.append((budget, best.to_candidate()))
+    return [state.to_candidate() for state in running], steps
+
+
+class _RemainingBound:
+    """Optimistic estimate of the score a partial plan can still gain.
+
+    For every start-ordered suffix of the candidates and every leftover budget the
+    table stores the best positive ``score_candidate`` values among windows that fit
+    the budget on their own. Summing the best few ignores the budget they would share
+    and the overlaps between them, so the estimate never undershoots.
+    """
+
+    def __init__(self, by_start: Sequence[CompactWindow], scores: Sequence[float], config: SelectionConfig) -> None:
+        self.depth = max(0, config.blocks_max - 1)
+        self.pto_cap = min(config.budget, max((c.pto_needed for c in by_start), default=0))
+        self.plan_prefs = config.plan_prefs
+        # Quarters any candidate starts in; a plan can only gain bonus for the others.
+        self.quarters = 0
+        for candidate in by_start:
+            self.quarters |= candidate.quarter
+        empty: tuple[float, ...] = (0.0,)
+        row: list[tuple[float, ...]] = [empty] * (self.pto_cap + 1)
+        self._sums: list[list[tuple[float, ...]]] = [row]
+        self._longest: list[int] = [0]
+        best: list[list[float]] = [[] for _ in range(self.pto_cap + 1)]
+        for candidate, score in zip(reversed(by_start), reversed(scores)):
+            if score > 0 and candidate.pto_needed <= self.pto_cap:
+                row = list(row)
+                for leftover in range(candidate.pto_needed, self.pto_cap + 1):
+                    top = best[leftover]
+                    if len(top) >= self.depth and (not top or score <= top[-1]):
+                        continue
+                    top = sorted([*top, score], reverse=True)[: self.depth]
+                    best[leftover] = top
+                    sums = [0.0]
+                    for value in top:
+                        sums.append(sums[-1] + value)
+                    row[leftover] = tuple(sums)
+            self._sums.append(row)
+            self._longest.append(max(self._longest[-1], candidate.off_streak))
+        self._sums.reverse()
+        self._longest.reverse()
+
+    def estimate(self, position: int, pto_left: int, blocks_left: int, quarters: int, longest: int) -> float:
+        """Upper bound on the score gained by adding windows from ``position`` on."""
+
+        if blocks_left <= 0:
+            return 0.0
+        sums = self._sums[position][min(pto_left, self.pto_cap)]
+        gain = sums[min(blocks_left, len(sums) - 1)]
+        if self.plan_prefs.season_spread:
+            gain += 1.5 * min(blocks_left, (self.quarters & ~quarters).bit_count())
+        if self.plan_prefs.goal == Goal.MAX_LONGEST:
+            gain += 0.1 * max(0, self._longest[position] - longest)
+        return gain
+
+
+# Slack absorbing float rounding between a bound and the score it covers.
+_BOUND_EPSILON = 1e-9
+
+
+def _beam_search(
+    ordered: Sequence[CompactWindow],
+    scored: Sequence[float],
+    config: SelectionConfig,
+    stats: SearchStats,
+    deadline: float | None = None,
+) -> tuple[list[PlanCandidate], bool, bool]:
+    """Return the top plans found by a bounded-width, branch-and-bound search.
+
+    Plans grow one block per layer, always with a window starting after the last one.
+    A partial plan is pruned when its score plus ``_RemainingBound`` cannot reach the
+    current k-th best plan; that pruning is safe. When a layer still holds more than
+    ``beam_width`` plans the ones with the weakest bounds are dropped, and the result is
+    only proven optimal if none of them could have beaten the final k-th best score.
+    Reaching ``deadline`` (a ``time.perf_counter`` value) stops the search between
+    expansions once some plan exists; the plans found so far are returned as cut short.
+    """
+
+    order = sorted(range(len(ordered)), key=lambda idx: ordered[idx].first)
+    by_start = [ordered[idx] for idx in order]
+    start_scores = [scored[idx] for idx in order]
+    starts = [candidate.first for candidate in by_start]
+    bound = _RemainingBound(by_start, start_scores, config)
+
+    results: list[PlanState] = []
+    best_dropped: float | None = None
+
+    def kth_score() -> float | None:
+        return results[-1].score if len(results) >= config.top_k else None
+
+    # Each layer entry: (optimistic total, state, first start position it may extend with)
+    layer: list[tuple[float, PlanState | None, int]] = [(0.0, None, 0)]
+    cut_short = False
+    for depth in range(config.blocks_max):
+        blocks_left = config.blocks_max - depth - 1
+        children: list[tuple[float, PlanState | None, int]] = []
+        for _optimistic, state, first in layer:
+            if deadline is not None and results and time.perf_counter() >= deadline:
+                cut_short = True
+                break
+            pto_used = state.pto_used if state else 0
+            for position in range(first, len(by_start)):
+                candidate = by_start[position]
+                total_pto = pto_used + candidate.pto_needed
+                if total_pto > config.budget:
+                    continue
+                if state is None:
+                    child = PlanState.start(candidate, start_scores[position], config.plan_prefs)
+                else:
+                    child = state.extend(candidate, start_scores[position], config.plan_prefs)
+                stats.states_created += 1
+                if len(results) < config.top_k or child < results[-1]:
+                    insort(results, child)
+                    del results[config.top_k :]
+                if not blocks_left:
+                    continue
+                follow = bisect_left(starts, candidate.last + 1)
+                optimistic = child.score + bound.estimate(
+                    follow, config.budget - total_pto, blocks_left, child.quarters, child.longest
+                )
+                children.append((optimistic, child, follow))
+        threshold = kth_score()
+        expanded = len(children)
+        if threshold is not None:
+            children = [item for item in children if item[0] + _BOUND_EPSILON >= threshold]
+        if len(children) > config.beam_width:
+            children.sort(key=itemgetter(0), reverse=True)
+            dropped = children[config.beam_width][0]
+            best_dropped = dropped if best_dropped is None else max(best_dropped, dropped)
+            del children[config.beam_width :]
+        stats.states_pruned += expanded - len(children)
+        layer = children
+        if not layer or cut_short:
+            break
+
+    threshold = kth_score()
+    optimal = best_dropped is None or (threshold is not None and best_dropped + _BOUND_EPSILON < threshold)
+    return [state.to_candidate() for state in results], optimal and not cut_short, cut_short
+
+
+Candidates = Sequence[CandidateWindow | CompactWindow]
+
+
+def search_plans(candidates: Candidates, config: SelectionConfig) -> SelectionResult:
+    """Run the configured search strategy and report whether its result is optimal.
+
+    Date-based ``CandidateWindow`` inputs are converted to ``CompactWindow`` first; the
+    search itself only compares day ordinals. With a ``time_budget`` the exact search
+    checks the deadline between candidates and the beam search between expansions;
+    either returns the best plans found so far when it runs out. A ``frontier``
+    request always runs the exact search to completion.
+    """
+
+    if not candidates or config.top_k <= 0:
+        return SelectionResult(plans=(), optimal=True)
+
+    deadline = None if config.time_budget is None else time.perf_counter() + config.time_budget
+    compact = [c if isinstance(c, CompactWindow) else CompactWindow.from_window(c) for c in candidates]
+    ordered = sorted(compact, key=lambda c: (c.last, c.first, c.pto_needed, c.off_streak))
+    scored = [score_candidate(candidate, config.prefs) for candidate in ordered]
+    stats = SearchStats()
+    if config.frontier:
+        plans, steps = _frontier(_exact_table(ordered, scored, config, stats)[0], config)
+        return SelectionResult(plans=tuple(plans), optimal=True, stats=stats, frontier=tuple(steps))
+    if config.strategy == SelectionStrategy.BEAM:
+        plans, optimal, cut_short = _beam_search(ordered, scored, config, stats, deadline)
+        return SelectionResult(plans=tuple(plans), optimal=optimal, stats=stats, cut_short=cut_short)
+    plans, cut_short = _exact_search(ordered, scored, config, stats, deadline)
+    return SelectionResult(plans=tuple(plans), optimal=not cut_short, stats=stats, cut_short=cut_short)
+
+
+def select_plans(candidates: Candidates, config: SelectionConfig) -> list[PlanCandidate]:
+    """Return the top plans abiding by PTO budget and block limits."""
+
+    return list(search_plans(candidates, config).plans)
+
+
+__all__ = [
+    "PlanCandidate",
+    "PlanState",
+    "SearchStats",
+    "SelectionConfig",
+    "SelectionResult",
+    "SelectionStrategy",
+    "search_plans",
+    "select_plans",
+]
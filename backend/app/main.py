@@ -4,10 +4,34 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Callable
 
-from .api.routes_plan import compute_plan
+from .api.routes_holidays import configure_holiday_payloads, holiday_payload_stats
+from .api.routes_plan import (
+    compute_plan,
+    configure_plan_cache,
+    configure_plan_executor,
+    init_plan_worker,
+    plan_cache_stats,
+    plan_executor_stats,
+    plan_requests_coalesced,
+)
 from .core.config import get_settings
+from .core.metrics import metrics
+from .domain.calendar_builder import calendar_store_stats
+from .domain.candidates import candidate_cache_stats
+from .domain.holiday_provider import holiday_cache_stats
 
 settings = get_settings()
+cache_settings = (
+    settings.holiday_cache_size,
+    settings.holiday_snapshot_path,
+    settings.calendar_cache_size,
+    settings.candidate_cache_size,
+    settings.calendar_prewarm,
+)
+init_plan_worker(*cache_settings)
+configure_holiday_payloads(settings.holiday_cache_size)
+configure_plan_cache(settings.plan_cache_bytes)
+configure_plan_executor(settings.plan_workers, settings.plan_timeout_seconds, worker_args=cache_settings)
 
 
 @dataclass
@@ -32,4 +56,23 @@ async def health_check() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/metrics")
+async def metrics_snapshot() -> dict[str, dict]:
+    """In-process histograms of per-stage plan timings and search effort."""
+
+    return dict(metrics.snapshot())
+
+
+@app.get("/cache-stats")
+async def cache_stats() -> dict[str, dict]:
+    return {
+        "holidays": holiday_cache_stats().to_dict(),
+        "holiday_payloads": holiday_payload_stats().to_dict(),
+        "calendars": calendar_store_stats().to_dict(),
+        "candidates": candidate_cache_stats().to_dict(),
+        "plans": {**plan_cache_stats().to_dict(), "coalesced": plan_requests_coalesced()},
+        "executor": plan_executor_stats(),
+    }
+
+
 __all__ = ["app", "compute_plan"]
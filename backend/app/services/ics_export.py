@@ -1,19 +1,48 @@
 """ICS export utilities for PTO plans."""
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import Sequence
+import hashlib
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Iterable, Iterator, Sequence
 from uuid import uuid4
 
 from zoneinfo import ZoneInfo
 
 from ..domain.models import PlanBlock
 
+CRLF = b"\r\n"
+# RFC 5545 section 3.1: content lines are folded at 75 octets.
+MAX_LINE_OCTETS = 75
+CHUNK_SIZE = 64 * 1024
+# Bump whenever the rendered bytes change so feed ETags change with them.
+FEED_FORMAT = b"ics-feed-1"
 
-def format_event(block: PlanBlock, timezone: str) -> str:
-    tz = ZoneInfo(timezone)
-    dtstamp = datetime.now(tz).strftime("%Y%m%dT%H%M%SZ")
-    uid = f"max-days-off-{uuid4()}@fundsy"
+
+def fold_line(line: str) -> bytes:
+    """Encode one content line, folding it into CRLF + space continuations.
+
+    Folds never split a multi-byte UTF-8 sequence.
+    """
+
+    encoded = line.encode("utf-8")
+    if len(encoded) <= MAX_LINE_OCTETS:
+        return encoded + CRLF
+    parts: list[bytes] = []
+    start = 0
+    limit = MAX_LINE_OCTETS
+    while len(encoded) - start > limit:
+        cut = start + limit
+        # Back up to the first byte of a UTF-8 sequence.
+        while encoded[cut] & 0xC0 == 0x80:
+            cut -= 1
+        parts.append(encoded[start:cut])
+        start = cut
+        limit = MAX_LINE_OCTETS - 1  # continuation lines start with a space
+    parts.append(encoded[start:])
+    return b"\r\n ".join(parts) + CRLF
+
+
+def event_lines(block: PlanBlock, dtstamp: str, uid: str) -> list[str]:
     dtstart = block.start.strftime("%Y%m%d")
     dtend = (block.end + timedelta(days=1)).strftime("%Y%m%d")
     description_lines = ["PTO days:"] + [day.isoformat() for day in block.pto]
@@ -21,19 +50,116 @@ def format_event(block: PlanBlock, timezone: str) -> str:
         description_lines.append("Holidays:")
         description_lines.extend(day.isoformat() for day in block.holidays)
     description = "\\n".join(description_lines)
-    return "\r\n".join(
-        [
-            "BEGIN:VEVENT",
-            f"UID:{uid}",
-            f"DTSTAMP:{dtstamp}",
-            f"DTSTART;VALUE=DATE:{dtstart}",
-            f"DTEND;VALUE=DATE:{dtend}",
-            "SUMMARY:OOO — Break",
-            "CATEGORIES:PTO,OutOfOffice",
-            f"DESCRIPTION:{description}",
-            "END:VEVENT",
-        ]
-    )
+    return [
+        "BEGIN:VEVENT",
+        f"UID:{uid}",
+        f"DTSTAMP:{dtstamp}",
+        f"DTSTART;VALUE=DATE:{dtstart}",
+        f"DTEND;VALUE=DATE:{dtend}",
+        "SUMMARY:OOO — Break",
+        "CATEGORIES:PTO,OutOfOffice",
+        f"DESCRIPTION:{description}",
+        "END:VEVENT",
+    ]
+
+
+def _new_uid() -> str:
+    return f"max-days-off-{uuid4()}@fundsy"
+
+
+def _block_fingerprint(block: PlanBlock) -> bytes:
+    # Everything event_lines renders from the block.
+    pto = ",".join(day.isoformat() for day in block.pto)
+    holidays = ",".join(day.isoformat() for day in block.holidays)
+    return f"{block.start.isoformat()}|{block.end.isoformat()}|{pto}|{holidays}".encode("ascii")
+
+
+def block_uid(block: PlanBlock, occurrence: int = 0) -> str:
+    """Return a UID derived from what the event renders, stable across exports.
+
+    ``occurrence`` numbers repeats of an identical block within one feed, so each
+    event keeps a UID of its own.
+    """
+
+    digest = hashlib.sha256(_block_fingerprint(block)).hexdigest()[:32]
+    suffix = f"-{occurrence}" if occurrence else ""
+    return f"max-days-off-{digest}{suffix}@fundsy"
+
+
+def _dtstamp(version: datetime | None = None) -> str:
+    moment = datetime.now(dt_timezone.utc) if version is None else version
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=dt_timezone.utc)
+    return moment.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def feed_etag(title: str, timezone: str, blocks: Iterable[PlanBlock], version: datetime) -> str:
+    """Return the strong ETag of the feed ``iter_ics_document`` renders for ``version``.
+
+    Only the inputs are hashed, so checking a conditional request never renders.
+    """
+
+    digest = hashlib.sha256(FEED_FORMAT)
+    for part in (title, timezone, _dtstamp(version)):
+        digest.update(part.encode("utf-8") + b"\0")
+    for block in blocks:
+        digest.update(_block_fingerprint(block) + b"\0")
+    return f'"{digest.hexdigest()}"'
+
+
+def format_event(block: PlanBlock, timezone: str) -> str:
+    ZoneInfo(timezone)
+    return "\r\n".join(event_lines(block, _dtstamp(), _new_uid()))
+
+
+def _buffered(lines: Iterable[str], chunk_size: int) -> Iterator[bytes]:
+    buffer = bytearray()
+    for line in lines:
+        buffer += fold_line(line)
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def iter_ics_document(
+    title: str,
+    timezone: str,
+    blocks: Iterable[PlanBlock],
+    chunk_size: int = CHUNK_SIZE,
+    version: datetime | None = None,
+) -> Iterator[bytes]:
+    """Yield the ICS document as encoded chunks of roughly ``chunk_size`` bytes.
+
+    The timezone is validated and DTSTAMP computed once for the whole document, and
+    blocks are consumed lazily, so memory stays flat however many events there are.
+    Passing the plan's ``version`` timestamp selects feed mode: DTSTAMP is the version
+    and UIDs come from block contents, so an unchanged plan renders identical bytes.
+    """
+
+    ZoneInfo(timezone)
+    dtstamp = _dtstamp(version)
+    feed = version is not None
+
+    def lines() -> Iterator[str]:
+        yield "BEGIN:VCALENDAR"
+        yield "VERSION:2.0"
+        yield "PRODID:-//Fundsy//Max Days Off//EN"
+        yield f"X-WR-CALNAME:{title}"
+        seen: dict[bytes, int] = {}
+        for block in blocks:
+            if feed:
+                fingerprint = _block_fingerprint(block)
+                occurrence = seen.get(fingerprint, 0)
+                seen[fingerprint] = occurrence + 1
+                uid = block_uid(block, occurrence)
+            else:
+                uid = _new_uid()
+            yield from event_lines(block, dtstamp, uid)
+        yield "END:VCALENDAR"
+
+    return _buffered(lines(), chunk_size)
 
 
 def build_ics_document(
@@ -41,16 +167,7 @@ def build_ics_document(
     timezone: str,
     blocks: Sequence[PlanBlock],
 ) -> bytes:
-    events = "\r\n".join(format_event(block, timezone) for block in blocks)
-    lines = [
-        "BEGIN:VCALENDAR",
-        "VERSION:2.0",
-        "PRODID:-//Fundsy//Max Days Off//EN",
-        f"X-WR-CALNAME:{title}",
-        events,
-        "END:VCALENDAR",
-    ]
-    return "\r\n".join(lines).encode("utf-8")
+    return b"".join(iter_ics_document(title, timezone, blocks))
 
 
-__all__ = ["build_ics_document"]
+__all__ = ["block_uid", "build_ics_document", "feed_etag", "fold_line", "iter_ics_document"]
@@ -0,0 +1,101 @@
+"""Direct JSON encoding for plan responses.
+
+``dump_plan_response(response)`` produces exactly the bytes of
+``json.dumps(response.model_dump()).encode()`` (default separators, ASCII escaping)
+without building the intermediate dict tree, and renders dates from per-year tables
+of pre-quoted ISO strings instead of calling ``date.isoformat`` for every day.
+"""
+from __future__ import annotations
+
+import json
+from datetime import date
+from json.encoder import encode_basestring_ascii
+from threading import Lock
+from typing import TYPE_CHECKING, Iterable, Sequence
+
+from ..domain.models import FrontierStep, Plan, PlanBlock
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..api.routes_plan import PlanResponse
+
+# Pre-quoted ISO strings for every day of each year seen so far, filled a year at a time.
+_quoted_dates: dict[date, str] = {}
+_filled_years: set[int] = set()
+_tables_lock = Lock()
+
+
+def _fill_year(year: int) -> None:
+    with _tables_lock:
+        if year in _filled_years:
+            return
+        base = date(year, 1, 1).toordinal()
+        for ordinal in range(base, date(year, 12, 31).toordinal() + 1):
+            day = date.fromordinal(ordinal)
+            _quoted_dates[day] = f'"{day.isoformat()}"'
+        _filled_years.add(year)
+
+
+def quoted_date(day: date) -> str:
+    """Return ``json.dumps(day.isoformat())`` from the year's table."""
+
+    try:
+        return _quoted_dates[day]
+    except KeyError:
+        _fill_year(day.year)
+        return _quoted_dates[day]
+
+
+def _date_list(days: Sequence[date]) -> str:
+    if not days:
+        return "[]"
+    try:
+        return "[" + ", ".join([_quoted_dates[day] for day in days]) + "]"
+    except KeyError:
+        return "[" + ", ".join([quoted_date(day) for day in days]) + "]"
+
+
+def _number(value: float) -> str:
+    # Mirrors json.encoder: floats use float.__repr__, ints int.__repr__.
+    if isinstance(value, float):
+        return float.__repr__(value)
+    return int.__repr__(value)
+
+
+def _block(block: PlanBlock) -> str:
+    return (
+        f'{{"start": {quoted_date(block.start)}, "end": {quoted_date(block.end)}, '
+        f'"days_off": {int.__repr__(block.days_off)}, "pto": {_date_list(block.pto)}, '
+        f'"holidays": {_date_list(block.holidays)}, "weekends": {_date_list(block.weekends)}, '
+        f'"explain": {encode_basestring_ascii(block.explain)}}}'
+    )
+
+
+def _plan(plan: Plan) -> str:
+    return (
+        f'{{"score": {_number(plan.score)}, "pto_used": {int.__repr__(plan.pto_used)}, '
+        f'"blocks": [{", ".join([_block(block) for block in plan.blocks])}]}}'
+    )
+
+
+def _plans(plans: Iterable[Plan]) -> str:
+    return "[" + ", ".join([_plan(plan) for plan in plans]) + "]"
+
+
+def _frontier(steps: Iterable[FrontierStep]) -> str:
+    rendered = [f'{{"budget": {int.__repr__(step.budget)}, "plan": {_plan(step.plan)}}}' for step in steps]
+    return "[" + ", ".join(rendered) + "]"
+
+
+def dump_plan_response(response: PlanResponse) -> bytes:
+    """Serialize ``response`` to JSON bytes identical to ``json.dumps(model_dump())``."""
+
+    frontier = "" if response.frontier is None else f', "frontier": {_frontier(response.frontier)}'
+    debug = "" if response.debug is None else f', "debug": {json.dumps(response.debug)}'
+    return (
+        f'{{"params": {json.dumps(response.params)}, "plans": {_plans(response.plans)}, '
+        f'"alternates": {_plans(response.alternates)}, "optimal": {"true" if response.optimal else "false"}, '
+        f'"cut_short": {"true" if response.cut_short else "false"}{frontier}{debug}}}'
+    ).encode("ascii")
+
+
+__all__ = ["dump_plan_response", "quoted_date"]
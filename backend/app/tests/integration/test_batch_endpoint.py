@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from backend.app.api import routes_batch
+from backend.app.api.routes_batch import compute_plans_batch
+from backend.app.api.routes_plan import PlanRequest, PreferenceInput, build_plan_response
+from backend.app.core.executor import ProcessExecutor
+
+
+def make_request(pto_total: int, blocks_max: int, reserve: int = 0, region: str = "ON") -> PlanRequest:
+    return PlanRequest(
+        year=2026,
+        country="CA",
+        region=region,
+        timezone="America/Toronto",
+        pto_total=pto_total,
+        blocks_max=blocks_max,
+        weekend=["SAT", "SUN"],
+        goal="max_total",
+        prefs=PreferenceInput(reserve_pto=reserve),
+    )
+
+
+def test_batch_streams_results_in_order_with_per_request_errors() -> None:
+    requests = [
+        make_request(10, 2),
+        make_request(5, 1, reserve=8),
+        make_request(15, 3, region="BC"),
+        make_request(10, 2),
+        make_request(20, 4),
+    ]
+
+    async def collect():
+        return [result async for result in compute_plans_batch(requests, chunk_size=2)]
+
+    results = asyncio.run(collect())
+    assert [result.index for result in results] == list(range(len(requests)))
+    assert results[1].response is None
+    assert results[1].error["error"]["code"] == "INVALID_INPUT"
+    for index in (0, 2, 3, 4):
+        expected = build_plan_response(requests[index]).model_dump()
+        assert results[index].error is None
+        assert results[index].response.model_dump() == expected
+
+
+def test_batch_candidate_failure_only_fails_its_group(monkeypatch: pytest.MonkeyPatch) -> None:
+    get_day_grid = routes_batch.get_day_grid
+
+    def failing_grid(calendar):
+        if calendar.region and calendar.region.endswith("BC"):
+            raise ValueError("calendar unavailable")
+        return get_day_grid(calendar)
+
+    monkeypatch.setattr(routes_batch, "get_day_grid", failing_grid)
+    requests = [make_request(10, 2), make_request(13, 2, region="BC"), make_request(7, 1, region="BC")]
+
+    async def collect():
+        return [result async for result in compute_plans_batch(requests)]
+
+    results = asyncio.run(collect())
+    assert results[0].response.model_dump() == build_plan_response(requests[0]).model_dump()
+    for result in results[1:]:
+        assert result.response is None
+        assert result.error["error"]["message"] == "calendar unavailable"
+
+
+def test_batch_chunk_timeout_scales_with_its_jobs(monkeypatch: pytest.MonkeyPatch) -> None:
+    timeouts = []
+
+    class RecordingExecutor(ProcessExecutor):
+        async def run(self, fn, *args, timeout=None):
+            timeouts.append(timeout)
+            return await super().run(fn, *args)
+
+    monkeypatch.setattr(routes_batch, "plan_executor", lambda: RecordingExecutor(timeout=1.5))
+    requests = [make_request(pto, 2, region="NS") for pto in (4, 6, 11)]
+
+    async def collect():
+        return [result async for result in compute_plans_batch(requests, chunk_size=2)]
+
+    results = asyncio.run(collect())
+    assert all(result.error is None for result in results)
+    assert sorted(timeouts) == [1.5, 3.0]
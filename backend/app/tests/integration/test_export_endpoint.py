@@ -0,0 +1,38 @@
+from datetime import date, datetime, timezone
+
+from backend.app.api.routes_export import ExportRequest, export_ics
+from backend.app.domain.models import PlanBlock
+
+
+def make_block(start: date, end: date) -> PlanBlock:
+    return PlanBlock(start=start, end=end, days_off=(end - start).days + 1, pto=[start], explain="Block")
+
+
+def test_feed_mode_is_deterministic_and_conditional() -> None:
+    version = datetime(2025, 3, 1, 12, 30, tzinfo=timezone.utc)
+    blocks = [make_block(date(2025, 5, 16), date(2025, 5, 19)), make_block(date(2025, 8, 1), date(2025, 8, 5))]
+    request = ExportRequest(timezone="America/Toronto", title="Feed", blocks=blocks, version=version)
+
+    first = export_ics(request)
+    second = export_ics(request)
+    body = b"".join(first)
+    assert body == b"".join(second)
+    assert b"DTSTAMP:20250301T123000Z" in body
+    assert first.headers["ETag"] == second.headers["ETag"]
+
+    cached = export_ics(
+        ExportRequest(
+            timezone="America/Toronto",
+            title="Feed",
+            blocks=blocks,
+            version=version,
+            if_none_match=f'W/{first.headers["ETag"]}, "other"',
+        )
+    )
+    assert cached.status_code == 304
+    assert b"".join(cached) == b""
+
+    changed = export_ics(ExportRequest(timezone="America/Toronto", title="Feed", blocks=blocks[:1], version=version))
+    assert changed.headers["ETag"] != first.headers["ETag"]
+    uid_lines = [line for line in body.split(b"\r\n") if line.startswith(b"UID:")]
+    assert uid_lines[0] in b"".join(changed)
@@ -0,0 +1,18 @@
+import json
+
+from backend.app.api.routes_holidays import holiday_payload, list_holidays
+
+
+def test_list_holidays_serves_stored_payload_with_etag() -> None:
+    response = list_holidays(2025, "ca", "on", timezone="America/Toronto")
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"].startswith("public, max-age=")
+    body = json.loads(response.content)
+    assert body["region"] == "CA-ON"
+    assert {"date": "2025-07-01", "name": "Canada Day", "observed": True} in body["holidays"]
+    assert holiday_payload(2025, "CA", "CA-ON", "America/Toronto").body is response.content
+
+    etag = response.headers["ETag"]
+    revalidated = list_holidays(2025, "CA", "ON", timezone="America/Toronto", if_none_match=etag)
+    assert revalidated.status_code == 304 and revalidated.content == b""
+    assert list_holidays(2025, "CA", "BC", if_none_match=etag).status_code == 200
@@ -1,6 +1,13 @@
 import asyncio
+import json
+from dataclasses import replace
 
-from backend.app.api.routes_plan import ConstraintInput, PlanRequest, PreferenceInput, compute_plan
+import pytest
+
+from backend.app.api import routes_plan
+from backend.app.api.routes_plan import ConstraintInput, PlanRequest, PreferenceInput, compute_plan, plan_cache_key
+from backend.app.core.metrics import metrics
+from backend.app.services.plan_json import dump_plan_response
 
 
 def test_compute_plan_returns_blocks() -> None:
@@ -20,3 +27,232 @@ def test_compute_plan_returns_blocks() -> None:
     assert "plans" in response.model_dump()
     if response.plans:
         assert response.plans[0].blocks
+
+
+def test_equivalent_requests_share_cached_response() -> None:
+    def make(region: str, months: list[int], timezone: str) -> PlanRequest:
+        return PlanRequest(
+            year=2025,
+            country="CA",
+            region=region,
+            timezone=timezone,
+            pto_total=10,
+            blocks_max=2,
+            weekend=["SUN", "SAT"],
+            goal="max_total",
+            prefs=PreferenceInput(prefer_months=months),
+            constraints=ConstraintInput(blackouts=["2025-03-10..2025-03-12", "2025-03-01..2025-03-09"]),
+        )
+
+    first = make("ON", [8, 7], "America/Toronto")
+    second = make("CA-ON", [7, 8, 7], "UTC")
+    assert plan_cache_key(first) == plan_cache_key(second)
+
+    async def scenario():
+        return await asyncio.gather(compute_plan(first), compute_plan(second))
+
+    one, two = asyncio.run(scenario())
+    assert one.plans == two.plans and one.plans is not two.plans
+    # Changing one caller's response leaves the shared computation and the cache intact.
+    one.plans[0].blocks[0].pto.clear()
+    one.plans.clear()
+    three = asyncio.run(compute_plan(first))
+    assert three.plans == two.plans and three.plans[0].blocks[0].pto
+    assert two.params["timezone"] == "UTC"
+    assert two.params["prefs"]["prefer_months"] == [7, 8, 7]
+
+
+def test_rolling_horizon_plans_across_new_year() -> None:
+    request = PlanRequest(
+        year=2025,
+        country="US",
+        region="NY",
+        timezone="America/New_York",
+        pto_total=8,
+        blocks_max=1,
+        weekend=["SAT", "SUN"],
+        goal="max_longest",
+        start_date="2025-12-01",
+        end_date="2026-01-31",
+    )
+    response = asyncio.run(compute_plan(request))
+    blocks = [block for plan in [*response.plans, *response.alternates] for block in plan.blocks]
+    assert any(block.start.year == 2025 and block.end.year == 2026 for block in blocks)
+    assert response.params["start_date"] == "2025-12-01"
+
+
+def test_debug_block_server_timing_and_metrics() -> None:
+    request = PlanRequest(
+        year=2024,
+        country="GB",
+        region="ENG",
+        timezone="Europe/London",
+        pto_total=9,
+        blocks_max=2,
+        weekend=["SAT", "SUN"],
+        goal="max_total",
+        debug=True,
+    )
+    before = metrics.snapshot().get("plan.stage.cache_seconds", {}).get("count", 0)
+    first = asyncio.run(compute_plan(request))
+    second = asyncio.run(compute_plan(request))
+
+    assert {"holidays", "calendar", "candidates", "selection"} <= set(first.debug["stages_ms"])
+    assert first.debug["counters"]["plan_cache_hits"] == 0
+    assert first.debug["counters"]["states_created"] >= first.debug["counters"]["states_pruned"] > 0
+    assert second.debug["counters"] == {"plan_cache_hits": 1}
+    assert "selection;dur=" in first.headers()["Server-Timing"]
+    assert json.loads(first.render_json()) == first.model_dump()
+    assert metrics.snapshot()["plan.stage.cache_seconds"]["count"] == before + 2
+
+    plain = asyncio.run(compute_plan(replace(request, debug=False)))
+    assert "debug" not in plain.model_dump()
+    assert plain.headers()["Server-Timing"].startswith("cache;dur=")
+
+
+def test_horizon_requests_ignore_year() -> None:
+    def make(year: int | None) -> PlanRequest:
+        return PlanRequest(
+            year=year,
+            country="US",
+            region="NY",
+            timezone="America/New_York",
+            pto_total=5,
+            blocks_max=1,
+            weekend=["SAT", "SUN"],
+            goal="max_total",
+            start_date="2026-10-01",
+            end_date="2027-03-31",
+        )
+
+    assert plan_cache_key(make(None)) == plan_cache_key(make(2026)) == plan_cache_key(make(2031))
+    assert asyncio.run(compute_plan(make(None))).plans
+    with pytest.raises(ValueError, match="year is required"):
+        replace(make(None), start_date=None, end_date=None)
+
+
+@pytest.mark.parametrize(
+    ("start_date", "end_date"),
+    [("1899-12-01", "1900-01-31"), ("2100-12-01", "2101-01-31")],
+)
+def test_horizon_outside_supported_years_is_rejected(start_date: str, end_date: str) -> None:
+    with pytest.raises(ValueError, match="horizon out of supported range"):
+        PlanRequest(
+            year=2000,
+            country="US",
+            region="NY",
+            timezone="America/New_York",
+            pto_total=5,
+            blocks_max=1,
+            weekend=["SAT", "SUN"],
+            goal="max_total",
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+
+def test_debug_counters_for_cold_and_coalesced_requests() -> None:
+    request = PlanRequest(
+        year=2033,
+        country="AU",
+        region="VIC",
+        timezone="Australia/Melbourne",
+        pto_total=7,
+        blocks_max=2,
+        weekend=["SAT", "SUN"],
+        goal="max_longest",
+        debug=True,
+    )
+
+    async def scenario():
+        return await asyncio.gather(compute_plan(request), compute_plan(request))
+
+    leader, follower = asyncio.run(scenario())
+    assert leader.debug["counters"]["holiday_cache_hits"] == 0
+    assert leader.debug["counters"]["states_created"] > 0
+    assert follower.debug["counters"] == {"plan_cache_hits": 0}
+    assert "selection" not in follower.debug["stages_ms"]
+
+
+def test_time_budget_shares_cache_key_and_reports_cut_short() -> None:
+    request = PlanRequest(
+        year=2024,
+        country="AU",
+        region="NSW",
+        timezone="Australia/Sydney",
+        pto_total=12,
+        blocks_max=3,
+        weekend=["SAT", "SUN"],
+        goal="max_total",
+    )
+    budgeted = replace(request, time_budget_ms=60_000)
+    assert plan_cache_key(request) == plan_cache_key(budgeted)
+    response = asyncio.run(compute_plan(budgeted))
+    assert response.model_dump()["cut_short"] is False
+    assert response.params["time_budget_ms"] == 60_000
+
+
+def test_frontier_mode_returns_budget_steps() -> None:
+    request = PlanRequest(
+        year=2025,
+        country="CA",
+        region="ON",
+        timezone="America/Toronto",
+        pto_total=10,
+        blocks_max=2,
+        weekend=["SAT", "SUN"],
+        goal="max_total",
+        frontier=True,
+    )
+    response = asyncio.run(compute_plan(request))
+    budgets = [step.budget for step in response.frontier]
+    assert budgets == sorted(set(budgets)) and budgets[-1] <= 10
+    assert response.frontier[-1].plan.score == response.plans[0].score
+    assert all(step.plan.pto_used <= step.budget for step in response.frontier)
+    assert json.loads(response.render_json()) == response.model_dump()
+    assert plan_cache_key(request) != plan_cache_key(replace(request, frontier=False))
+
+
+@pytest.mark.parametrize("overrides", [{"strategy": "beam"}, {"time_budget_ms": 50}])
+def test_frontier_rejects_inexact_search(overrides: dict) -> None:
+    with pytest.raises(ValueError, match="frontier requires the exact strategy"):
+        PlanRequest(
+            year=2025,
+            country="CA",
+            region="ON",
+            timezone="America/Toronto",
+            pto_total=10,
+            blocks_max=2,
+            weekend=["SAT", "SUN"],
+            goal="max_total",
+            frontier=True,
+            **overrides,
+        )
+
+
+def test_response_body_is_encoded_once_and_reused(monkeypatch: pytest.MonkeyPatch) -> None:
+    renders = []
+
+    def counting_dump(response):
+        renders.append(response.params["timezone"])
+        return dump_plan_response(response)
+
+    monkeypatch.setattr(routes_plan, "dump_plan_response", counting_dump)
+    request = PlanRequest(
+        year=2029,
+        country="US",
+        region="TX",
+        timezone="America/Chicago",
+        pto_total=6,
+        blocks_max=2,
+        weekend=["SAT", "SUN"],
+        goal="max_total",
+    )
+    cold = asyncio.run(compute_plan(request))
+    warm = asyncio.run(compute_plan(request))
+    moved = asyncio.run(compute_plan(replace(request, timezone="America/Denver")))
+
+    assert renders == ["America/Chicago", "America/Denver"]
+    assert "serialize;dur=" in cold.headers()["Server-Timing"]
+    assert warm.render_json() == cold.render_json() == json.dumps(cold.model_dump()).encode()
+    assert json.loads(moved.render_json())["params"]["timezone"] == "America/Denver"
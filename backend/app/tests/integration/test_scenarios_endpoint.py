@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from backend.app.api import routes_batch
+from backend.app.api.routes_plan import ConstraintInput, PlanRequest, PreferenceInput, build_plan_response
+from backend.app.api.routes_scenarios import ScenarioOverride, ScenarioRequest, compare_scenarios
+
+
+def test_scenarios_are_compared_side_by_side() -> None:
+    base = PlanRequest(
+        year=2025,
+        country="US",
+        region="CA",
+        timezone="America/Los_Angeles",
+        pto_total=12,
+        blocks_max=3,
+        weekend=["SAT", "SUN"],
+        goal="max_total",
+    )
+    overrides = [
+        ScenarioOverride("longest", goal="max_longest"),
+        ScenarioOverride("summer", prefs=PreferenceInput(season_spread=True, prefer_months=[6, 7, 8])),
+        ScenarioOverride("no-december", constraints=ConstraintInput(blackouts=["2025-12-01..2025-12-31"])),
+        ScenarioOverride("broken", goal="max_fun"),
+    ]
+    comparison = asyncio.run(compare_scenarios(ScenarioRequest(base=base, scenarios=overrides)))
+
+    assert [column.name for column in comparison.scenarios] == ["base", "longest", "summer", "no-december", "broken"]
+    broken = comparison.scenarios[-1]
+    assert broken.response is None and broken.error["error"]["code"] == "INVALID_INPUT"
+    for column, override in zip(comparison.scenarios[1:4], overrides):
+        expected = build_plan_response(override.apply(base)).model_dump()
+        assert column.response.model_dump() == expected
+        assert column.summary()["score"] == expected["plans"][0]["score"]
+    dumped = comparison.model_dump()
+    assert dumped["scenarios"][1]["overrides"] == {"goal": "max_longest"}
+    assert dumped["base"]["goal"] == "max_total"
+
+
+def test_candidate_failure_only_fails_its_scenario(monkeypatch: pytest.MonkeyPatch) -> None:
+    generate_candidates = routes_batch.generate_candidates
+
+    def failing_candidates(grid, config):
+        if config.constraints.min_block_len == 21:
+            raise ValueError("no windows for these constraints")
+        return generate_candidates(grid, config)
+
+    monkeypatch.setattr(routes_batch, "generate_candidates", failing_candidates)
+    base = PlanRequest(
+        year=2027,
+        country="GB",
+        region="ENG",
+        timezone="Europe/London",
+        pto_total=9,
+        blocks_max=2,
+        weekend=["SAT", "SUN"],
+        goal="max_total",
+    )
+    overrides = [
+        ScenarioOverride("long-blocks", constraints=ConstraintInput(min_block_len=21)),
+        ScenarioOverride("longest", goal="max_longest"),
+    ]
+    comparison = asyncio.run(compare_scenarios(ScenarioRequest(base=base, scenarios=overrides)))
+
+    base_column, failed, longest = comparison.scenarios
+    assert failed.response is None and failed.summary() is None
+    assert failed.error["error"]["message"] == "no windows for these constraints"
+    assert base_column.response.model_dump() == build_plan_response(base).model_dump()
+    assert longest.response.model_dump() == build_plan_response(overrides[1].apply(base)).model_dump()
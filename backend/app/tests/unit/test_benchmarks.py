@@ -0,0 +1,25 @@
+from backend.benchmarks.cases import all_cases, blackout_ranges
+from backend.benchmarks.runner import compare, load_baseline, main, save_baseline
+
+
+def test_compare_flags_only_slowdowns_beyond_threshold_and_delta() -> None:
+    baseline = {"fast": 1e-3, "jitter": 1e-7, "steady": 1e-3}
+    results = {"fast": 1.5e-3, "jitter": 1e-6, "steady": 1.1e-3, "new": 5e-3}
+    flagged = {c.name: c.regressed for c in compare(results, baseline, threshold=0.25, min_delta=5e-6)}
+    assert flagged == {"fast": True, "jitter": False, "steady": False, "new": False}
+
+
+def test_runner_saves_and_checks_a_baseline(tmp_path) -> None:
+    path = tmp_path / "baseline.json"
+    assert main(["-k", "calendar/CA-ON/2024", "--repeat", "1", "--baseline", str(path), "--save"]) == 0
+    recorded = load_baseline(path)
+    assert list(recorded) == ["calendar/CA-ON/2024"]
+    save_baseline(path, {"calendar/CA-ON/2024": recorded["calendar/CA-ON/2024"] / 100})
+    assert main(["-k", "calendar/CA-ON/2024", "--repeat", "1", "--baseline", str(path)]) == 1
+
+
+def test_case_names_are_unique_and_blackouts_stay_in_year() -> None:
+    names = [case.name for case in all_cases()]
+    assert len(names) == len(set(names))
+    ranges = blackout_ranges(2025, 16)
+    assert len(ranges) == 16 and all(start.year == end.year == 2025 for start, end in ranges)
@@ -0,0 +1,69 @@
+import asyncio
+
+from backend.app.core.cache import LRUCache, SingleFlight
+
+
+def test_weighted_lru_evicts_by_total_weight() -> None:
+    cache: LRUCache[str, bytes] = LRUCache(10, weigher=len)
+    cache.put("a", b"1234")
+    cache.put("b", b"1234")
+    assert cache.get("a") == b"1234"
+    cache.put("c", b"1234")
+    assert "b" not in cache and "a" in cache and "c" in cache
+    cache.put("huge", b"x" * 11)
+    assert "huge" not in cache
+    stats = cache.stats()
+    assert stats.weight == 8 and stats.evictions == 1
+
+
+def test_single_flight_shares_one_computation() -> None:
+    flights: SingleFlight[str, int] = SingleFlight()
+    calls = 0
+
+    async def work() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    async def scenario() -> list[int]:
+        return await asyncio.gather(*(flights.run("key", work) for _ in range(5)))
+
+    assert asyncio.run(scenario()) == [42] * 5
+    assert calls == 1
+    assert flights.coalesced == 4
+    assert len(flights) == 0
+
+
+def test_single_flight_cancels_work_once_every_waiter_leaves() -> None:
+    flights: SingleFlight[str, int] = SingleFlight()
+    started = 0
+    cancelled = 0
+
+    async def work() -> int:
+        nonlocal started, cancelled
+        started += 1
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+        return 42
+
+    async def quick() -> int:
+        return 7
+
+    async def scenario() -> int:
+        first = asyncio.ensure_future(flights.run("key", work))
+        second = asyncio.ensure_future(flights.run("key", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        await asyncio.sleep(0.01)
+        assert cancelled == 0 and len(flights) == 1
+        second.cancel()
+        await asyncio.sleep(0.01)
+        assert len(flights) == 0
+        return await flights.run("key", quick)
+
+    assert asyncio.run(scenario()) == 7
+    assert started == 1 and cancelled == 1
@@ -2,7 +2,16 @@ from datetime import date
 
 import pytest
 
-from backend.app.domain.calendar_builder import CalendarConfig, build_calendar
+from backend.app.domain.calendar_builder import (
+    CalendarConfig,
+    DayGrid,
+    build_calendar,
+    build_day_grid,
+    get_day_grid,
+    parse_prewarm_spec,
+    prewarm_calendars,
+)
+from backend.app.domain.holiday_provider import invalidate_holidays
 from backend.app.domain.models import DayType
 
 
@@ -21,3 +30,52 @@ def test_calendar_marks_holidays(country: str, region: str) -> None:
             # Observed holiday should create at least one workday replacement
             observed = [d for d in calendar if d.day == holiday.day and d.kind == DayType.HOLIDAY]
             assert observed
+
+
+def test_day_grid_prefix_counts_match_calendar() -> None:
+    config = CalendarConfig(year=2024, weekend_days=(5, 6), country="CA", region="CA-ON")
+    grid = build_day_grid(config)
+    calendar = build_calendar(config)
+    assert len(grid) == 366
+    assert grid.to_days() == calendar
+    assert DayGrid.from_days(calendar) == grid
+    first, last = grid.offset(date(2024, 12, 20)), grid.offset(date(2024, 12, 31))
+    window = calendar[first : last + 1]
+    assert grid.workdays_between(first, last) == sum(day.kind == DayType.WORKDAY for day in window)
+    assert grid.holidays_between(first, last) == 2
+    assert grid.weekends_between(first, last) == 4
+
+
+def test_day_grid_store_shares_canonical_grids() -> None:
+    first = get_day_grid(CalendarConfig(year=2025, weekend_days=[6, 5, 5], country="GB", region="GB-SCT"))
+    second = get_day_grid(CalendarConfig(year=2025, weekend_days=(5, 6), country="GB", region="GB-SCT"))
+    assert first is second
+    invalidate_holidays(country="GB")
+    assert get_day_grid(CalendarConfig(year=2025, weekend_days=(5, 6), country="GB", region="GB-SCT")) is not first
+
+
+def test_parse_prewarm_spec() -> None:
+    configs = parse_prewarm_spec("ca-on:2025, US:2025-2026")
+    assert [(c.country, c.region, c.year) for c in configs] == [
+        ("CA", "CA-ON", 2025),
+        ("US", None, 2025),
+        ("US", None, 2026),
+    ]
+    assert prewarm_calendars(configs) == 3
+
+
+def test_horizon_grid_spans_year_boundary() -> None:
+    horizon = CalendarConfig.for_range(date(2025, 11, 15), date(2026, 2, 10), (5, 6), "CA", "CA-ON")
+    grid = get_day_grid(horizon)
+    assert grid.start == date(2025, 11, 15) and grid.end == date(2026, 2, 10)
+
+    by_day = {info.day: info for info in grid.to_days()}
+    for year in (2025, 2026):
+        for info in build_calendar(CalendarConfig(year=year, weekend_days=(5, 6), country="CA", region="CA-ON")):
+            if info.day in by_day:
+                assert by_day[info.day] == info
+    assert by_day[date(2025, 12, 25)].kind == DayType.HOLIDAY
+    assert by_day[date(2026, 1, 1)].kind == DayType.HOLIDAY
+
+    whole_year = CalendarConfig.for_range(date(2026, 1, 1), date(2026, 12, 31), (6, 5), "CA", "CA-ON")
+    assert get_day_grid(whole_year) is get_day_grid(CalendarConfig(2026, (5, 6), "CA", "CA-ON"))
@@ -1,7 +1,14 @@
 from datetime import date
 
-from backend.app.domain.calendar_builder import CalendarConfig, build_calendar
-from backend.app.domain.candidates import CandidateConfig, CandidateConstraints, generate_candidates
+from backend.app.domain.calendar_builder import CalendarConfig, build_calendar, get_day_grid
+from backend.app.domain.candidates import (
+    BlackoutIndex,
+    CandidateConfig,
+    CandidateConstraints,
+    cached_windows,
+    generate_candidates,
+)
+from backend.app.domain.models import CompactWindow
 
 
 def test_generate_candidates_bridges_between_holidays() -> None:
@@ -15,3 +22,68 @@ def test_generate_candidates_bridges_between_holidays() -> None:
     assert july_candidates, "expected window covering July 4th"
     for candidate in july_candidates:
         assert candidate.pto_needed < candidate.off_streak
+
+
+def test_blackout_index_merges_and_bisects() -> None:
+    ranges = (
+        (date(2024, 3, 10), date(2024, 3, 12)),
+        (date(2024, 1, 1), date(2024, 1, 5)),
+        (date(2024, 1, 6), date(2024, 1, 8)),
+        (date(2023, 6, 1), date(2023, 6, 30)),
+        (date(2024, 3, 11), date(2024, 3, 20)),
+    )
+    index = BlackoutIndex.build(ranges)
+    assert index.ranges() == (
+        (date(2023, 6, 1), date(2023, 6, 30)),
+        (date(2024, 1, 1), date(2024, 1, 8)),
+        (date(2024, 3, 10), date(2024, 3, 20)),
+    )
+    assert index.overlaps(date(2024, 1, 8), date(2024, 1, 9))
+    assert index.overlaps(date(2024, 3, 1), date(2024, 4, 1))
+    assert not index.overlaps(date(2024, 1, 9), date(2024, 3, 9))
+    assert not index.overlaps(date(2024, 3, 21), date(2024, 12, 31))
+
+    constraints = CandidateConstraints(blackout_ranges=ranges, min_block_len=None, max_block_len=None)
+    in_year = constraints.within(date(2024, 1, 1), date(2024, 12, 31))
+    assert len(in_year.blackout_index) == 2
+    for start, end in [(date(2024, 1, 7), date(2024, 1, 10)), (date(2024, 2, 1), date(2024, 2, 9))]:
+        assert in_year.allows_range(start, end) == constraints.allows_range(start, end)
+
+
+def test_cached_windows_are_shared_and_filtered_per_request() -> None:
+    grid = get_day_grid(CalendarConfig(year=2024, weekend_days=(5, 6), country="CA", region="CA-ON"))
+    assert cached_windows(grid) is cached_windows(grid)
+
+    constraints = CandidateConstraints(
+        blackout_ranges=((date(2024, 7, 1), date(2024, 7, 31)),),
+        min_block_len=5,
+        max_block_len=None,
+    )
+    filtered = generate_candidates(grid, CandidateConfig(constraints=constraints))
+    from_days = generate_candidates(grid.to_days(), CandidateConfig(constraints=constraints))
+    assert filtered == from_days
+    assert filtered == [w for w in cached_windows(grid) if constraints.allows_range(w.start, w.end)]
+    assert all(w.off_streak >= 5 and not (w.start <= date(2024, 7, 31) and w.end >= date(2024, 7, 1)) for w in filtered)
+
+
+def test_compact_windows_round_trip_to_dates() -> None:
+    grid = get_day_grid(CalendarConfig(year=2024, weekend_days=(5, 6), country="US", region="US-NY"))
+    for window in cached_windows(grid):
+        dated = window.to_window()
+        assert CompactWindow.from_window(dated) == window
+        assert len(dated.workdays) == window.pto_needed == window.workday_mask.bit_count()
+        assert len(dated.workdays) + len(dated.holidays) + len(dated.weekends) == window.off_streak
+        assert (window.workday_mask | window.holiday_mask | window.weekend_mask) == (1 << window.off_streak) - 1
+
+
+def test_quarter_bits_distinguish_years_on_a_horizon() -> None:
+    grid = get_day_grid(CalendarConfig.for_range(date(2025, 1, 1), date(2026, 6, 30), (5, 6), "CA", "CA-ON"))
+    constraints = CandidateConstraints(blackout_ranges=tuple(), min_block_len=None, max_block_len=None)
+    candidates = generate_candidates(grid, CandidateConfig(constraints=constraints))
+    first_quarters = {candidate.start.year: candidate.quarter for candidate in candidates if candidate.start.month <= 3}
+    assert set(first_quarters) == {2025, 2026}
+    assert first_quarters[2025] != first_quarters[2026]
+    everything = 0
+    for candidate in candidates:
+        everything |= candidate.quarter
+    assert everything.bit_count() == 6
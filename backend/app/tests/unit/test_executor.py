@@ -0,0 +1,60 @@
+import asyncio
+import pickle
+import time
+
+import pytest
+
+from backend.app.api.errors import http_error
+from backend.app.api.routes_plan import PlanRequest, build_plan_response, init_plan_worker
+from backend.app.core.executor import ProcessExecutor
+from backend.app.domain.calendar_builder import (
+    CALENDAR_CACHE_SIZE,
+    CalendarConfig,
+    calendar_store_stats,
+    get_day_grid,
+)
+from backend.app.domain.candidates import CANDIDATE_CACHE_SIZE
+from backend.app.domain.holiday_provider import HOLIDAY_CACHE_SIZE
+
+
+def test_process_executor_runs_pipeline_and_times_out() -> None:
+    request = PlanRequest(
+        year=2025,
+        country="US",
+        region="CA",
+        timezone="America/Los_Angeles",
+        pto_total=12,
+        blocks_max=3,
+        weekend=["SAT", "SUN"],
+        goal="max_total",
+    )
+    executor = ProcessExecutor(max_workers=1, timeout=60)
+
+    async def scenario():
+        response = await executor.run(build_plan_response, request)
+        with pytest.raises(TimeoutError):
+            await executor.run(time.sleep, 1, timeout=0.05)
+        # The sleep still occupies the old pool's worker; new jobs get a fresh pool.
+        assert await executor.run(abs, -3, timeout=5) == 3
+        return response
+
+    try:
+        response = asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+    assert response.model_dump() == build_plan_response(request).model_dump()
+    assert executor.stats()["timeouts"] == 1
+    assert executor.stats()["recycled"] == 1
+
+
+def test_http_errors_pickle_for_worker_round_trips() -> None:
+    error = http_error("INVALID_INPUT", "Bad", "Fix it")
+    restored = pickle.loads(pickle.dumps(error))
+    assert restored == error
+
+
+def test_init_plan_worker_prewarms_calendars() -> None:
+    init_plan_worker(HOLIDAY_CACHE_SIZE, None, CALENDAR_CACHE_SIZE, CANDIDATE_CACHE_SIZE, "NZ:2031")
+    hits = calendar_store_stats().hits
+    get_day_grid(CalendarConfig(year=2031, weekend_days=(5, 6), country="NZ", region=None))
+    assert calendar_store_stats().hits == hits + 1
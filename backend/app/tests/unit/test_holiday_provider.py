@@ -0,0 +1,66 @@
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from backend.app.core.cache import LRUCache
+from backend.app.domain.holiday_provider import (
+    FALLBACK_HOLIDAYS,
+    fallback_source,
+    get_holidays,
+    holiday_cache_stats,
+    invalidate_holidays,
+    use_holiday_snapshot,
+)
+from backend.app.domain.holiday_snapshot import HolidaySnapshot, SnapshotHolidays, compile_snapshot
+
+
+def test_get_holidays_is_cached_and_read_only() -> None:
+    invalidate_holidays()
+    before = holiday_cache_stats()
+    first = get_holidays("CA", "CA-ON", 2024)
+    second = get_holidays("CA", "CA-ON", 2024)
+    after = holiday_cache_stats()
+    assert first is second
+    assert first[date(2024, 7, 1)] == "Canada Day"
+    assert after.misses == before.misses + 1
+    assert after.hits == before.hits + 1
+    with pytest.raises(TypeError):
+        first[date(2024, 7, 2)] = "Not a holiday"  # type: ignore[index]
+
+    assert invalidate_holidays(country="CA") == 1
+    assert get_holidays("CA", "CA-ON", 2024) is not first
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    cache: LRUCache[str, int] = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (2, 1, 1, 2)
+
+
+def test_snapshot_round_trip_serves_get_holidays(tmp_path: Path) -> None:
+    path = tmp_path / "holidays.bin"
+    count = compile_snapshot(path, range(2024, 2025), [fallback_source])
+    assert count == 4
+
+    snapshot = HolidaySnapshot(path)
+    view = snapshot.lookup("GB", "GB-ENG", 2024)
+    assert view is not None
+    assert dict(view.items()) == FALLBACK_HOLIDAYS[("GB", "GB-ENG", 2024)]
+    assert view.get(date(2024, 4, 1)) == "Easter Monday"
+    assert date(2024, 4, 2) not in view
+    assert snapshot.lookup("GB", "GB-ENG", 2030) is None
+
+    try:
+        use_holiday_snapshot(path)
+        holidays = get_holidays("AU", "AU-NSW", 2024)
+        assert isinstance(holidays, SnapshotHolidays)
+        assert sorted(holidays) == sorted(FALLBACK_HOLIDAYS[("AU", "AU-NSW", 2024)])
+    finally:
+        use_holiday_snapshot(None)
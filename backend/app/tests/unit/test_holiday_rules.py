@@ -0,0 +1,41 @@
+from datetime import date
+
+import pytest
+
+from backend.app.domain.holiday_rules import compute_holidays, easter_sunday
+
+
+@pytest.mark.parametrize(
+    "year,expected",
+    [(2019, date(2019, 4, 21)), (2024, date(2024, 3, 31)), (2025, date(2025, 4, 20)), (2038, date(2038, 4, 25))],
+)
+def test_easter_sunday(year: int, expected: date) -> None:
+    assert easter_sunday(year) == expected
+
+
+def test_rule_engine_matches_fallback_for_2024() -> None:
+    ontario = compute_holidays("CA", "CA-ON", 2024)
+    assert ontario is not None
+    assert ontario[date(2024, 2, 19)] == "Family Day"
+    assert ontario[date(2024, 5, 20)] == "Victoria Day"
+    assert ontario[date(2024, 10, 14)] == "Thanksgiving"
+
+
+def test_weekend_holidays_get_observed_days() -> None:
+    england = compute_holidays("GB", "GB-ENG", 2021)
+    assert england is not None
+    assert england[date(2021, 12, 27)] == "Christmas Day (observed)"
+    assert england[date(2021, 12, 28)] == "Boxing Day (observed)"
+
+    federal = compute_holidays("US", None, 2021)
+    assert federal is not None
+    assert federal[date(2021, 7, 5)] == "Independence Day (observed)"
+    assert federal[date(2021, 12, 24)] == "Christmas Day (observed)"
+    assert federal[date(2021, 12, 31)] == "New Year's Day (observed)"
+
+
+def test_unknown_locales_are_left_to_other_sources() -> None:
+    assert compute_holidays("FR", None, 2024) is None
+    assert compute_holidays("CA", "CA-XX", 2024) is None
+    nsw = compute_holidays("AU", "AU-NSW", 2030)
+    assert nsw is not None and date(2030, 4, 25) in nsw
@@ -1,7 +1,7 @@
-from datetime import date
+from datetime import date, datetime, timedelta, timezone
 
 from backend.app.domain.models import PlanBlock
-from backend.app.services.ics_export import build_ics_document
+from backend.app.services.ics_export import block_uid, build_ics_document, fold_line, iter_ics_document
 
 
 def test_build_ics_document_contains_summary() -> None:
@@ -16,3 +16,41 @@ def test_build_ics_document_contains_summary() -> None:
     )
     payload = build_ics_document("Test", "America/Toronto", [block])
     assert b"SUMMARY:OOO \xe2\x80\x94 Break" in payload
+
+
+def test_iter_ics_document_streams_folded_chunks() -> None:
+    blocks = [
+        PlanBlock(
+            start=date(2024, 7, 1) + timedelta(days=offset),
+            end=date(2024, 7, 20) + timedelta(days=offset),
+            days_off=20,
+            pto=[date(2024, 7, 2) + timedelta(days=day) for day in range(14)],
+            explain="Long block",
+        )
+        for offset in range(40)
+    ]
+    chunks = list(iter_ics_document("Team — summer", "Europe/London", blocks, chunk_size=1024))
+    assert len(chunks) > 1
+    payload = b"".join(chunks)
+    assert payload.count(b"BEGIN:VEVENT") == 40
+    assert payload.endswith(b"END:VCALENDAR\r\n")
+    lines = payload.split(b"\r\n")
+    assert all(len(line) <= 75 for line in lines)
+    assert any(line.startswith(b" ") for line in lines)
+    assert len({line for line in lines if line.startswith(b"DTSTAMP:")}) == 1
+    unfolded = payload.replace(b"\r\n ", b"")
+    assert b"DESCRIPTION:PTO days:\\n2024-07-02\\n2024-07-03" in unfolded
+    assert fold_line("X" * 74 + "—").count(b"\r\n ") == 1
+    assert fold_line("X" * 74 + "—").replace(b"\r\n ", b"").decode("utf-8") == "X" * 74 + "—\r\n"
+
+
+def test_feed_gives_repeated_blocks_distinct_uids() -> None:
+    block = PlanBlock(start=date(2024, 8, 5), end=date(2024, 8, 11), days_off=7, pto=[date(2024, 8, 5)])
+    other = PlanBlock(start=date(2024, 9, 2), end=date(2024, 9, 8), days_off=7, pto=[date(2024, 9, 3)])
+    payload = b"".join(
+        iter_ics_document("Feed", "UTC", [block, other, block], version=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    )
+    uids = [line for line in payload.replace(b"\r\n ", b"").split(b"\r\n") if line.startswith(b"UID:")]
+    assert len(set(uids)) == 3
+    assert uids[0] == f"UID:{block_uid(block)}".encode()
+    assert uids[2] == f"UID:{block_uid(block, 1)}".encode()
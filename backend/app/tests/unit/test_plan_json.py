@@ -0,0 +1,38 @@
+import json
+from datetime import date
+
+from backend.app.api.routes_plan import PlanRequest, PlanResponse, build_plan_response
+from backend.app.domain.models import Plan, PlanBlock
+
+
+def test_render_json_matches_json_dumps_byte_for_byte() -> None:
+    request = PlanRequest(
+        year=2025,
+        country="GB",
+        region="ENG",
+        timezone="Europe/London",
+        pto_total=20,
+        blocks_max=4,
+        weekend=["SAT", "SUN"],
+        goal="max_total",
+        start_date="2025-10-01",
+        end_date="2026-09-30",
+    )
+    response = build_plan_response(request)
+    assert response.plans
+    assert response.render_json() == json.dumps(response.model_dump()).encode()
+
+    block = PlanBlock(
+        start=date(2030, 12, 30),
+        end=date(2031, 1, 2),
+        days_off=4,
+        pto=[date(2030, 12, 30), date(2031, 1, 2)],
+        explain='Zürich "trip" \\ — ok',
+    )
+    edge = PlanResponse(
+        params={"title": "Café", "months": [1, 2]},
+        plans=[Plan(score=0, pto_used=0, blocks=[block]), Plan(score=1e-7, pto_used=2, blocks=[])],
+        alternates=[],
+        optimal=False,
+    )
+    assert edge.render_json() == json.dumps(edge.model_dump()).encode()
@@ -1,8 +1,15 @@
+import time
+from dataclasses import replace
 from datetime import date
+from itertools import combinations
 
+import pytest
+
+from backend.app.domain.calendar_builder import CalendarConfig, build_calendar
+from backend.app.domain.candidates import CandidateConfig, CandidateConstraints, generate_candidates
 from backend.app.domain.models import CandidateWindow
-from backend.app.domain.scoring import Goal, PlanPreference, PreferenceConfig
-from backend.app.domain.selection import SelectionConfig, select_plans
+from backend.app.domain.scoring import Goal, PlanPreference, PreferenceConfig, plan_score, score_candidate
+from backend.app.domain.selection import PlanState, SelectionConfig, SelectionStrategy, search_plans, select_plans
 
 
 def window(start_day: int, end_day: int, pto: int, off: int) -> CandidateWindow:
@@ -39,3 +46,154 @@ def test_select_plans_enforces_non_overlap() -> None:
         for first, second in zip(plan.windows, plan.windows[1:]):
             assert first.end < second.start
         assert plan.pto_used <= 5
+
+
+def brute_force_plans(candidates: list[CandidateWindow], config: SelectionConfig) -> list[tuple]:
+    ordered = sorted(candidates, key=lambda c: (c.end, c.start))
+    results = []
+    for size in range(1, config.blocks_max + 1):
+        for combo in combinations(ordered, size):
+            if any(first.end >= second.start for first, second in zip(combo, combo[1:])):
+                continue
+            pto_used = sum(window.pto_needed for window in combo)
+            if pto_used > config.budget:
+                continue
+            base_scores = [score_candidate(window, config.prefs) for window in combo]
+            score = plan_score(combo, config.plan_prefs, base_scores)
+            off = sum(window.off_streak for window in combo)
+            results.append((-score, -off, tuple((w.start, w.end) for w in combo)))
+    results.sort()
+    return [summary for _score, _off, summary in results[: config.top_k]]
+
+
+@pytest.mark.parametrize("goal", [Goal.MAX_TOTAL, Goal.MAX_LONGEST])
+@pytest.mark.parametrize("season_spread", [True, False])
+def test_select_plans_matches_exhaustive_search(goal: Goal, season_spread: bool) -> None:
+    calendar = build_calendar(CalendarConfig(year=2024, weekend_days=(5, 6), country="GB", region="GB-ENG"))
+    constraints = CandidateConstraints(blackout_ranges=tuple(), min_block_len=None, max_block_len=None)
+    candidates = generate_candidates(calendar, CandidateConfig(constraints=constraints))
+    config = SelectionConfig(
+        budget=12,
+        blocks_max=3,
+        top_k=5,
+        prefs=PreferenceConfig(prefer_months=frozenset({5}), avoid_months=frozenset({12})),
+        plan_prefs=PlanPreference(goal=goal, season_spread=season_spread),
+    )
+    plans = select_plans(candidates, config)
+    assert [plan.to_summary() for plan in plans] == brute_force_plans(candidates, config)
+
+
+def test_beam_search_reports_optimality() -> None:
+    calendar = build_calendar(CalendarConfig(year=2024, weekend_days=(5, 6), country="CA", region="CA-ON"))
+    constraints = CandidateConstraints(blackout_ranges=tuple(), min_block_len=None, max_block_len=None)
+    candidates = generate_candidates(calendar, CandidateConfig(constraints=constraints))
+    base = dict(
+        budget=25,
+        blocks_max=5,
+        top_k=5,
+        prefs=PreferenceConfig(),
+        plan_prefs=PlanPreference(goal=Goal.MAX_TOTAL, season_spread=True),
+    )
+    exact = search_plans(candidates, SelectionConfig(**base))
+    wide = search_plans(candidates, SelectionConfig(**base, strategy=SelectionStrategy.BEAM, beam_width=100_000))
+    narrow = search_plans(candidates, SelectionConfig(**base, strategy=SelectionStrategy.BEAM, beam_width=2))
+    assert exact.optimal and wide.optimal
+    assert [plan.to_summary() for plan in wide.plans] == [plan.to_summary() for plan in exact.plans]
+    assert not narrow.optimal
+    assert narrow.plans
+    for plan in narrow.plans:
+        assert plan.pto_used <= 25
+        for first, second in zip(plan.windows, plan.windows[1:]):
+            assert first.end < second.start
+
+
+@pytest.mark.parametrize("goal", [Goal.MAX_TOTAL, Goal.MAX_LONGEST])
+def test_plan_state_aggregates_match_plan_score(goal: Goal) -> None:
+    prefs = PlanPreference(goal=goal, season_spread=True)
+    windows = [window(1, 5, 2, 5), window(6, 14, 3, 9), window(20, 24, 1, 5)]
+    base_scores = [score_candidate(item, PreferenceConfig()) for item in windows]
+    state = PlanState.start(windows[0], base_scores[0], prefs)
+    for item, base_score in zip(windows[1:], base_scores[1:]):
+        state = state.extend(item, base_score, prefs)
+    candidate = state.to_candidate()
+    assert candidate.windows == tuple(windows)
+    assert candidate.pto_used == 6
+    assert state.total_off == 19
+    assert state.score == pytest.approx(plan_score(windows, prefs, base_scores))
+
+
+@pytest.mark.parametrize("goal", [Goal.MAX_TOTAL, Goal.MAX_LONGEST])
+def test_time_budget_matches_exact_or_reports_cut_short(goal: Goal) -> None:
+    calendar = build_calendar(CalendarConfig(year=2024, weekend_days=(5, 6), country="CA", region="CA-ON"))
+    constraints = CandidateConstraints(blackout_ranges=tuple(), min_block_len=None, max_block_len=None)
+    candidates = generate_candidates(calendar, CandidateConfig(constraints=constraints))
+    base = dict(
+        budget=15,
+        blocks_max=3,
+        top_k=5,
+        prefs=PreferenceConfig(prefer_months=frozenset({7})),
+        plan_prefs=PlanPreference(goal=goal, season_spread=True),
+    )
+    exact = search_plans(candidates, SelectionConfig(**base))
+    finished = search_plans(candidates, SelectionConfig(**base, time_budget=60.0))
+    assert finished.optimal and not finished.cut_short
+    assert [plan.to_summary() for plan in finished.plans] == [plan.to_summary() for plan in exact.plans]
+
+    for strategy in SelectionStrategy:
+        rushed = search_plans(candidates, SelectionConfig(**base, strategy=strategy, time_budget=0.0))
+        assert rushed.cut_short and not rushed.optimal
+        assert rushed.plans
+        for plan in rushed.plans:
+            assert plan.pto_used <= 15
+
+
+def test_time_budget_is_not_slower_or_worse_than_exact() -> None:
+    calendar = build_calendar(CalendarConfig(year=2025, weekend_days=(5, 6), country="CA", region="CA-ON"))
+    constraints = CandidateConstraints(blackout_ranges=tuple(), min_block_len=None, max_block_len=None)
+    candidates = generate_candidates(calendar, CandidateConfig(constraints=constraints))
+    config = SelectionConfig(
+        budget=30,
+        blocks_max=5,
+        top_k=5,
+        prefs=PreferenceConfig(),
+        plan_prefs=PlanPreference(goal=Goal.MAX_TOTAL, season_spread=True),
+    )
+
+    def timed(config: SelectionConfig):
+        started = time.perf_counter()
+        result = search_plans(candidates, config)
+        return result, time.perf_counter() - started
+
+    search_plans(candidates, config)  # warm the candidate conversion path
+    exact, exact_seconds = timed(config)
+    budgeted, budgeted_seconds = timed(replace(config, time_budget=2.0))
+    assert not budgeted.cut_short and budgeted.optimal
+    assert [plan.score for plan in budgeted.plans] == [plan.score for plan in exact.plans]
+    assert budgeted_seconds <= exact_seconds * 2 + 0.05
+
+
+@pytest.mark.parametrize("goal", [Goal.MAX_TOTAL, Goal.MAX_LONGEST])
+def test_frontier_matches_a_solve_per_budget(goal: Goal) -> None:
+    calendar = build_calendar(CalendarConfig(year=2024, weekend_days=(5, 6), country="US", region="US-CA"))
+    constraints = CandidateConstraints(blackout_ranges=tuple(), min_block_len=None, max_block_len=None)
+    candidates = generate_candidates(calendar, CandidateConfig(constraints=constraints))
+    config = SelectionConfig(
+        budget=12,
+        blocks_max=3,
+        top_k=5,
+        prefs=PreferenceConfig(),
+        plan_prefs=PlanPreference(goal=goal, season_spread=True),
+        frontier=True,
+    )
+    result = search_plans(candidates, config)
+    assert [plan.to_summary() for plan in result.plans] == [
+        plan.to_summary() for plan in select_plans(candidates, replace(config, frontier=False))
+    ]
+    steps = dict(result.frontier)
+    best = None
+    for budget in range(config.budget + 1):
+        best = steps.get(budget, best)
+        expected = select_plans(candidates, replace(config, budget=budget, frontier=False))
+        assert (best.to_summary() if best else None) == (expected[0].to_summary() if expected else None)
+    scores = [plan.score for _budget, plan in result.frontier]
+    assert scores == sorted(scores)
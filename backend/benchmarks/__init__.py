@@ -0,0 +1,5 @@
+"""Microbenchmarks for the planning pipeline.
+
+Run ``python -m backend.benchmarks`` from the repository root to time every case and
+compare it against ``baseline.json``; see ``backend.benchmarks.runner`` for options.
+"""
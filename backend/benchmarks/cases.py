@@ -0,0 +1,212 @@
+"""Benchmark cases covering each stage of the planning pipeline.
+
+Every case names its stage and parameters, and builds its inputs lazily in ``setup``
+so filtering the run down to a few cases skips everyone else's preparation.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from itertools import product
+from typing import Callable, Iterator
+
+from ..app.api.routes_plan import ConstraintInput, PlanRequest, PlanResponse, PreferenceInput, build_plan_response
+from ..app.domain.calendar_builder import CalendarConfig, build_calendar, build_day_grid
+from ..app.domain.candidates import CandidateConfig, CandidateConstraints, clear_candidate_cache, generate_candidates
+from ..app.domain.scoring import Goal, PlanPreference, PreferenceConfig, score_candidate
+from ..app.domain.selection import SelectionConfig, select_plans
+from ..app.services.ics_export import build_ics_document
+
+LOCALES: tuple[tuple[str, str], ...] = (("CA", "CA-ON"), ("US", "US-CA"), ("GB", "GB-ENG"), ("AU", "AU-NSW"))
+YEARS = (2024, 2025)
+BUDGETS = (0, 5, 10, 20, 30, 40)
+BLOCKS_MAX = (1, 2, 3, 4, 5)
+BLACKOUT_COUNTS = (0, 4, 16)
+WEEKEND = (5, 6)
+# Locale, year and sizes the single-axis sweeps hold fixed.
+REFERENCE_LOCALE = ("CA", "CA-ON")
+REFERENCE_YEAR = 2025
+REFERENCE_BUDGET = 20
+REFERENCE_BLOCKS = 3
+
+
+@dataclass(frozen=True)
+class PreferenceSet:
+    name: str
+    window: PreferenceConfig
+    plan: PlanPreference
+
+
+PREFERENCE_SETS: tuple[PreferenceSet, ...] = (
+    PreferenceSet("neutral", PreferenceConfig(), PlanPreference(goal=Goal.MAX_TOTAL, season_spread=False)),
+    PreferenceSet(
+        "summer-spread",
+        PreferenceConfig(prefer_months=frozenset({6, 7, 8}), avoid_months=frozenset({12})),
+        PlanPreference(goal=Goal.MAX_TOTAL, season_spread=True),
+    ),
+    PreferenceSet("longest", PreferenceConfig(), PlanPreference(goal=Goal.MAX_LONGEST, season_spread=False)),
+)
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    """One timed operation: ``setup()`` returns the zero-argument callable to time."""
+
+    name: str
+    setup: Callable[[], Callable[[], object]]
+
+
+def calendar_config(locale: tuple[str, str], year: int) -> CalendarConfig:
+    country, region = locale
+    return CalendarConfig(year=year, weekend_days=WEEKEND, country=country, region=region)
+
+
+def blackout_ranges(year: int, count: int) -> tuple[tuple[date, date], ...]:
+    """Return ``count`` five-day blackouts spread evenly over ``year``."""
+
+    if not count:
+        return ()
+    step = 360 // count
+    first = date(year, 1, 3)
+    return tuple(
+        (first + timedelta(days=index * step), first + timedelta(days=index * step + 4)) for index in range(count)
+    )
+
+
+def constraints_for(year: int, blackouts: int) -> CandidateConstraints:
+    return CandidateConstraints(blackout_ranges=blackout_ranges(year, blackouts), min_block_len=None, max_block_len=None)
+
+
+def _candidates(locale: tuple[str, str], year: int, blackouts: int = 0) -> list:
+    grid = build_day_grid(calendar_config(locale, year))
+    return generate_candidates(grid, CandidateConfig(constraints=constraints_for(year, blackouts)))
+
+
+def _plan_request(budget: int, blocks_max: int) -> PlanRequest:
+    country, region = REFERENCE_LOCALE
+    return PlanRequest(
+        year=REFERENCE_YEAR,
+        country=country,
+        region=region,
+        timezone="America/Toronto",
+        pto_total=budget,
+        blocks_max=blocks_max,
+        weekend=["SAT", "SUN"],
+        goal=Goal.MAX_TOTAL.value,
+        prefs=PreferenceInput(season_spread=True),
+        constraints=ConstraintInput(),
+    )
+
+
+def calendar_cases() -> Iterator[BenchCase]:
+    for locale, year in product(LOCALES, YEARS):
+        config = calendar_config(locale, year)
+        yield BenchCase(f"calendar/{locale[1]}/{year}", lambda config=config: lambda: build_calendar(config))
+
+
+def candidate_cases() -> Iterator[BenchCase]:
+    def setup(locale: tuple[str, str], year: int, blackouts: int) -> Callable[[], object]:
+        grid = build_day_grid(calendar_config(locale, year))
+        config = CandidateConfig(constraints=constraints_for(year, blackouts))
+
+        def run() -> object:
+            # Time a cold enumeration, as for the first request on a calendar.
+            clear_candidate_cache()
+            return generate_candidates(grid, config)
+
+        return run
+
+    for locale, year, blackouts in product(LOCALES, YEARS, BLACKOUT_COUNTS):
+        yield BenchCase(
+            f"candidates/{locale[1]}/{year}/blackouts={blackouts}",
+            lambda locale=locale, year=year, blackouts=blackouts: setup(locale, year, blackouts),
+        )
+
+
+def scoring_cases() -> Iterator[BenchCase]:
+    def setup(prefs: PreferenceConfig) -> Callable[[], object]:
+        candidates = _candidates(REFERENCE_LOCALE, REFERENCE_YEAR)
+        return lambda: [score_candidate(window, prefs) for window in candidates]
+
+    for prefs in PREFERENCE_SETS:
+        yield BenchCase(f"scoring/prefs={prefs.name}", lambda prefs=prefs: setup(prefs.window))
+
+
+def _selection(
+    locale: tuple[str, str],
+    year: int,
+    budget: int,
+    blocks_max: int,
+    prefs: PreferenceSet,
+    blackouts: int = 0,
+) -> Callable[[], object]:
+    candidates = _candidates(locale, year, blackouts)
+    config = SelectionConfig(
+        budget=budget,
+        blocks_max=blocks_max,
+        top_k=5,
+        prefs=prefs.window,
+        plan_prefs=prefs.plan,
+    )
+    return lambda: select_plans(candidates, config)
+
+
+def selection_cases() -> Iterator[BenchCase]:
+    for budget, blocks_max, prefs in product(BUDGETS, BLOCKS_MAX, PREFERENCE_SETS):
+        yield BenchCase(
+            f"select/budget={budget}/blocks={blocks_max}/prefs={prefs.name}",
+            lambda budget=budget, blocks_max=blocks_max, prefs=prefs: _selection(
+                REFERENCE_LOCALE, REFERENCE_YEAR, budget, blocks_max, prefs
+            ),
+        )
+    neutral = PREFERENCE_SETS[0]
+    for locale, year in product(LOCALES, YEARS):
+        yield BenchCase(
+            f"select/{locale[1]}/{year}",
+            lambda locale=locale, year=year: _selection(locale, year, REFERENCE_BUDGET, REFERENCE_BLOCKS, neutral),
+        )
+    for blackouts in BLACKOUT_COUNTS[1:]:
+        yield BenchCase(
+            f"select/blackouts={blackouts}",
+            lambda blackouts=blackouts: _selection(
+                REFERENCE_LOCALE, REFERENCE_YEAR, REFERENCE_BUDGET, REFERENCE_BLOCKS, neutral, blackouts
+            ),
+        )
+
+
+def response_cases() -> Iterator[BenchCase]:
+    def setup(budget: int, blocks_max: int, render: Callable[[PlanResponse], object]) -> Callable[[], object]:
+        response = build_plan_response(_plan_request(budget, blocks_max))
+        return lambda: render(response)
+
+    for budget, blocks_max in ((10, 2), (REFERENCE_BUDGET, REFERENCE_BLOCKS), (40, 5)):
+        for label, render in (("model_dump", PlanResponse.model_dump), ("render_json", PlanResponse.render_json)):
+            yield BenchCase(
+                f"response/{label}/budget={budget}/blocks={blocks_max}",
+                lambda budget=budget, blocks_max=blocks_max, render=render: setup(budget, blocks_max, render),
+            )
+
+
+def ics_cases() -> Iterator[BenchCase]:
+    def setup(events: int) -> Callable[[], object]:
+        response = build_plan_response(_plan_request(40, 5))
+        blocks = [block for plan in [*response.plans, *response.alternates] for block in plan.blocks]
+        blocks = (blocks * (events // len(blocks) + 1))[:events]
+        return lambda: build_ics_document("Time off", "America/Toronto", blocks)
+
+    for events in (5, 25, 500):
+        yield BenchCase(f"ics/events={events}", lambda events=events: setup(events))
+
+
+def all_cases() -> list[BenchCase]:
+    return [
+        *calendar_cases(),
+        *candidate_cases(),
+        *scoring_cases(),
+        *selection_cases(),
+        *response_cases(),
+        *ics_cases(),
+    ]
+
+
+__all__ = ["BenchCase", "PREFERENCE_SETS", "all_cases", "blackout_ranges"]
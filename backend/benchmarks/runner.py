@@ -0,0 +1,161 @@
+"""Time the benchmark cases and compare them against a stored baseline.
+
+Usage (from the repository root)::
+
+    python -m backend.benchmarks                  # compare against baseline.json
+    python -m backend.benchmarks --save           # record a new baseline
+    python -m backend.benchmarks -k select/ --threshold 0.1
+
+Each case reports the best per-call time over ``--repeat`` samples, which is the
+least noisy estimate on a shared machine. A case regresses when it is more than
+``--threshold`` (a fraction) slower than its baseline and slower by at least
+``--min-delta`` seconds, so sub-microsecond jitter never fails a run. The exit
+status is 1 if any case regressed. Baselines are machine specific: record one on
+the machine that runs the comparison.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Mapping, Sequence
+
+from .cases import BenchCase, all_cases
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MIN_DELTA = 5e-6
+DEFAULT_REPEAT = 5
+# Each sample loops the case until it has run for at least this long.
+SAMPLE_SECONDS = 0.02
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    seconds: float
+    baseline: float | None
+    regressed: bool
+
+    @property
+    def ratio(self) -> float | None:
+        if not self.baseline:
+            return None
+        return self.seconds / self.baseline
+
+
+def measure(fn: Callable[[], object], repeat: int = DEFAULT_REPEAT, sample_seconds: float = SAMPLE_SECONDS) -> float:
+    """Return the best per-call time of ``fn`` in seconds over ``repeat`` samples."""
+
+    fn()  # warm caches and lazily built tables outside the timed samples
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - started
+        if elapsed >= sample_seconds:
+            break
+        number *= 2
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - started) / number)
+    return best
+
+
+def run_cases(cases: Sequence[BenchCase], repeat: int = DEFAULT_REPEAT) -> dict[str, float]:
+    return {case.name: measure(case.setup(), repeat) for case in cases}
+
+
+def compare(
+    results: Mapping[str, float],
+    baseline: Mapping[str, float],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_delta: float = DEFAULT_MIN_DELTA,
+) -> list[Comparison]:
+    """Compare timings against a baseline; cases missing from it never regress."""
+
+    comparisons = []
+    for name, seconds in results.items():
+        previous = baseline.get(name)
+        regressed = (
+            previous is not None and seconds > previous * (1 + threshold) and seconds - previous >= min_delta
+        )
+        comparisons.append(Comparison(name, seconds, previous, regressed))
+    return comparisons
+
+
+def load_baseline(path: Path) -> dict[str, float]:
+    if not path.exists():
+        return {}
+    return dict(json.loads(path.read_text())["cases"])
+
+
+def save_baseline(path: Path, results: Mapping[str, float]) -> None:
+    """Merge ``results`` into the baseline at ``path``, keeping unmeasured cases."""
+
+    cases = {**load_baseline(path), **results}
+    payload = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cases": {name: round(cases[name], 9) for name in sorted(cases)},
+    }
+    path.write_text(json.dumps(payload, indent=2) + "\n")
+
+
+def _format(comparison: Comparison) -> str:
+    current = f"{comparison.seconds * 1e3:10.3f} ms"
+    if comparison.baseline is None:
+        return f"{comparison.name:<52} {current}   (new)"
+    flag = "  REGRESSED" if comparison.regressed else ""
+    return f"{comparison.name:<52} {current}  x{comparison.ratio:5.2f} of {comparison.baseline * 1e3:.3f} ms{flag}"
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m backend.benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("-k", "--filter", action="append", default=[], help="only run cases containing this text")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed slowdown fraction")
+    parser.add_argument("--min-delta", type=float, default=DEFAULT_MIN_DELTA, help="ignore slowdowns below (s)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--list", action="store_true", help="list case names and exit")
+    args = parser.parse_args(argv)
+
+    cases = [case for case in all_cases() if not args.filter or any(text in case.name for text in args.filter)]
+    if args.list:
+        print("\n".join(case.name for case in cases))
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    results: dict[str, float] = {}
+    comparisons: list[Comparison] = []
+    for case in cases:
+        results[case.name] = measure(case.setup(), args.repeat)
+        comparison = compare({case.name: results[case.name]}, baseline, args.threshold, args.min_delta)[0]
+        comparisons.append(comparison)
+        print(_format(comparison), flush=True)
+
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(f"saved {len(results)} cases to {args.baseline}")
+        return 0
+    regressions = [comparison for comparison in comparisons if comparison.regressed]
+    if regressions:
+        print(f"{len(regressions)} of {len(comparisons)} cases regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+__all__ = ["Comparison", "compare", "load_baseline", "main", "measure", "run_cases", "save_baseline"]
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -40,6 +40,12 @@ export interface PlanRequestPayload {
   goal: 'max_total' | 'max_longest';
   prefs: Record<string, unknown>;
   constraints: Record<string, unknown>;
+  start_date?: string;
+  end_date?: string;
+  time_budget_ms?: number;
+  /** Exact strategy only; cannot be combined with time_budget_ms. */
+  frontier?: boolean;
+  debug?: boolean;
 }
 
 export async function fetchHolidays(params: {
@@ -22,13 +22,28 @@ export const planSchema = z.object({
   blocks: z.array(planBlockSchema),
 });
 
+export const frontierStepSchema = z.object({
+  budget: z.number(),
+  plan: planSchema,
+});
+
 export const planResponseSchema = z.object({
   params: z.record(z.any()),
   plans: z.array(planSchema),
   alternates: z.array(planSchema),
+  optimal: z.boolean().optional(),
+  cut_short: z.boolean().optional(),
+  frontier: z.array(frontierStepSchema).optional(),
+  debug: z
+    .object({
+      stages_ms: z.record(z.number()),
+      counters: z.record(z.number()),
+    })
+    .optional(),
 });
 
 export type Holiday = z.infer<typeof holidaySchema>;
 export type PlanBlock = z.infer<typeof planBlockSchema>;
 export type Plan = z.infer<typeof planSchema>;
+export type FrontierStep = z.infer<typeof frontierStepSchema>;
 export type PlanResponse = z.infer<typeof planResponseSchema>;
@@ -0,0 +1,11 @@
+import type { FrontierStep, Plan } from '../api/types';
+
+/** Best plan for a PTO budget, read from a frontier response without another request. */
+export function planForBudget(frontier: FrontierStep[], budget: number): Plan | undefined {
+  let best: Plan | undefined;
+  for (const step of frontier) {
+    if (step.budget > budget) break;
+    best = step.plan;
+  }
+  return best;
+}